@@ -29,6 +29,7 @@ import requests
 
 from neutronclient._i18n import _
 from neutronclient.common import exceptions
+from neutronclient.common import token_cache
 from neutronclient.common import utils
 
 osprofiler_web = importutils.try_import("osprofiler.web")
@@ -37,6 +38,8 @@ _logger = logging.getLogger(__name__)
 
 if os.environ.get('NEUTRONCLIENT_DEBUG'):
     ch = logging.StreamHandler()
+    if os.environ.get('NEUTRONCLIENT_DEBUG_ASYNC'):
+        ch = utils.AsyncLogHandler(ch)
     _logger.setLevel(logging.DEBUG)
     _logger.addHandler(ch)
     _requests_log_level = logging.DEBUG
@@ -45,6 +48,11 @@ else:
 
 logging.getLogger("requests").setLevel(_requests_log_level)
 MAX_URI_LEN = 8192
+# Defaults for the connection pool kept by the legacy HTTPClient. These match
+# the requests library defaults so that behaviour only changes when a caller
+# explicitly asks for a bigger pool.
+DEFAULT_POOL_CONNECTIONS = requests.adapters.DEFAULT_POOLSIZE
+DEFAULT_POOL_MAXSIZE = requests.adapters.DEFAULT_POOLSIZE
 USER_AGENT = 'python-neutronclient'
 REQ_ID_HEADER = 'X-OpenStack-Request-ID'
 
@@ -66,7 +74,8 @@ class HTTPClient(object):
                  endpoint_type='publicURL',
                  auth_strategy='keystone', ca_cert=None, log_credentials=False,
                  service_type='network', global_request_id=None,
-                 **kwargs):
+                 pool_connections=None, pool_maxsize=None, pool_block=False,
+                 keep_alive=True, token_cache=None, **kwargs):
 
         self.username = username
         self.user_id = user_id
@@ -89,6 +98,36 @@ class HTTPClient(object):
             self.verify_cert = False
         else:
             self.verify_cert = ca_cert if ca_cert else True
+        self.keep_alive = keep_alive
+        # Optional neutronclient.common.token_cache.TokenCache reused by the
+        # keystone authentication.
+        self.token_cache = token_cache
+        self.session = self._make_session(pool_connections, pool_maxsize,
+                                          pool_block)
+
+    @staticmethod
+    def _make_session(pool_connections, pool_maxsize, pool_block):
+        """Create a requests session backed by a persistent connection pool.
+
+        :param pool_connections: number of per-host connection pools to cache.
+        :param pool_maxsize: maximum number of connections kept open to a
+                             single host.
+        :param pool_block: whether to block when the pool to a host is
+                           exhausted instead of opening a throwaway
+                           connection.
+        """
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections or DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize or DEFAULT_POOL_MAXSIZE,
+            pool_block=pool_block)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def close(self):
+        """Close all pooled connections held by this client."""
+        self.session.close()
 
     def _cs_request(self, *args, **kwargs):
         kargs = {}
@@ -98,12 +137,15 @@ class HTTPClient(object):
         if 'body' in kwargs:
             kargs['body'] = kwargs['body']
 
-        if self.log_credentials:
-            log_kargs = kargs
-        else:
-            log_kargs = self._strip_credentials(kargs)
+        if kwargs.get('stream'):
+            kargs['stream'] = True
 
-        utils.http_log_req(_logger, args, log_kargs)
+        if utils.http_log_enabled(_logger):
+            if self.log_credentials:
+                log_kargs = kargs
+            else:
+                log_kargs = self._strip_credentials(kargs)
+            utils.http_log_req(_logger, args, log_kargs)
         try:
             resp, body = self.request(*args, **kargs)
         except requests.exceptions.SSLError as e:
@@ -158,13 +200,16 @@ class HTTPClient(object):
         if self.global_request_id:
             headers.setdefault(REQ_ID_HEADER, self.global_request_id)
 
+        if not self.keep_alive:
+            headers.setdefault('Connection', 'close')
+
         headers['User-Agent'] = USER_AGENT
         # NOTE(dbelova): osprofiler_web.get_trace_id_headers does not add any
         # headers in case if osprofiler is not initialized.
         if osprofiler_web:
             headers.update(osprofiler_web.get_trace_id_headers())
 
-        resp = requests.request(
+        resp = self.session.request(
             method,
             url,
             data=body,
@@ -173,7 +218,10 @@ class HTTPClient(object):
             timeout=self.timeout,
             **kwargs)
 
-        return resp, resp.text
+        if kwargs.get('stream'):
+            # The caller reads the body itself, don't load it here.
+            return resp, None
+        return resp, utils.response_text(resp)
 
     def _check_uri_length(self, action):
         uri_len = len(self.endpoint_url) + len(action)
@@ -198,6 +246,11 @@ class HTTPClient(object):
                                           **kwargs)
             return resp, body
         except exceptions.Unauthorized:
+            if (self.token_cache is not None and
+                    self.auth_strategy == 'keystone'):
+                # The cached token may have been revoked, get a new one.
+                self.token_cache.delete(self._token_cache_key(),
+                                        auth_token=self.auth_token)
             self.authenticate()
             kwargs['headers'] = kwargs.get('headers') or {}
             kwargs['headers']['X-Auth-Token'] = self.auth_token
@@ -219,7 +272,29 @@ class HTTPClient(object):
                 service_type=self.service_type,
                 interface=self.endpoint_type)
 
+    def _token_cache_key(self):
+        return token_cache.cache_key(
+            auth_url=self.auth_url, username=self.username,
+            user_id=self.user_id, project_name=self.project_name,
+            project_id=self.project_id, region_name=self.region_name,
+            password=self.password)
+
     def _authenticate_keystone(self):
+        if self.token_cache is None:
+            self._request_token()
+            return
+        key = self._token_cache_key()
+        with self.token_cache.lock(key):
+            auth_state = self.token_cache.get(key)
+            if auth_state is None:
+                self._request_token()
+                self.token_cache.set(key, json.dumps(
+                    {'auth_token': self.auth_token,
+                     'body': self.auth_ref._data}))
+            else:
+                self._extract_service_catalog(json.loads(auth_state)['body'])
+
+    def _request_token(self):
         if self.user_id:
             creds = {'userId': self.user_id,
                      'password': self.password}
@@ -329,7 +404,10 @@ class SessionClient(adapter.Adapter):
 
         kwargs['headers'] = headers
         resp = super(SessionClient, self).request(*args, **kwargs)
-        return resp, resp.text
+        if kwargs.get('stream'):
+            # The caller reads the body itself, don't load it here.
+            return resp, None
+        return resp, utils.response_text(resp)
 
     def _check_uri_length(self, url):
         uri_len = len(self.endpoint_url) + len(url)
@@ -405,9 +483,17 @@ def construct_http_client(username=None,
                           service_type='network',
                           session=None,
                           global_request_id=None,
+                          pool_connections=None,
+                          pool_maxsize=None,
+                          pool_block=False,
+                          keep_alive=True,
+                          token_cache=None,
                           **kwargs):
 
     if session:
+        # NOTE: A keystoneauth session already owns a pooled requests
+        # session, so the connection pool options only apply to the legacy
+        # HTTPClient below.
         kwargs.setdefault('user_agent', USER_AGENT)
         kwargs.setdefault('interface', endpoint_type)
         return SessionClient(session=session,
@@ -435,4 +521,9 @@ def construct_http_client(username=None,
                           ca_cert=ca_cert,
                           log_credentials=log_credentials,
                           auth_strategy=auth_strategy,
-                          global_request_id=global_request_id)
+                          global_request_id=global_request_id,
+                          pool_connections=pool_connections,
+                          pool_maxsize=pool_maxsize,
+                          pool_block=pool_block,
+                          keep_alive=keep_alive,
+                          token_cache=token_cache)
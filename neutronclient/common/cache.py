@@ -0,0 +1,106 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+import threading
+import time
+
+
+class LRUCache(object):
+    """Thread safe in-memory cache with LRU eviction and expiry.
+
+    :param integer maxsize: Maximum number of entries kept. The least
+                            recently used entry is evicted first. None
+                            does not limit the number of entries.
+    :param ttl: Seconds an entry stays valid. None keeps entries until
+                they are evicted or invalidated.
+    :param integer maxbytes: Maximum total size of the entries, as given
+                             to ``set``. Entries are evicted until the
+                             cache fits. None does not limit the size.
+    """
+
+    def __init__(self, maxsize, ttl=None, timer=time.time, maxbytes=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._timer = timer
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                expires, value, size = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            if expires is not None and expires <= self._timer():
+                self.nbytes -= size
+                self.misses += 1
+                return default
+            # Re-insert to mark the entry as the most recently used.
+            self._data[key] = (expires, value, size)
+            self.hits += 1
+            return value
+
+    def _pop(self, key):
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[2]
+
+    def _is_full(self):
+        return ((self.maxsize is not None and
+                 len(self._data) > self.maxsize) or
+                (self.maxbytes is not None and self.nbytes > self.maxbytes))
+
+    def set(self, key, value, size=0):
+        """Remember ``value`` under ``key``.
+
+        :param integer size: Size of the value, e.g. in bytes, counted
+                             against ``maxbytes``. A value larger than
+                             ``maxbytes`` is not kept.
+        """
+        expires = None
+        if self.ttl is not None:
+            expires = self._timer() + self.ttl
+        with self._lock:
+            self._pop(key)
+            if self.maxbytes is not None and size > self.maxbytes:
+                return
+            self._data[key] = (expires, value, size)
+            self.nbytes += size
+            while self._is_full():
+                _key, (_expires, _value, evicted) = self._data.popitem(
+                    last=False)
+                self.nbytes -= evicted
+
+    def invalidate(self, key=None):
+        """Drop ``key``, or every entry if no key is given."""
+        with self._lock:
+            if key is None:
+                self._data.clear()
+                self.nbytes = 0
+            else:
+                self._pop(key)
+
+    def stats(self):
+        stats = {'hits': self.hits, 'misses': self.misses,
+                 'size': len(self._data), 'maxsize': self.maxsize}
+        if self.maxbytes is not None:
+            stats.update(bytes=self.nbytes, maxbytes=self.maxbytes)
+        return stats
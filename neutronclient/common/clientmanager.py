@@ -69,6 +69,7 @@ class ClientManager(object):
                  raise_errors=True,
                  session=None,
                  auth=None,
+                 metrics=None,
                  ):
         self._token = token
         self._url = url
@@ -93,6 +94,7 @@ class ClientManager(object):
         self._raise_errors = raise_errors
         self._session = session
         self._auth = auth
+        self._metrics = metrics
         return
 
     def initialize(self):
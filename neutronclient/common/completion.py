@@ -0,0 +1,108 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""On-disk index of the commands and options of the neutron CLI.
+
+Building the index requires importing every command and building its
+argument parser, which takes seconds. The index is therefore saved under
+CACHE_DIR and reused as long as the version of the client and the
+installed extensions do not change.
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from neutronclient.version import __version__
+
+
+LOG = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.neutronclient')
+EXTENSION_NAMESPACE = 'neutronclient.extension'
+_FILE_PREFIX = 'completion-'
+
+
+def cache_key(api_version):
+    """Return a key identifying the commands available to the CLI.
+
+    It changes with the version of the client and with the extension
+    entry points installed, none of which is imported.
+    """
+    # Imported here as it takes long and only bash-completion needs it.
+    import pkg_resources
+
+    parts = [__version__, api_version]
+    parts.extend(sorted(str(ep) for ep in
+                        pkg_resources.iter_entry_points(EXTENSION_NAMESPACE)))
+    return hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()
+
+
+def cache_path(key, cache_dir=None):
+    return os.path.join(cache_dir or CACHE_DIR,
+                        '%s%s.json' % (_FILE_PREFIX, key))
+
+
+def load_index(path):
+    """Return the index saved at path, or None if it is not usable."""
+    try:
+        with open(path) as f:
+            index = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+    if not isinstance(index, dict) or 'commands' not in index:
+        return None
+    return index
+
+
+def save_index(path, index):
+    """Atomically write the index, replacing the outdated ones.
+
+    Failures are only logged, completion works without the cache.
+    """
+    cache_dir = os.path.dirname(path)
+    try:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=_FILE_PREFIX,
+                                        suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(index, f)
+        os.rename(tmp_path, path)
+    except (IOError, OSError) as e:
+        LOG.debug("Unable to save the completion index to %s: %s", path, e)
+        return
+    for old_path in glob.glob(os.path.join(cache_dir,
+                                           _FILE_PREFIX + '*.json')):
+        if old_path != path:
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+
+
+def get_index(api_version, build, cache_dir=None):
+    """Return the index of the commands, building it only if needed.
+
+    :param build: callable returning the index when it is not cached, a
+                  dict with the ``options`` of the shell and a
+                  ``commands`` dict from command names to their options.
+    """
+    path = cache_path(cache_key(api_version), cache_dir)
+    index = load_index(path)
+    if index is None:
+        index = build()
+        save_index(path, index)
+    return index
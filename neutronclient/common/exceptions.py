@@ -74,6 +74,8 @@ class NeutronClientException(NeutronException):
     status_code = 0
     req_ids_msg = _("Neutron server returns request_ids: %s")
     request_ids = []
+    # Seconds to wait before retrying, given by the Retry-After header.
+    retry_after = None
 
     def __init__(self, message=None, **kwargs):
         self.request_ids = kwargs.get('request_ids')
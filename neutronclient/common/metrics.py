@@ -0,0 +1,173 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Latency and payload metrics of the requests sent by a client."""
+
+import collections
+import logging
+import re
+import threading
+
+from neutronclient.common import ratelimit
+
+
+LOG = logging.getLogger(__name__)
+
+# Path segments replaced by %s in path templates: UUIDs, with or without
+# dashes, such as resource and project IDs.
+_ID_SEGMENT = re.compile(r'^[0-9a-fA-F]{8}-?([0-9a-fA-F]{4}-?){3}'
+                         r'[0-9a-fA-F]{12}$')
+
+RequestRecord = collections.namedtuple('RequestRecord', [
+    'method',  # HTTP method.
+    'path',  # Template of the path, see path_template().
+    'status',  # HTTP status code, None if no response was received.
+    'latency',  # Seconds until the response was received.
+    'request_bytes',  # Size of the request body.
+    'response_bytes',  # Size of the response body, 0 if unknown.
+    'attempt',  # Number of retries of the request done before this one.
+    'request_id',  # x-openstack-request-id of the response.
+])
+
+
+def path_template(path):
+    """Return a path with its ID segments replaced by ``%s``.
+
+    For example ``/ports/<port ID>`` gives ``/ports/%s``. The query string
+    is dropped.
+    """
+    path = path.split('?', 1)[0]
+    return '/'.join('%s' if _ID_SEGMENT.match(segment) else segment
+                    for segment in path.split('/'))
+
+
+class _EndpointStats(object):
+
+    def __init__(self):
+        self.count = 0
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.max_latency = 0.0
+        self.latency = ratelimit.Histogram()
+
+
+class RequestMetrics(object):
+    """Aggregates the records of the requests of one or more clients.
+
+    Records are aggregated by method, path template and status. Every
+    record is also passed to the callbacks, e.g. to feed another metrics
+    library. Errors raised by the callbacks are logged and ignored.
+
+    :param callbacks: Callables called with every ``RequestRecord``.
+    """
+
+    def __init__(self, callbacks=None):
+        self.callbacks = list(callbacks or [])
+        self._stats = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, record):
+        key = (record.method, record.path, record.status)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _EndpointStats()
+            stats.count += 1
+            if record.attempt:
+                stats.retries += 1
+            stats.request_bytes += record.request_bytes
+            stats.response_bytes += record.response_bytes
+            stats.max_latency = max(stats.max_latency, record.latency)
+        stats.latency.observe(record.latency)
+        for callback in self.callbacks:
+            try:
+                callback(record)
+            except Exception:
+                LOG.exception("Request metrics callback %s failed", callback)
+
+    def stats(self):
+        """Return the aggregates, one dict per method, path and status."""
+        with self._lock:
+            items = list(self._stats.items())
+        result = []
+        for (method, path, status), stats in items:
+            latency = stats.latency.snapshot()
+            result.append({'method': method, 'path': path,
+                           'status': status, 'count': stats.count,
+                           'retries': stats.retries,
+                           'request_bytes': stats.request_bytes,
+                           'response_bytes': stats.response_bytes,
+                           'latency_sum': latency['sum'],
+                           'latency_max': stats.max_latency,
+                           'latency_buckets': latency['buckets']})
+        return result
+
+    def to_prometheus(self, prefix='neutronclient'):
+        """Return the aggregates in the Prometheus text exposition format."""
+        counters = (
+            ('requests_total', 'count', 'Requests sent.'),
+            ('request_retries_total', 'retries', 'Requests retried.'),
+            ('request_bytes_total', 'request_bytes',
+             'Bytes of the request bodies.'),
+            ('response_bytes_total', 'response_bytes',
+             'Bytes of the response bodies.'),
+        )
+        stats = self.stats()
+        lines = []
+        for name, field, help_text in counters:
+            lines.append('# HELP %s_%s %s' % (prefix, name, help_text))
+            lines.append('# TYPE %s_%s counter' % (prefix, name))
+            for item in stats:
+                lines.append('%s_%s{%s} %d' % (prefix, name, _labels(item),
+                                               item[field]))
+        name = '%s_request_duration_seconds' % prefix
+        lines.append('# HELP %s Latency of the requests.' % name)
+        lines.append('# TYPE %s histogram' % name)
+        for item in stats:
+            labels = _labels(item)
+            for bound, count in item['latency_buckets']:
+                lines.append('%s_bucket{%s,le="%s"} %d' % (
+                    name, labels, '+Inf' if bound == float('inf')
+                    else repr(float(bound)), count))
+            lines.append('%s_sum{%s} %r' % (name, labels,
+                                            item['latency_sum']))
+            lines.append('%s_count{%s} %d' % (name, labels, item['count']))
+        return '\n'.join(lines) + '\n'
+
+    def format_summary(self):
+        """Return a table of the aggregates, slowest endpoints first."""
+        stats = sorted(self.stats(), key=lambda item: -item['latency_sum'])
+        lines = ['%-6s %-40s %6s %5s %7s %10s %10s %10s' % (
+            'Method', 'Path', 'Status', 'Count', 'Retries', 'Total (s)',
+            'Max (s)', 'Bytes in')]
+        total = 0.0
+        for item in stats:
+            total += item['latency_sum']
+            lines.append('%-6s %-40s %6s %5d %7d %10.3f %10.3f %10d' % (
+                item['method'], item['path'], item['status'] or '-',
+                item['count'], item['retries'], item['latency_sum'],
+                item['latency_max'], item['response_bytes']))
+        lines.append('Total: %d requests in %.3f seconds' % (
+            sum(item['count'] for item in stats), total))
+        return '\n'.join(lines)
+
+
+def _label_value(value):
+    return (str(value).replace('\\', r'\\').replace('"', r'\"')
+            .replace('\n', r'\n'))
+
+
+def _labels(item):
+    return 'method="%s",path="%s",status="%s"' % (
+        _label_value(item['method']), _label_value(item['path']),
+        _label_value(item['status'] or 'none'))
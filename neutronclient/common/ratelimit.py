@@ -0,0 +1,220 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Limits of the rate and concurrency of the requests of a client."""
+
+import bisect
+import collections
+import contextlib
+import threading
+import time
+
+
+_monotonic = getattr(time, 'monotonic', time.time)
+
+
+class TokenBucket(object):
+    """Thread safe token bucket.
+
+    :param rate: Tokens added per second.
+    :param capacity: Maximum number of tokens. The bucket starts full.
+    """
+
+    def __init__(self, rate, capacity, timer=_monotonic):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = self.capacity
+        self._timer = timer
+        self._last = timer()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self._timer()
+        self.tokens = min(self.capacity,
+                          self.tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def wait_time(self, tokens=1):
+        """Return the seconds until the bucket holds ``tokens``."""
+        with self._lock:
+            self._refill()
+            return max(0.0, (tokens - self.tokens) / self.rate)
+
+    def consume(self, tokens=1):
+        """Take ``tokens`` if the bucket holds them.
+
+        :returns: whether the tokens were taken.
+        """
+        with self._lock:
+            self._refill()
+            if self.tokens < tokens:
+                return False
+            self.tokens -= tokens
+            return True
+
+
+class Histogram(object):
+    """Thread safe histogram of observed values, e.g. durations.
+
+    :param buckets: Sorted upper bounds of the buckets. A last bucket
+                    without bound is added.
+    """
+
+    BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10)
+
+    def __init__(self, buckets=BUCKETS):
+        self.bounds = tuple(buckets)
+        self._counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        with self._lock:
+            self._counts[bisect.bisect_left(self.bounds, value)] += 1
+            self.count += 1
+            self.sum += value
+
+    def snapshot(self):
+        """Return the cumulative counts of the values up to each bound.
+
+        :returns: a dict with the ``buckets``, a list of ``(bound, count)``
+                  tuples ending with ``float('inf')``, the ``count`` and
+                  the ``sum`` of the values.
+        """
+        with self._lock:
+            cumulative = 0
+            buckets = []
+            for bound, count in zip(self.bounds + (float('inf'),),
+                                    self._counts):
+                cumulative += count
+                buckets.append((bound, cumulative))
+            return {'buckets': buckets, 'count': self.count,
+                    'sum': self.sum}
+
+
+class Limiter(object):
+    """Caps the rate and the concurrency of requests.
+
+    Requests exceeding the limits wait in a queue and are let through in
+    their order of arrival. The time spent waiting is recorded in the
+    ``wait`` histogram.
+
+    :param rate: Requests per second. None does not limit the rate.
+    :param burst: Requests allowed in a burst over the rate. (default: 1)
+    :param concurrency: Maximum number of requests in flight. None does
+                        not limit the concurrency.
+    """
+
+    def __init__(self, rate=None, burst=1, concurrency=None,
+                 timer=_monotonic):
+        self.bucket = None
+        if rate is not None:
+            self.bucket = TokenBucket(rate, burst, timer=timer)
+        self.concurrency = concurrency
+        self.in_flight = 0
+        self.wait = Histogram()
+        self._timer = timer
+        self._queue = collections.deque()
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """Wait for the turn of a request to be sent."""
+        start = self._timer()
+        ticket = object()
+        with self._cond:
+            self._queue.append(ticket)
+            try:
+                while True:
+                    if self._queue[0] is not ticket or (
+                            self.concurrency is not None and
+                            self.in_flight >= self.concurrency):
+                        self._cond.wait()
+                        continue
+                    if self.bucket is not None:
+                        delay = self.bucket.wait_time()
+                        if delay > 0 or not self.bucket.consume():
+                            self._cond.wait(delay)
+                            continue
+                    self.in_flight += 1
+                    break
+            finally:
+                self._queue.remove(ticket)
+                self._cond.notify_all()
+        self.wait.observe(self._timer() - start)
+
+    def release(self):
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def stats(self):
+        with self._cond:
+            return {'in_flight': self.in_flight, 'queued': len(self._queue),
+                    'wait': self.wait.snapshot()}
+
+
+class Governor(object):
+    """Limits of the requests of a client, see ``Limiter``.
+
+    The ``rate``, ``burst`` and ``concurrency`` arguments limit all the
+    requests. ``limits`` sets separate limits on a subset of them.
+
+    :param limits: Dict from an HTTP method, e.g. ``PUT``, or a resource
+                   path prefix, e.g. ``/ports``, to the ``Limiter``
+                   arguments limiting the matching requests. They apply
+                   in addition to the limits of all the requests.
+
+    Example::
+
+        governor = ratelimit.Governor(
+            concurrency=20,
+            limits={'PUT': {'rate': 10, 'burst': 5},
+                    '/ports': {'concurrency': 4}})
+    """
+
+    ALL = 'all'
+
+    def __init__(self, rate=None, burst=1, concurrency=None, limits=None):
+        self.limiters = collections.OrderedDict()
+        for key, kwargs in sorted((limits or {}).items()):
+            self.limiters[key] = Limiter(**kwargs)
+        if rate is not None or concurrency is not None:
+            self.limiters[self.ALL] = Limiter(rate=rate, burst=burst,
+                                              concurrency=concurrency)
+
+    def _matching(self, method, path):
+        return [limiter for key, limiter in self.limiters.items()
+                if key in (method, self.ALL) or
+                (key.startswith('/') and path.startswith(key))]
+
+    @contextlib.contextmanager
+    def request(self, method, path):
+        """Hold the turn of a request while it is sent.
+
+        The limits are acquired one after the other, the limits of all the
+        requests last.
+        """
+        acquired = []
+        try:
+            for limiter in self._matching(method, path):
+                limiter.acquire()
+                acquired.append(limiter)
+            yield
+        finally:
+            for limiter in reversed(acquired):
+                limiter.release()
+
+    def stats(self):
+        """Return the ``Limiter.stats`` of every limit by its key."""
+        return dict((key, limiter.stats())
+                    for key, limiter in self.limiters.items())
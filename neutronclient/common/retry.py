@@ -0,0 +1,148 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Policy deciding which failed requests the client retries, and when."""
+
+import collections
+import email.utils
+import random
+import threading
+import time
+
+from keystoneauth1 import exceptions as ksa_exc
+
+from neutronclient.common import exceptions
+from neutronclient.common import ratelimit
+
+
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'PUT', 'DELETE'])
+# Statuses of the error responses retried by default, with the methods of
+# the requests retried. POST requests are never retried since the server
+# may have created the resource before failing.
+RETRY_STATUSES = {
+    409: IDEMPOTENT_METHODS,  # Conflict, e.g. a resource still in use.
+    429: IDEMPOTENT_METHODS,  # Too Many Requests.
+    502: IDEMPOTENT_METHODS,  # Bad Gateway.
+    503: IDEMPOTENT_METHODS,  # Service Unavailable.
+    504: IDEMPOTENT_METHODS,  # Gateway Timeout.
+}
+CONNECTION_ERRORS = (exceptions.ConnectionFailed, ksa_exc.ConnectionError)
+
+# Default retry budget: retries allowed per second and in a burst.
+BUDGET_RATE = 1
+BUDGET_BURST = 10
+
+
+def parse_retry_after(value, timer=time.time):
+    """Return the seconds to wait given by a Retry-After header.
+
+    The header holds either a number of seconds or an HTTP date.
+
+    :returns: the seconds, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    date = email.utils.parsedate_tz(value)
+    if date is None:
+        return None
+    return max(0.0, email.utils.mktime_tz(date) - timer())
+
+
+class RetryPolicy(object):
+    """Decides which failed requests are retried, and when.
+
+    The n-th retry waits a random delay between 0 and
+    ``base_delay * 2 ** (n - 1)`` seconds (exponential backoff with full
+    jitter), so that clients which failed together do not retry together.
+    A Retry-After header sent with the error is honored instead.
+
+    A policy is thread safe and may be shared by several clients, which
+    then share its retry budget and counters.
+
+    :param base_delay: Seconds the first retry waits at most.
+    :param max_delay: Maximum delay of a retry. Errors asking to retry
+                      later than this are not retried.
+    :param statuses: Dict from HTTP status codes to the methods retried
+                     when they fail with it. (default: RETRY_STATUSES)
+    :param budget_rate: Retries per second allowed by the retry budget,
+                        a token bucket which keeps the retries from
+                        piling up on an overloaded server. None disables
+                        the budget. (default: BUDGET_RATE)
+    :param budget_burst: Retries allowed in a burst by the retry budget.
+                         (default: BUDGET_BURST)
+    """
+
+    def __init__(self, base_delay=1, max_delay=60, statuses=None,
+                 budget_rate=BUDGET_RATE, budget_burst=BUDGET_BURST):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.statuses = RETRY_STATUSES if statuses is None else statuses
+        self.budget = None
+        if budget_rate is not None:
+            self.budget = ratelimit.TokenBucket(budget_rate, budget_burst)
+        # Retries by cause: the HTTP status or 'connection'.
+        self.retried = collections.Counter()
+        # Retryable failures raised since the retries were used up.
+        self.gave_up = 0
+        self.budget_exhausted = 0
+        self._lock = threading.Lock()
+
+    def _cause(self, method, error):
+        """Return the cause of a retryable failure, or None."""
+        if isinstance(error, CONNECTION_ERRORS):
+            if method in IDEMPOTENT_METHODS:
+                return 'connection'
+        elif isinstance(error, exceptions.NeutronClientException):
+            if method in self.statuses.get(error.status_code, ()):
+                return error.status_code
+        return None
+
+    def get_delay(self, method, error, attempt, retries):
+        """Return the seconds to wait before retrying a failed request.
+
+        :param method: HTTP method of the request.
+        :param error: exception raised by the request.
+        :param attempt: number of retries already done, 0 after the first
+                        failure.
+        :param retries: maximum number of retries of the request.
+        :returns: the delay, or None if the request is not retried.
+        """
+        cause = self._cause(method, error)
+        if cause is None:
+            return None
+        retry_after = getattr(error, 'retry_after', None)
+        if (attempt >= retries or
+                (retry_after is not None and retry_after > self.max_delay)):
+            with self._lock:
+                self.gave_up += 1
+            return None
+        if self.budget is not None and not self.budget.consume():
+            with self._lock:
+                self.budget_exhausted += 1
+            return None
+        with self._lock:
+            self.retried[cause] += 1
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def stats(self):
+        with self._lock:
+            return {'retried': sum(self.retried.values()),
+                    'retried_by_cause': dict(self.retried),
+                    'gave_up': self.gave_up,
+                    'budget_exhausted': self.budget_exhausted}
@@ -13,6 +13,10 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import codecs
+import json
+import re
+
 from oslo_serialization import jsonutils
 import six
 
@@ -79,6 +83,109 @@ class JSONDeserializer(TextDeserializer):
         return {'body': self._from_json(datastring)}
 
 
+class JSONCollectionStreamDeserializer(object):
+    """Incrementally decodes the members of a collection in a JSON body.
+
+    Neutron list responses are objects such as ``{"ports": [...],
+    "ports_links": [...]}``. Only the array stored under ``collection`` is
+    decoded one element at a time, so the whole document never has to be
+    held in memory. Other top level members (e.g. pagination links) are
+    small; they are decoded whole and made available in ``extra`` once
+    the items have been consumed.
+    """
+
+    _whitespace = re.compile(r'\s*')
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.extra = {}
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._chunks = None
+        self._buf = u''
+        self._pos = 0
+
+    def _malformed(self):
+        msg = _("Cannot understand JSON")
+        return exception.MalformedResponseBody(reason=msg)
+
+    def _read(self):
+        """Append the next chunk to the buffer, False on end of stream."""
+        for chunk in self._chunks:
+            if isinstance(chunk, six.binary_type):
+                chunk = self._text_decoder.decode(chunk)
+            if chunk:
+                # Drop what has already been consumed before growing.
+                self._buf = self._buf[self._pos:] + chunk
+                self._pos = 0
+                return True
+        return False
+
+    def _peek(self):
+        while True:
+            self._pos = self._whitespace.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._read():
+                raise self._malformed()
+
+    def _expect(self, chars):
+        char = self._peek()
+        if char not in chars:
+            raise self._malformed()
+        self._pos += 1
+        return char
+
+    def _decode_value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except ValueError:
+                end = None
+            # A value ending exactly at the end of the buffer (e.g. a
+            # number) may continue in the next chunk.
+            if end is not None and end < len(self._buf):
+                self._pos = end
+                return value
+            if not self._read():
+                if end is None:
+                    raise self._malformed()
+                self._pos = end
+                return value
+
+    def _iter_array(self):
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self._decode_value()
+            if self._expect(',]') == ']':
+                return
+
+    def iter_items(self, chunks):
+        """Yield the members of the collection array one by one.
+
+        :param chunks: iterable of ``bytes`` (UTF-8) or text chunks making
+                       up the response body.
+        """
+        self._chunks = iter(chunks)
+        self._expect('{')
+        if self._peek() == '}':
+            return
+        while True:
+            key = self._decode_value()
+            self._expect(':')
+            if key == self.collection:
+                for item in self._iter_array():
+                    yield item
+            else:
+                self.extra[key] = self._decode_value()
+            if self._expect(',}') == '}':
+                return
+
+
 # NOTE(maru): this class is duplicated from neutron.wsgi
 class Serializer(object):
     """Serializes and deserializes dictionaries to certain MIME types."""
@@ -0,0 +1,164 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""On-disk cache of Keystone tokens shared by the client processes.
+
+An entry holds the authentication state of a user, in the format of the
+keystoneauth ``get_auth_state()`` method: the token and the body of the
+Keystone response, which includes the service catalog and thus the
+endpoint of the Networking service. Entries are only returned until their
+token is about to expire.
+"""
+
+import binascii
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from keystoneauth1 import access
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+LOG = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.neutronclient', 'tokens')
+# Seconds before their expiry after which the tokens are not used anymore.
+STALE_DURATION = 30
+# Attributes of the authentication which are secrets. They only enter the
+# key through a slow salted hash, so that the key does not reveal them.
+SECRET_ATTRIBUTES = ('password', 'token', 'passcode', 'secret',
+                     'application_credential_secret')
+# Iterations of PBKDF2 hashing the secrets.
+SECRET_HASH_ITERATIONS = 10000
+
+
+def cache_key(**attrs):
+    """Return the key of the tokens of a user.
+
+    The attributes identify the user, e.g. the auth URL, the user and
+    project names or IDs and the region, and unset attributes are ignored.
+    The secrets are part of the key as well, so that changed or wrong
+    credentials never get the token obtained with other ones.
+    """
+    parts = ['%s=%s' % (name, value) for name, value in sorted(attrs.items())
+             if value is not None and name not in SECRET_ATTRIBUTES]
+    identity = hashlib.sha256('\n'.join(parts).encode('utf-8')).digest()
+    secrets = ['%s=%s' % (name, value) for name, value in sorted(attrs.items())
+               if value is not None and name in SECRET_ATTRIBUTES]
+    if not secrets:
+        return binascii.hexlify(identity).decode('ascii')
+    # Salted with the identity, the hash of a secret differs between users.
+    secret = hashlib.pbkdf2_hmac('sha256',
+                                 '\n'.join(secrets).encode('utf-8'),
+                                 identity, SECRET_HASH_ITERATIONS)
+    return hashlib.sha256(identity + secret).hexdigest()
+
+
+class TokenCache(object):
+    """Tokens saved in one file per key under a private directory.
+
+    Errors accessing the files are logged and the cache is then ignored,
+    it never prevents authenticating against Keystone.
+
+    :param cache_dir: directory of the files, CACHE_DIR by default.
+    :param stale_duration: seconds before their expiry after which the
+                           tokens are considered expired.
+    """
+
+    def __init__(self, cache_dir=None, stale_duration=STALE_DURATION):
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.stale_duration = stale_duration
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + '.json')
+
+    def _ensure_dir(self):
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, 0o700)
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        """Hold an exclusive file lock on a key.
+
+        Processes authenticating the same user wait for the first one to
+        save its token instead of all asking Keystone for one.
+        """
+        lock_file = None
+        if fcntl is not None:
+            try:
+                self._ensure_dir()
+                lock_file = open(self._path(key) + '.lock', 'a')
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            except (IOError, OSError) as e:
+                LOG.debug("Unable to lock the token cache: %s", e)
+                if lock_file is not None:
+                    lock_file.close()
+                    lock_file = None
+        try:
+            yield
+        finally:
+            if lock_file is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+                lock_file.close()
+
+    def get(self, key):
+        """Return the authentication state saved for a key.
+
+        :returns: the state, or None if there is none or its token is
+                  about to expire.
+        """
+        try:
+            with open(self._path(key)) as f:
+                auth_state = f.read()
+            data = json.loads(auth_state)
+            auth_ref = access.create(body=data['body'],
+                                     auth_token=data['auth_token'])
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            return None
+        if auth_ref.will_expire_soon(self.stale_duration):
+            return None
+        return auth_state
+
+    def set(self, key, auth_state):
+        """Atomically save the authentication state of a key."""
+        try:
+            self._ensure_dir()
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir,
+                                            suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                f.write(auth_state)
+            os.rename(tmp_path, self._path(key))
+        except (IOError, OSError) as e:
+            LOG.debug("Unable to save the token to the cache: %s", e)
+
+    def delete(self, key, auth_token=None):
+        """Forget the state of a key, e.g. after its token was rejected.
+
+        :param auth_token: only forget the state if it has this token, it
+                           may have been replaced by another process.
+        """
+        path = self._path(key)
+        try:
+            if auth_token is not None:
+                with open(path) as f:
+                    if json.load(f).get('auth_token') != auth_token:
+                        return
+            os.remove(path)
+        except (IOError, OSError, ValueError, AttributeError):
+            pass
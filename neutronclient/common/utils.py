@@ -18,14 +18,18 @@
 """Utilities and helper functions."""
 
 import argparse
+import contextlib
 import functools
 import hashlib
 import logging
 import os
+import random
+import threading
 
 from oslo_utils import encodeutils
 from oslo_utils import importutils
 import six
+from six.moves import queue
 
 from neutronclient._i18n import _
 from neutronclient.common import exceptions
@@ -169,39 +173,199 @@ def str2dict_type(optional_keys=None, required_keys=None):
                              required_keys=required_keys)
 
 
-def http_log_req(_logger, args, kwargs):
-    if not _logger.isEnabledFor(logging.DEBUG):
-        return
+def _env_number(name, convert, default):
+    """Return the number set in an environment variable, if valid."""
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return convert(value)
+    except ValueError:
+        logging.getLogger(__name__).warning(
+            "Ignoring the invalid value %(value)r of %(name)s",
+            {'value': value, 'name': name})
+        return default
+
+
+# Maximum number of characters of the request and response bodies logged,
+# None logs them whole.
+HTTP_LOG_BODY_LIMIT = _env_number('NEUTRONCLIENT_DEBUG_BODY_LIMIT', int, None)
+# Probability for a body to be logged, the others are left out.
+HTTP_LOG_BODY_SAMPLE_RATE = _env_number(
+    'NEUTRONCLIENT_DEBUG_BODY_SAMPLE_RATE', float, 1.0)
+
+_http_log_state = threading.local()
+
+
+@contextlib.contextmanager
+def http_log_level(level):
+    """Log the requests sent in the block at ``level`` rather than DEBUG.
+
+    This applies to the current thread only. For example, a single call
+    can be traced in production with::
+
+        with utils.http_log_level(logging.INFO):
+            neutron.update_port(port_id, body)
+    """
+    previous = getattr(_http_log_state, 'level', None)
+    _http_log_state.level = level
+    try:
+        yield
+    finally:
+        _http_log_state.level = previous
+
+
+def _http_log_level():
+    return getattr(_http_log_state, 'level', None) or logging.DEBUG
+
+
+def http_log_enabled(_logger):
+    """Return whether the HTTP requests are logged by ``_logger``."""
+    return _logger.isEnabledFor(_http_log_level())
 
-    string_parts = ['curl -i']
-    for element in args:
-        if element in ('GET', 'POST', 'DELETE', 'PUT'):
-            string_parts.append(' -X %s' % element)
-        else:
-            string_parts.append(' %s' % element)
 
-    for (key, value) in six.iteritems(kwargs['headers']):
-        if key in SENSITIVE_HEADERS:
-            v = value.encode('utf-8')
-            h = hashlib.sha1(v)
-            d = h.hexdigest()
-            value = "{SHA1}%s" % d
-        header = ' -H "%s: %s"' % (key, value)
-        string_parts.append(header)
+@six.python_2_unicode_compatible
+class _LoggedBody(object):
+    """Body rendered when the log record is formatted, maybe truncated."""
 
-    if 'body' in kwargs and kwargs['body']:
-        string_parts.append(" -d '%s'" % (kwargs['body']))
-    req = encodeutils.safe_encode("".join(string_parts))
-    _logger.debug("REQ: %s", req)
+    def __init__(self, body):
+        self.body = body
+
+    @staticmethod
+    def sample():
+        return (HTTP_LOG_BODY_SAMPLE_RATE >= 1 or
+                random.random() < HTTP_LOG_BODY_SAMPLE_RATE)
+
+    def __str__(self):
+        body = self.body
+        if isinstance(body, six.binary_type):
+            body = encodeutils.safe_decode(body, errors='replace')
+        limit = HTTP_LOG_BODY_LIMIT
+        if limit is not None and len(body) > limit:
+            return '%s... (%d more characters)' % (body[:limit],
+                                                   len(body) - limit)
+        return body
+
+
+@six.python_2_unicode_compatible
+class _LoggedRequest(object):
+    """curl command line of a request, built when the record is formatted."""
+
+    def __init__(self, args, kwargs):
+        self.args = args
+        # The headers may be changed once the request is sent.
+        self.headers = dict(kwargs['headers'] or {})
+        self.body = None
+        if kwargs.get('body') and _LoggedBody.sample():
+            self.body = _LoggedBody(kwargs['body'])
+
+    def __str__(self):
+        string_parts = ['curl -i']
+        for element in self.args:
+            if element in ('GET', 'POST', 'DELETE', 'PUT'):
+                string_parts.append(' -X %s' % element)
+            else:
+                string_parts.append(' %s' % element)
+
+        for (key, value) in six.iteritems(self.headers):
+            if key in SENSITIVE_HEADERS:
+                v = value.encode('utf-8')
+                h = hashlib.sha1(v)
+                d = h.hexdigest()
+                value = "{SHA1}%s" % d
+            header = ' -H "%s: %s"' % (key, value)
+            string_parts.append(header)
+
+        if self.body is not None:
+            string_parts.append(" -d '%s'" % self.body)
+        return "".join(string_parts)
+
+
+def http_log_req(_logger, args, kwargs):
+    level = _http_log_level()
+    if not _logger.isEnabledFor(level):
+        return
+    _logger.log(level, "REQ: %s", _LoggedRequest(args, kwargs))
 
 
 def http_log_resp(_logger, resp, body):
-    if not _logger.isEnabledFor(logging.DEBUG):
+    level = _http_log_level()
+    if not _logger.isEnabledFor(level):
         return
-    _logger.debug("RESP: %(code)s %(headers)s %(body)s",
-                  {'code': resp.status_code,
-                   'headers': resp.headers,
-                   'body': body})
+    if body and _LoggedBody.sample():
+        body = _LoggedBody(body)
+    elif body:
+        body = '(not sampled)'
+    _logger.log(level, "RESP: %(code)s %(headers)s %(body)s",
+                {'code': resp.status_code,
+                 'headers': resp.headers,
+                 'body': body})
+
+
+class AsyncLogHandler(logging.Handler):
+    """Hands the log records over to another handler in a thread.
+
+    The records are formatted and written by the thread, so that logging
+    the requests, e.g. their bodies, does not slow them down. Records are
+    dropped, and counted in ``dropped``, when ``capacity`` records are
+    already waiting.
+
+    :param handler: the handler writing the records.
+    :param capacity: maximum number of records waiting.
+    """
+
+    def __init__(self, handler, capacity=10000):
+        logging.Handler.__init__(self)
+        self.handler = handler
+        self.dropped = 0
+        self._queue = queue.Queue(capacity)
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def emit(self, record):
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self):
+        while True:
+            record = self._queue.get()
+            try:
+                if record is None:
+                    return
+                self.handler.handle(record)
+            except Exception:
+                self.handler.handleError(record)
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        """Wait for the records already emitted to be written."""
+        self._queue.join()
+        self.handler.flush()
+
+    def close(self):
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self.handler.close()
+        logging.Handler.close(self)
+
+
+def response_text(resp):
+    """Return the body of a requests response as text.
+
+    For a body whose Content-Type has no charset, ``resp.text`` guesses the
+    encoding by analyzing the whole body, which may take longer than
+    parsing it. JSON is always encoded in UTF-8 (RFC 8259), so JSON bodies
+    are decoded from the raw content directly.
+    """
+    if (resp.encoding is None and
+            'json' in resp.headers.get('Content-Type', '')):
+        return resp.content.decode('utf-8', 'replace')
+    return resp.text
 
 
 def _safe_encode_without_obj(data):
@@ -48,7 +48,8 @@ def make_client(instance):
                             retries=instance._retries,
                             raise_errors=instance._raise_errors,
                             session=instance._session,
-                            auth=instance._auth)
+                            auth=instance._auth,
+                            metrics=instance._metrics)
     return client
 
 
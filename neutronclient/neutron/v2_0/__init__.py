@@ -18,18 +18,23 @@ from __future__ import print_function
 
 import abc
 import argparse
+from concurrent import futures
 import functools
 import logging
+import sys
 
 from cliff import command
 from cliff import lister
 from cliff import show
 from oslo_serialization import jsonutils
+from oslo_utils import uuidutils
 import six
+import yaml
 
 from neutronclient._i18n import _
 from neutronclient.common import exceptions
 from neutronclient.common import utils
+from neutronclient.common import validators
 
 HYPHEN_OPTS = ['tags_any', 'not_tags', 'not_tags_any']
 
@@ -61,6 +66,13 @@ def find_resourceid_by_name_or_id(client, resource, name_or_id,
                                        parent_id, fields='id')['id']
 
 
+def find_resourceids_by_name_or_id(client, resource, names_or_ids,
+                                   project_id=None, cmd_resource=None,
+                                   parent_id=None):
+    return client.find_resources(resource, names_or_ids, project_id,
+                                 cmd_resource, parent_id, fields='id').ids()
+
+
 def add_show_list_common_argument(parser):
     parser.add_argument(
         '-D', '--show-details',
@@ -417,6 +429,65 @@ class CreateCommand(NeutronCommand, show.ShowOne):
         return zip(*sorted(six.iteritems(info)))
 
 
+class BulkCreateCommand(NeutronCommand, lister.Lister):
+    """Create many resources of a given type with bulk requests."""
+
+    log = None
+    list_columns = ['id', 'name']
+
+    def get_parser(self, prog_name):
+        parser = super(BulkCreateCommand, self).get_parser(prog_name)
+        parser.add_argument(
+            'file', metavar='FILE', nargs='?', default='-',
+            help=_('File with one %s per line, given as a JSON or YAML '
+                   'mapping of its attributes. Reads standard input if '
+                   'omitted or "-".') % self.resource)
+        parser.add_argument(
+            '--chunk-size', metavar='SIZE', type=int,
+            help=_('Maximum number of resources created by a single '
+                   'request.'))
+        return parser
+
+    def _read_items(self, stream):
+        items = []
+        for lineno, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                # JSON is a subset of YAML, one parser handles both.
+                item = yaml.safe_load(line)
+            except yaml.YAMLError as e:
+                item = e
+            if not isinstance(item, dict):
+                raise exceptions.CommandError(
+                    _('Line %(lineno)d is not a mapping of %(resource)s '
+                      'attributes: %(line)s') %
+                    {'lineno': lineno, 'resource': self.resource,
+                     'line': line})
+            items.append(item)
+        return items
+
+    def take_action(self, parsed_args):
+        validators.validate_int_range(parsed_args, 'chunk_size', 1, None)
+        if parsed_args.file == '-':
+            items = self._read_items(sys.stdin)
+        else:
+            with open(parsed_args.file) as f:
+                items = self._read_items(f)
+        neutron_client = self.get_client()
+        collection = neutron_client.get_resource_plural(self.cmd_resource)
+        obj_creator = getattr(neutron_client, "create_%s_bulk" % collection)
+        kwargs = {}
+        if parsed_args.chunk_size:
+            kwargs['chunk_size'] = parsed_args.chunk_size
+        data = obj_creator(items, **kwargs)
+        info = data[collection]
+        _columns = [x for x in self.list_columns if info and x in info[0]]
+        return (_columns, (utils.get_item_properties(s, _columns)
+                           for s in info))
+
+
 class UpdateCommand(NeutronCommand):
     """Update resource's information."""
 
@@ -493,6 +564,11 @@ class DeleteCommand(NeutronCommand):
             'id', metavar=self.resource.upper(),
             nargs='+' if self.bulk_delete else 1,
             help=help_str % self.help_resource)
+        if self.bulk_delete:
+            parser.add_argument(
+                '--concurrency', metavar='N', type=int, default=1,
+                help=_('Number of %s(s) looked up and deleted in parallel '
+                       '(default: %%(default)s).') % self.help_resource)
         self.add_known_arguments(parser)
         return parser
 
@@ -503,7 +579,9 @@ class DeleteCommand(NeutronCommand):
                               "delete_%s" % self.cmd_resource)
 
         if self.bulk_delete:
-            self._bulk_delete(obj_deleter, neutron_client, parsed_args.id)
+            validators.validate_int_range(parsed_args, 'concurrency', 1, None)
+            self._bulk_delete(obj_deleter, neutron_client, parsed_args.id,
+                              concurrency=parsed_args.concurrency)
         else:
             self.delete_item(obj_deleter, neutron_client, parsed_args.id)
             print((_('Deleted %(resource)s: %(id)s')
@@ -512,18 +590,36 @@ class DeleteCommand(NeutronCommand):
                   file=self.app.stdout)
         return
 
-    def _bulk_delete(self, obj_deleter, neutron_client, parsed_args_ids):
+    def _try_delete_item(self, obj_deleter, neutron_client, item_id):
+        try:
+            self.delete_item(obj_deleter, neutron_client, item_id)
+        except exceptions.NotFound:
+            return 'non_existent'
+        except exceptions.NeutronClientNoUniqueMatch:
+            return 'multiple_ids'
+        return 'deleted'
+
+    def _bulk_delete(self, obj_deleter, neutron_client, parsed_args_ids,
+                     concurrency=1):
         successful_delete = []
         non_existent = []
         multiple_ids = []
-        for item_id in parsed_args_ids:
-            try:
-                self.delete_item(obj_deleter, neutron_client, item_id)
-                successful_delete.append(item_id)
-            except exceptions.NotFound:
-                non_existent.append(item_id)
-            except exceptions.NeutronClientNoUniqueMatch:
-                multiple_ids.append(item_id)
+        results = {'deleted': successful_delete,
+                   'non_existent': non_existent,
+                   'multiple_ids': multiple_ids}
+        delete = functools.partial(self._try_delete_item, obj_deleter,
+                                   neutron_client)
+        if concurrency > 1:
+            with futures.ThreadPoolExecutor(
+                    max_workers=concurrency) as executor:
+                # map() returns results in the order of the IDs, so the
+                # messages list them as given and the first unexpected
+                # error, in that order, is raised.
+                outcomes = list(executor.map(delete, parsed_args_ids))
+        else:
+            outcomes = [delete(item_id) for item_id in parsed_args_ids]
+        for item_id, outcome in zip(parsed_args_ids, outcomes):
+            results[outcome].append(item_id)
         if successful_delete:
             print((_('Deleted %(resource)s(s): %(id)s'))
                   % {'id': ", ".join(successful_delete),
@@ -545,7 +641,8 @@ class DeleteCommand(NeutronCommand):
             raise exceptions.NeutronCLIError(message='\n'.join(err_msgs))
 
     def delete_item(self, obj_deleter, neutron_client, item_id):
-        if self.allow_names:
+        # A UUID is used as is, saving the lookup request.
+        if self.allow_names and not uuidutils.is_uuid_like(item_id):
             params = {'cmd_resource': self.cmd_resource,
                       'parent_id': self.parent_id}
             _id = find_resourceid_by_name_or_id(neutron_client,
@@ -49,9 +49,8 @@ def parse_common_args(client, parsed_args):
             parsed_args.policy)
 
     if parsed_args.routers:
-        body['router_ids'] = [
-            neutronv20.find_resourceid_by_name_or_id(client, 'router', r)
-            for r in parsed_args.routers]
+        body['router_ids'] = neutronv20.find_resourceids_by_name_or_id(
+            client, 'router', parsed_args.routers)
     elif parsed_args.no_routers:
         body['router_ids'] = []
 
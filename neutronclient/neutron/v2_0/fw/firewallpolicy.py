@@ -44,11 +44,8 @@ def add_common_args(parser):
 
 def parse_common_args(client, parsed_args):
     if parsed_args.firewall_rules:
-        _firewall_rules = []
-        for f in parsed_args.firewall_rules:
-            _firewall_rules.append(
-                neutronv20.find_resourceid_by_name_or_id(
-                    client, 'firewall_rule', f))
+        _firewall_rules = neutronv20.find_resourceids_by_name_or_id(
+            client, 'firewall_rule', parsed_args.firewall_rules)
         body = {'firewall_rules': _firewall_rules}
     else:
         body = {}
@@ -17,7 +17,6 @@
 import argparse
 
 from neutronclient._i18n import _
-from neutronclient.common import exceptions
 from neutronclient.common import utils
 from neutronclient.neutron import v2_0 as neutronV20
 from neutronclient.neutron.v2_0 import availability_zone
@@ -41,9 +40,6 @@ def args2body_common(body, parsed_args):
 class ListNetwork(neutronV20.ListCommand):
     """List networks that belong to a given tenant."""
 
-    # Length of a query filter on subnet id
-    # id=<uuid>& (with len(uuid)=36)
-    subnet_id_filter_len = 40
     resource = 'network'
     _formatters = {'subnets': _format_subnets, }
     list_columns = ['id', 'name', 'subnets']
@@ -91,7 +87,7 @@ class ListNetwork(neutronV20.ListCommand):
     def extend_list(self, data, parsed_args):
         """Add subnet information to a network list."""
         neutron_client = self.get_client()
-        search_opts = {'fields': ['id', 'cidr']}
+        search_opts = {}
         if self.pagination_support:
             page_size = parsed_args.page_size
             if page_size:
@@ -101,27 +97,8 @@ class ListNetwork(neutronV20.ListCommand):
             if 'subnets' in n:
                 subnet_ids.extend(n['subnets'])
 
-        def _get_subnet_list(sub_ids):
-            search_opts['id'] = sub_ids
-            return neutron_client.list_subnets(
-                **search_opts).get('subnets', [])
-
-        try:
-            subnets = _get_subnet_list(subnet_ids)
-        except exceptions.RequestURITooLong as uri_len_exc:
-            # The URI is too long because of too many subnet_id filters
-            # Use the excess attribute of the exception to know how many
-            # subnet_id filters can be inserted into a single request
-            subnet_count = len(subnet_ids)
-            max_size = ((self.subnet_id_filter_len * subnet_count) -
-                        uri_len_exc.excess)
-            chunk_size = max_size // self.subnet_id_filter_len
-            subnets = []
-            for i in range(0, subnet_count, chunk_size):
-                subnets.extend(
-                    _get_subnet_list(subnet_ids[i: i + chunk_size]))
-
-        subnet_dict = dict([(s['id'], s) for s in subnets])
+        subnet_dict = neutron_client.list_by_ids(
+            'subnets', subnet_ids, fields=['id', 'cidr'], **search_opts)
         for n in data:
             if 'subnets' in n:
                 n['subnets'] = [(subnet_dict.get(s) or {"id": s})
@@ -213,6 +190,12 @@ class CreateNetwork(neutronV20.CreateCommand, qos_policy.CreateQosPolicyMixin):
         return {'network': body}
 
 
+class BulkCreateNetwork(neutronV20.BulkCreateCommand):
+    """Create many networks at once from JSON or YAML lines."""
+
+    resource = 'network'
+
+
 class DeleteNetwork(neutronV20.DeleteCommand):
     """Delete a given network."""
 
@@ -296,6 +296,12 @@ class CreatePort(neutronV20.CreateCommand, UpdatePortSecGroupMixin,
         return {'port': body}
 
 
+class BulkCreatePort(neutronV20.BulkCreateCommand):
+    """Create many ports at once from JSON or YAML lines."""
+
+    resource = 'port'
+
+
 class DeletePort(neutronV20.DeleteCommand):
     """Delete a given port."""
 
@@ -13,45 +13,77 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 #
+from concurrent import futures
 import sys
+import time
 
 from neutronclient._i18n import _
+from neutronclient.common import validators
 from neutronclient.neutron import v2_0 as neutronV20
 
+ROUTER_INTERFACE_OWNERS = ['network:router_interface',
+                           'network:router_interface_distributed']
+
 
 class Purge(neutronV20.NeutronCommand):
     """Delete all resources that belong to a given tenant."""
 
+    # Number of resources requested per page when listing.
+    page_size = 500
+
     def _pluralize(self, string):
         return string + 's'
 
-    def _get_resources(self, neutron_client, resource_types, tenant_id):
+    def _list_tenant_resources(self, neutron_client, resource_type,
+                               tenant_id):
+        resource_type_plural = self._pluralize(resource_type)
+        opts = {'fields': ['id', 'tenant_id'],
+                'tenant_id': tenant_id,
+                'limit': self.page_size}
+        if resource_type_plural == 'ports':
+            opts['fields'].append('device_id')
+            opts['fields'].append('device_owner')
+        function = getattr(neutron_client, 'list_%s' %
+                           resource_type_plural)
         resources = []
-        for resource_type in resource_types:
-            resources.append([])
-            resource_type_plural = self._pluralize(resource_type)
-            opts = {'fields': ['id', 'tenant_id']}
-            if resource_type_plural == 'ports':
-                opts['fields'].append('device_id')
-                opts['fields'].append('device_owner')
-            function = getattr(neutron_client, 'list_%s' %
-                               resource_type_plural)
-            if callable(function):
-                returned_resources = function(**opts).get(resource_type_plural,
-                                                          [])
-                for resource in returned_resources:
-                    if resource['tenant_id'] == tenant_id:
-                        index = resource_types.index(resource_type)
-                        resources[index].append(resource)
-                        self.total_resources += 1
+        if callable(function):
+            for page in function(retrieve_all=False, **opts):
+                # The server filters on tenant_id already, this only guards
+                # against a plugin ignoring the filter.
+                resources.extend(
+                    resource for resource in page.get(resource_type_plural,
+                                                      [])
+                    if resource['tenant_id'] == tenant_id)
         return resources
 
+    def _get_resources(self, neutron_client, resource_types, tenant_id):
+        """Return the resources of the tenant as ordered deletion tiers.
+
+        Each tier is a ``(resource_type, resources)`` tuple. Resources of
+        a tier do not depend on each other and can be deleted in any order
+        once the previous tiers are gone. Router interfaces get a tier of
+        their own ahead of the other ports.
+        """
+        tiers = []
+        for resource_type in resource_types:
+            resources = self._list_tenant_resources(
+                neutron_client, resource_type, tenant_id)
+            self.total_resources += len(resources)
+            if resource_type == 'port':
+                interfaces = [port for port in resources
+                              if port.get('device_owner', '') in
+                              ROUTER_INTERFACE_OWNERS]
+                resources = [port for port in resources
+                             if port.get('device_owner', '') not in
+                             ROUTER_INTERFACE_OWNERS]
+                tiers.append((resource_type, interfaces))
+            tiers.append((resource_type, resources))
+        return tiers
+
     def _delete_resource(self, neutron_client, resource_type, resource):
         resource_id = resource['id']
         if resource_type == 'port':
-            router_interface_owners = ['network:router_interface',
-                                       'network:router_interface_distributed']
-            if resource.get('device_owner', '') in router_interface_owners:
+            if resource.get('device_owner', '') in ROUTER_INTERFACE_OWNERS:
                 body = {'port_id': resource_id}
                 neutron_client.remove_interface_router(resource['device_id'],
                                                        body)
@@ -60,33 +92,42 @@ class Purge(neutronV20.NeutronCommand):
         if callable(function):
             function(resource_id)
 
+    def _report_progress(self):
+        percent_complete = 100
+        if self.total_resources > 0:
+            percent_complete = (self.deleted_resources /
+                                float(self.total_resources)) * 100
+        elapsed = time.time() - self.start_time
+        rate = self.deleted_resources / elapsed if elapsed > 0 else 0.0
+        sys.stdout.write("\rPurging resources: %d%% complete "
+                         "(%d/%d, %.1f resources/s)." %
+                         (percent_complete, self.deleted_resources,
+                          self.total_resources, rate))
+        sys.stdout.flush()
+
     def _purge_resources(self, neutron_client, resource_types,
-                         tenant_resources):
-        deleted = {}
-        failed = {}
+                         tenant_resources, concurrency=1):
+        deleted = dict((resource_type, 0) for resource_type in resource_types)
+        failed = dict((resource_type, 0) for resource_type in resource_types)
         failures = False
-        for resources in tenant_resources:
-            index = tenant_resources.index(resources)
-            resource_type = resource_types[index]
-            failed[resource_type] = 0
-            deleted[resource_type] = 0
-            for resource in resources:
-                try:
-                    self._delete_resource(neutron_client, resource_type,
-                                          resource)
-                    deleted[resource_type] += 1
-                    self.deleted_resources += 1
-                except Exception:
-                    failures = True
-                    failed[resource_type] += 1
-                    self.total_resources -= 1
-                percent_complete = 100
-                if self.total_resources > 0:
-                    percent_complete = (self.deleted_resources /
-                                        float(self.total_resources)) * 100
-                sys.stdout.write("\rPurging resources: %d%% complete." %
-                                 percent_complete)
-                sys.stdout.flush()
+        self.start_time = time.time()
+        with futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for resource_type, resources in tenant_resources:
+                # Finish a tier before starting the next one, its resources
+                # may still be in use by the ones of the previous tier.
+                tasks = [executor.submit(self._delete_resource,
+                                         neutron_client, resource_type,
+                                         resource)
+                         for resource in resources]
+                for task in futures.as_completed(tasks):
+                    if task.exception() is None:
+                        deleted[resource_type] += 1
+                        self.deleted_resources += 1
+                    else:
+                        failures = True
+                        failed[resource_type] += 1
+                        self.total_resources -= 1
+                    self._report_progress()
         return (deleted, failed, failures)
 
     def _build_message(self, deleted, failed, failures):
@@ -126,9 +167,14 @@ class Purge(neutronV20.NeutronCommand):
         parser.add_argument(
             'tenant', metavar='TENANT',
             help=_('ID of Tenant owning the resources to be deleted.'))
+        parser.add_argument(
+            '--concurrency', metavar='N', type=int, default=4,
+            help=_('Number of resources deleted in parallel '
+                   '(default: %(default)s).'))
         return parser
 
     def take_action(self, parsed_args):
+        validators.validate_int_range(parsed_args, 'concurrency', 1, None)
         neutron_client = self.get_client()
 
         self.any_failures = False
@@ -144,7 +190,7 @@ class Purge(neutronV20.NeutronCommand):
         self.deleted_resources = 0
         resources = self._get_resources(neutron_client, resource_types,
                                         parsed_args.tenant)
-        deleted, failed, failures = self._purge_resources(neutron_client,
-                                                          resource_types,
-                                                          resources)
+        deleted, failed, failures = self._purge_resources(
+            neutron_client, resource_types, resources,
+            concurrency=parsed_args.concurrency)
         print('\n%s' % self._build_message(deleted, failed, failures))
@@ -91,6 +91,48 @@ class ListQuota(neutronV20.NeutronCommand, lister.Lister):
                            for s in info))
 
 
+class QuotaUsageReport(neutronV20.NeutronCommand, lister.Lister):
+    """List the resources used by every tenant against its quotas."""
+
+    resource = 'quota'
+    _columns = ('tenant_id', 'resource', 'used', 'limit', 'utilization')
+
+    def get_parser(self, prog_name):
+        parser = super(QuotaUsageReport, self).get_parser(prog_name)
+        parser.add_argument(
+            '--resource', dest='resources', metavar='RESOURCE',
+            action='append',
+            help=_('Quota name of a resource to report on, e.g. network. '
+                   'Networks, ports, routers, floating IPs and security '
+                   'groups are reported by default. Repeat option to '
+                   'report on several resources.'))
+        parser.add_argument(
+            '--sort-key', default='utilization', choices=self._columns,
+            help=_('Sort the report by this column, utilization by '
+                   'default. Rows without a value, e.g. the utilization '
+                   'of unlimited quotas, are always listed last.'))
+        parser.add_argument(
+            '--sort-dir', default='desc', choices=['asc', 'desc'],
+            help=_('Sort direction, desc by default.'))
+        return parser
+
+    def take_action(self, parsed_args):
+        neutron_client = self.get_client()
+        report = neutron_client.quota_usage_report(
+            resources=parsed_args.resources)
+        key = parsed_args.sort_key
+        rows = sorted((row for row in report if row[key] is not None),
+                      key=lambda row: row[key],
+                      reverse=parsed_args.sort_dir == 'desc')
+        rows.extend(row for row in report if row[key] is None)
+        for row in rows:
+            if row['utilization'] is not None:
+                # Shown as a percentage.
+                row['utilization'] = round(row['utilization'] * 100, 1)
+        return (self._columns, (utils.get_item_properties(row, self._columns)
+                                for row in rows))
+
+
 class ShowQuotaBase(neutronV20.NeutronCommand, show.ShowOne):
     """Base class to show quotas of a given tenant."""
 
@@ -256,6 +256,12 @@ class CreateSubnet(neutronV20.CreateCommand):
         return {'subnet': body}
 
 
+class BulkCreateSubnet(neutronV20.BulkCreateCommand):
+    """Create many subnets at once from JSON or YAML lines."""
+
+    resource = 'subnet'
+
+
 class DeleteSubnet(neutronV20.DeleteCommand):
     """Delete a given subnet."""
 
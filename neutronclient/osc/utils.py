@@ -66,6 +66,31 @@ def get_column_definitions(attr_map, long_listing):
     return headers, columns
 
 
+def get_list_fields(attr_map, long_listing, computed=None):
+    """Return the API attributes needed to fill a listing table.
+
+    The result is meant to be passed as ``fields`` to a list call so that
+    the server only returns the attributes shown in the table.
+
+    :param attr_map: a list of table entry definitions.
+      The same format is used as for get_column_definitions attr_map.
+    :param long_listing: A boolean value which indicates a long listing
+      or not. In most cases, parsed_args.long is passed to this argument.
+    :param computed: a dict from the columns built on the client side
+      to the list of API attributes they are built from. For example:
+      {'summary': ['protocol', 'action']}
+    :return: A list of API attribute names.
+    """
+    computed = computed or {}
+    _headers, columns = get_column_definitions(attr_map, long_listing)
+    fields = []
+    for column in columns:
+        for field in computed.get(column, [column]):
+            if field not in fields:
+                fields.append(field)
+    return fields
+
+
 def get_columns(item, attr_map=None):
     """Return pair of resource attributes and corresponding display names.
 
@@ -127,9 +127,10 @@ class ListBgpPeer(command.Lister):
     _description = _("List BGP peers")
 
     def take_action(self, parsed_args):
-        data = self.app.client_manager.neutronclient.list_bgp_peers()
         headers = ('ID', 'Name', 'Peer IP', 'Remote AS')
         columns = ('id', 'name', 'peer_ip', 'remote_as')
+        data = self.app.client_manager.neutronclient.list_bgp_peers(
+            fields=list(columns))
         return (headers,
                 (utils.get_dict_properties(
                     s, columns,
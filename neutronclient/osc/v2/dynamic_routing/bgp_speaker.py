@@ -186,13 +186,13 @@ class ListBgpSpeaker(command.Lister):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.neutronclient
+        headers = ('ID', 'Name', 'Local AS', 'IP Version')
+        columns = ('id', 'name', 'local_as', 'ip_version')
         if parsed_args.agent is not None:
             data = client.list_bgp_speaker_on_dragent(parsed_args.agent_id)
         else:
-            data = client.list_bgp_speakers()
+            data = client.list_bgp_speakers(fields=list(columns))
 
-        headers = ('ID', 'Name', 'Local AS', 'IP Version')
-        columns = ('id', 'name', 'local_as', 'ip_version')
         return (headers, (utils.get_dict_properties(s, columns)
                           for s in data[constants.BGP_SPEAKERS]))
 
@@ -239,25 +239,19 @@ class DeleteFirewallGroup(command.Command):
             raise exceptions.CommandError(msg)
 
 
-class ListFirewallGroup(command.Lister):
+class ListFirewallGroup(v2_utils.ListCommand):
     _description = _("List firewall groups")
 
-    def get_parser(self, prog_name):
-        parser = super(ListFirewallGroup, self).get_parser(prog_name)
-        parser.add_argument(
-            '--long',
-            action='store_true',
-            help=_("List additional fields in output")
-        )
-        return parser
-
-    def take_action(self, parsed_args):
-        client = self.app.client_manager.neutronclient
-        obj = client.list_fwaas_firewall_groups()[const.FWGS]
-        headers, columns = osc_utils.get_column_definitions(
-            _attr_map, long_listing=parsed_args.long)
-        return (headers, (utils.get_dict_properties(
-            s, columns, formatters=_formatters) for s in obj))
+    list_method = 'list_fwaas_firewall_groups'
+    resource_plural = const.FWGS
+    _attr_map = _attr_map
+    _formatters = _formatters
+    filter_attrs = [
+        'name',
+        'project',
+        {'name': 'status',
+         'help': _("List firewall groups with this status")},
+    ]
 
 
 class SetFirewallGroup(command.Command):
@@ -25,6 +25,7 @@ from osc_lib import utils
 from neutronclient._i18n import _
 from neutronclient.osc import utils as osc_utils
 from neutronclient.osc.v2.fwaas import constants as const
+from neutronclient.osc.v2 import utils as v2_utils
 
 
 LOG = logging.getLogger(__name__)
@@ -54,20 +55,18 @@ def _get_common_attrs(client_manager, parsed_args, is_create=True):
                 parsed_args.project_domain,
             ).id
     if parsed_args.firewall_rule and parsed_args.no_firewall_rule:
-        _firewall_rules = []
-        for f in parsed_args.firewall_rule:
-            _firewall_rules.append(client.find_resource(
-                const.FWR, f, cmd_resource=const.CMD_FWR)['id'])
-        attrs[const.FWRS] = _firewall_rules
+        attrs[const.FWRS] = client.find_resources(
+            const.FWR, parsed_args.firewall_rule,
+            cmd_resource=const.CMD_FWR).ids()
     elif parsed_args.firewall_rule:
         rules = []
         if not is_create:
             rules += client.find_resource(
                 const.FWP, parsed_args.firewall_policy,
                 cmd_resource=const.CMD_FWP)[const.FWRS]
-        for f in parsed_args.firewall_rule:
-            rules.append(client.find_resource(
-                const.FWR, f, cmd_resource=const.CMD_FWR)['id'])
+        rules += client.find_resources(
+            const.FWR, parsed_args.firewall_rule,
+            cmd_resource=const.CMD_FWR).ids()
         attrs[const.FWRS] = rules
     elif parsed_args.no_firewall_rule:
         attrs[const.FWRS] = []
@@ -281,26 +280,20 @@ class FirewallPolicyRemoveRule(command.Command):
               file=self.app.stdout)
 
 
-class ListFirewallPolicy(command.Lister):
+class ListFirewallPolicy(v2_utils.ListCommand):
     _description = _("List firewall policies")
 
-    def get_parser(self, prog_name):
-        parser = super(ListFirewallPolicy, self).get_parser(prog_name)
-        parser.add_argument(
-            '--long',
-            action='store_true',
-            default=False,
-            help=_("List additional fields in output")
-        )
-        return parser
-
-    def take_action(self, parsed_args):
-        client = self.app.client_manager.neutronclient
-        obj = client.list_fwaas_firewall_policies()[const.FWPS]
-        headers, columns = osc_utils.get_column_definitions(
-            _attr_map, long_listing=parsed_args.long)
-        return (headers, (utils.get_dict_properties(
-            s, columns, formatters=_formatters) for s in obj))
+    list_method = 'list_fwaas_firewall_policies'
+    resource_plural = const.FWPS
+    _attr_map = _attr_map
+    _formatters = _formatters
+    filter_attrs = [
+        'name',
+        'project',
+        {'name': 'audited',
+         'help': _("List audited or not audited firewall policies"),
+         'boolean': True},
+    ]
 
 
 class SetFirewallPolicy(command.Command):
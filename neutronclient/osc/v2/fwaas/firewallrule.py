@@ -25,6 +25,7 @@ from neutronclient._i18n import _
 from neutronclient.common import utils as nc_utils
 from neutronclient.osc import utils as osc_utils
 from neutronclient.osc.v2.fwaas import constants as const
+from neutronclient.osc.v2 import utils as v2_utils
 
 
 LOG = logging.getLogger(__name__)
@@ -48,6 +49,12 @@ _attr_map = (
     ('tenant_id', 'Project', osc_utils.LIST_LONG_ONLY),
 )
 
+# API attributes the summary column of the short listing is built from.
+_summary_fields = (
+    'protocol', 'source_ip_address', 'source_port',
+    'destination_ip_address', 'destination_port', 'action',
+)
+
 
 def _get_common_parser(parser):
     parser.add_argument(
@@ -255,49 +262,46 @@ class DeleteFirewallRule(command.Command):
             raise exceptions.CommandError(msg)
 
 
-class ListFirewallRule(command.Lister):
+class ListFirewallRule(v2_utils.ListCommand):
     _description = _("List firewall rules that belong to a given tenant")
 
-    def get_parser(self, prog_name):
-        parser = super(ListFirewallRule, self).get_parser(prog_name)
-        parser.add_argument(
-            '--long',
-            action='store_true',
-            default=False,
-            help=_("List additional fields in output")
-        )
-        return parser
-
-    def extend_list(self, data, parsed_args):
-        ext_data = copy.deepcopy(data)
-        for d in ext_data:
-            protocol = d['protocol'].upper() if d['protocol'] else 'ANY'
-            src_ip = 'none specified'
-            dst_ip = 'none specified'
-            src_port = '(none specified)'
-            dst_port = '(none specified)'
-            if 'source_ip_address' in d and d['source_ip_address']:
-                src_ip = str(d['source_ip_address']).lower()
-            if 'source_port' in d and d['source_port']:
-                src_port = '(' + str(d['source_port']).lower() + ')'
-            if 'destination_ip_address' in d and d['destination_ip_address']:
-                dst_ip = str(d['destination_ip_address']).lower()
-            if 'destination_port' in d and d['destination_port']:
-                dst_port = '(' + str(d['destination_port']).lower() + ')'
-            action = d['action'] if d.get('action') else 'no-action'
-            src = 'source(port): ' + src_ip + src_port
-            dst = 'dest(port): ' + dst_ip + dst_port
-            d['summary'] = ',\n '.join([protocol, src, dst, action])
-        return ext_data
-
-    def take_action(self, parsed_args):
-        client = self.app.client_manager.neutronclient
-        obj = client.list_fwaas_firewall_rules()[const.FWRS]
-        obj_extend = self.extend_list(obj, parsed_args)
-        headers, columns = osc_utils.get_column_definitions(
-            _attr_map, long_listing=parsed_args.long)
-        return (headers, (utils.get_dict_properties(
-            s, columns, formatters=_formatters) for s in obj_extend))
+    list_method = 'list_fwaas_firewall_rules'
+    resource_plural = const.FWRS
+    _attr_map = _attr_map
+    _formatters = _formatters
+    _computed_fields = {'summary': _summary_fields}
+    filter_attrs = [
+        'name',
+        'project',
+        {'name': 'protocol',
+         'help': _("List firewall rules matching this protocol")},
+        {'name': 'action',
+         'help': _("List firewall rules with this action")},
+        {'name': 'enabled',
+         'help': _("List enabled or disabled firewall rules"),
+         'boolean': True},
+    ]
+
+    def extend_item(self, item, parsed_args):
+        d = copy.deepcopy(item)
+        protocol = d['protocol'].upper() if d['protocol'] else 'ANY'
+        src_ip = 'none specified'
+        dst_ip = 'none specified'
+        src_port = '(none specified)'
+        dst_port = '(none specified)'
+        if 'source_ip_address' in d and d['source_ip_address']:
+            src_ip = str(d['source_ip_address']).lower()
+        if 'source_port' in d and d['source_port']:
+            src_port = '(' + str(d['source_port']).lower() + ')'
+        if 'destination_ip_address' in d and d['destination_ip_address']:
+            dst_ip = str(d['destination_ip_address']).lower()
+        if 'destination_port' in d and d['destination_port']:
+            dst_port = '(' + str(d['destination_port']).lower() + ')'
+        action = d['action'] if d.get('action') else 'no-action'
+        src = 'source(port): ' + src_ip + src_port
+        dst = 'dest(port): ' + dst_ip + dst_port
+        d['summary'] = ',\n '.join([protocol, src, dst, action])
+        return d
 
 
 class SetFirewallRule(command.Command):
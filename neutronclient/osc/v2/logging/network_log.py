@@ -24,6 +24,7 @@ from oslo_log import log as logging
 from neutronclient._i18n import _
 from neutronclient.common import utils as nc_utils
 from neutronclient.osc import utils as osc_utils
+from neutronclient.osc.v2 import utils as v2_utils
 
 
 LOG = logging.getLogger(__name__)
@@ -200,42 +201,40 @@ class ListLoggableResource(command.Lister):
         return (headers, (utils.get_dict_properties(s, columns) for s in obj))
 
 
-class ListNetworkLog(command.Lister):
+class ListNetworkLog(v2_utils.ListCommand):
     _description = _("List network logs")
 
-    def get_parser(self, prog_name):
-        parser = super(ListNetworkLog, self).get_parser(prog_name)
-        parser.add_argument(
-            '--long',
-            action='store_true',
-            help=_("List additional fields in output")
-        )
-        # TODO(yushiro): We'll support filtering in the future.
-        return parser
-
-    def _extend_list(self, data, parsed_args):
-        ext_data = copy.deepcopy(data)
-        for d in ext_data:
-            e_prefix = 'Event: '
-            if d['event']:
-                event = e_prefix + d['event'].upper()
-            port = '(port) ' + d['target_id'] if d['target_id'] else ''
-            sg = ('(security_group) ' + d['resource_id']
-                  if d['resource_id'] else '')
-            t_prefix = 'Logged: '
-            t = sg + ' on ' + port if port and sg else sg + port
-            target = t_prefix + t if t else t_prefix + '(None specified)'
-            d['summary'] = ',\n'.join([event, target])
-        return ext_data
-
-    def take_action(self, parsed_args):
-        client = self.app.client_manager.neutronclient
-        obj = client.list_network_logs()['logs']
-        obj_extend = self._extend_list(obj, parsed_args)
-        headers, columns = osc_utils.get_column_definitions(
-            _attr_map, long_listing=parsed_args.long)
-        return (headers, (
-            utils.get_dict_properties(s, columns) for s in obj_extend))
+    list_method = 'list_network_logs'
+    resource_plural = 'logs'
+    _attr_map = _attr_map
+    _computed_fields = {'summary': ['event', 'target_id', 'resource_id']}
+    filter_attrs = [
+        'name',
+        'project',
+        {'name': 'resource_type',
+         'help': _("List network logs of this resource type")},
+        {'name': 'resource_id',
+         'help': _("List network logs of this resource (ID only)")},
+        {'name': 'target_id',
+         'help': _("List network logs of this port (ID only)")},
+        {'name': 'enabled',
+         'help': _("List enabled or disabled network logs"),
+         'boolean': True},
+    ]
+
+    def extend_item(self, item, parsed_args):
+        d = copy.deepcopy(item)
+        e_prefix = 'Event: '
+        if d['event']:
+            event = e_prefix + d['event'].upper()
+        port = '(port) ' + d['target_id'] if d['target_id'] else ''
+        sg = ('(security_group) ' + d['resource_id']
+              if d['resource_id'] else '')
+        t_prefix = 'Logged: '
+        t = sg + ' on ' + port if port and sg else sg + port
+        target = t_prefix + t if t else t_prefix + '(None specified)'
+        d['summary'] = ',\n'.join([event, target])
+        return d
 
 
 class SetNetworkLog(command.Command):
@@ -48,6 +48,11 @@ class BgpvpnPortAssoc(object):
         'prefix_routes': format_columns.ListColumn,
         'bgpvpn_routes': format_columns.ListColumn,
     }
+    # Columns built by _transform_resource from the routes attribute.
+    _computed_fields = {
+        'prefix_routes': ['routes'],
+        'bgpvpn_routes': ['routes'],
+    }
 
     def _transform_resource(self, data):
         """Transforms BGP VPN port association routes property
@@ -213,6 +213,9 @@ class ListBgpvpnResAssoc(command.Lister):
         params = {}
         if parsed_args.property:
             params.update(parsed_args.property)
+        params['fields'] = nc_osc_utils.get_list_fields(
+            self._attr_map, parsed_args.long,
+            computed=getattr(self, '_computed_fields', None))
         objs = list_method(bgpvpn['id'],
                            retrieve_all=True, **params)[self._resource_plural]
         transform = getattr(self, '_transform_resource', None)
@@ -23,6 +23,7 @@ from osc_lib import utils
 from neutronclient._i18n import _
 from neutronclient.common import exceptions as nc_exc
 from neutronclient.osc import utils as nc_osc_utils
+from neutronclient.osc.v2 import utils as v2_utils
 
 LOG = logging.getLogger(__name__)
 
@@ -55,6 +56,14 @@ _attr_map = (
     ('project_id', 'Project', nc_osc_utils.LIST_LONG_ONLY),
 )
 
+# API attributes the summary column of the short listing is built from.
+_summary_fields = (
+    'protocol', 'source_ip_prefix', 'destination_ip_prefix',
+    'source_port_range_min', 'source_port_range_max',
+    'destination_port_range_min', 'destination_port_range_max',
+    'logical_source_port', 'logical_destination_port', 'l7_parameters',
+)
+
 
 class CreateSfcFlowClassifier(command.ShowOne):
     _description = _("Create a flow classifier")
@@ -148,39 +157,45 @@ class DeleteSfcFlowClassifier(command.Command):
             raise exceptions.CommandError(msg)
 
 
-class ListSfcFlowClassifier(command.Lister):
+class ListSfcFlowClassifier(v2_utils.ListCommand):
     _description = _("List flow classifiers")
 
-    def get_parser(self, prog_name):
-        parser = super(ListSfcFlowClassifier, self).get_parser(prog_name)
-        parser.add_argument(
-            '--long',
-            action='store_true',
-            help=_("List additional fields in output")
-        )
-        return parser
-
-    def extend_list(self, data, parsed_args):
-        ext_data = data['flow_classifiers']
-        for d in ext_data:
-            val = []
-            protocol = d['protocol'].upper() if d['protocol'] else 'any'
-            val.append('protocol: ' + protocol)
-            val.append(self._get_protocol_port_details(d, 'source'))
-            val.append(self._get_protocol_port_details(d, 'destination'))
-            if 'logical_source_port' in d:
-                val.append('neutron_source_port: ' +
-                           str(d['logical_source_port']))
-
-            if 'logical_destination_port' in d:
-                val.append('neutron_destination_port: ' +
-                           str(d['logical_destination_port']))
-
-            if 'l7_parameters' in d:
-                l7_param = 'l7_parameters: {%s}' % ','.join(d['l7_parameters'])
-                val.append(l7_param)
-            d['summary'] = ',\n'.join(val)
-        return ext_data
+    list_method = 'list_sfc_flow_classifiers'
+    resource_plural = 'flow_classifiers'
+    _attr_map = _attr_map
+    _computed_fields = {'summary': _summary_fields}
+    filter_attrs = [
+        'name',
+        'project',
+        {'name': 'protocol',
+         'help': _("List flow classifiers matching this IP protocol")},
+        {'name': 'ethertype',
+         'help': _("List flow classifiers matching this L2 ethertype")},
+        {'name': 'logical_source_port',
+         'help': _("List flow classifiers with this neutron source port "
+                   "(ID only)")},
+    ]
+
+    def extend_item(self, item, parsed_args):
+        val = []
+        protocol = item['protocol'].upper() if item['protocol'] else 'any'
+        val.append('protocol: ' + protocol)
+        val.append(self._get_protocol_port_details(item, 'source'))
+        val.append(self._get_protocol_port_details(item, 'destination'))
+        if 'logical_source_port' in item:
+            val.append('neutron_source_port: ' +
+                       str(item['logical_source_port']))
+
+        if 'logical_destination_port' in item:
+            val.append('neutron_destination_port: ' +
+                       str(item['logical_destination_port']))
+
+        if 'l7_parameters' in item:
+            l7_param = 'l7_parameters: {%s}' % ','.join(
+                item['l7_parameters'])
+            val.append(l7_param)
+        item['summary'] = ',\n'.join(val)
+        return item
 
     def _get_protocol_port_details(self, data, val):
         type_ip_prefix = val + '_ip_prefix'
@@ -196,15 +211,6 @@ class ListSfcFlowClassifier(command.Lister):
         return '%s[port]: %s[%s:%s]' % (
             val, ip_prefix, min_port, max_port)
 
-    def take_action(self, parsed_args):
-        client = self.app.client_manager.neutronclient
-        obj = client.list_sfc_flow_classifiers()
-        obj_extend = self.extend_list(obj, parsed_args)
-        headers, columns = nc_osc_utils.get_column_definitions(
-            _attr_map, long_listing=parsed_args.long)
-        return (headers, (utils.get_dict_properties(
-            s, columns) for s in obj_extend))
-
 
 class SetSfcFlowClassifier(command.Command):
     _description = _("Set flow classifier properties")
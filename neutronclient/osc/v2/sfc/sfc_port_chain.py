@@ -22,6 +22,7 @@ from osc_lib import utils
 
 from neutronclient._i18n import _
 from neutronclient.osc import utils as nc_osc_utils
+from neutronclient.osc.v2 import utils as v2_utils
 
 LOG = logging.getLogger(__name__)
 
@@ -115,27 +116,13 @@ class DeleteSfcPortChain(command.Command):
             raise exceptions.CommandError(msg)
 
 
-class ListSfcPortChain(command.Lister):
+class ListSfcPortChain(v2_utils.ListCommand):
     _description = _("List port chains")
 
-    def get_parser(self, prog_name):
-        parser = super(ListSfcPortChain, self).get_parser(prog_name)
-        parser.add_argument(
-            '--long',
-            action='store_true',
-            default=False,
-            help=_("List additional fields in output")
-        )
-        return parser
-
-    def take_action(self, parsed_args):
-        client = self.app.client_manager.neutronclient
-        data = client.list_sfc_port_chains()
-        headers, columns = nc_osc_utils.get_column_definitions(
-            _attr_map, long_listing=parsed_args.long)
-        return (headers,
-                (utils.get_dict_properties(s, columns)
-                 for s in data['port_chains']))
+    list_method = 'list_sfc_port_chains'
+    resource_plural = 'port_chains'
+    _attr_map = _attr_map
+    filter_attrs = ['name', 'project']
 
 
 class SetSfcPortChain(command.Command):
@@ -188,6 +175,9 @@ class SetSfcPortChain(command.Command):
         pc_id = _get_id(client, parsed_args.port_chain, resource)
         attrs = _get_common_attrs(self.app.client_manager, parsed_args,
                                   is_create=False)
+        # Reuse the IDs resolved by _get_common_attrs
+        fc_ids = attrs.get('flow_classifiers', [])
+        ppg_ids = attrs.get('port_pair_groups', [])
         if parsed_args.no_flow_classifier:
             attrs['flow_classifiers'] = []
         if parsed_args.flow_classifiers:
@@ -197,10 +187,7 @@ class SetSfcPortChain(command.Command):
                 fc_list = client.find_resource(
                     resource, parsed_args.port_chain,
                     cmd_resource='sfc_port_chain')['flow_classifiers']
-            for fc in parsed_args.flow_classifiers:
-                fc_id = client.find_resource(
-                    'flow_classifier', fc,
-                    cmd_resource='sfc_flow_classifier')['id']
+            for fc_id in fc_ids:
                 if fc_id not in fc_list:
                     fc_list.append(fc_id)
             attrs['flow_classifiers'] = fc_list
@@ -210,10 +197,7 @@ class SetSfcPortChain(command.Command):
             raise exceptions.CommandError(message)
         if parsed_args.no_port_pair_group and parsed_args.port_pair_groups:
             ppg_list = []
-            for ppg in parsed_args.port_pair_groups:
-                ppg_id = client.find_resource(
-                    'port_pair_group', ppg,
-                    cmd_resource='sfc_port_pair_group')['id']
+            for ppg_id in ppg_ids:
                 if ppg_id not in ppg_list:
                     ppg_list.append(ppg_id)
             attrs['port_pair_groups'] = ppg_list
@@ -222,10 +206,7 @@ class SetSfcPortChain(command.Command):
             ppg_list = client.find_resource(
                 resource, parsed_args.port_chain,
                 cmd_resource='sfc_port_chain')['port_pair_groups']
-            for ppg in parsed_args.port_pair_groups:
-                ppg_id = client.find_resource(
-                    'port_pair_group', ppg,
-                    cmd_resource='sfc_port_pair_group')['id']
+            for ppg_id in ppg_ids:
                 if ppg_id not in ppg_list:
                     ppg_list.append(ppg_id)
             attrs['port_pair_groups'] = ppg_list
@@ -297,10 +278,9 @@ class UnsetSfcPortChain(command.Command):
             fc_list = client.find_resource(
                 resource, parsed_args.port_chain,
                 cmd_resource='sfc_port_chain')['flow_classifiers']
-            for fc in parsed_args.flow_classifiers:
-                fc_id = client.find_resource(
-                    'flow_classifier', fc,
-                    cmd_resource='sfc_flow_classifier')['id']
+            for fc_id in _get_ids(client, parsed_args.flow_classifiers,
+                                  'flow_classifier',
+                                  cmd_resource='sfc_flow_classifier'):
                 if fc_id in fc_list:
                     fc_list.remove(fc_id)
             attrs['flow_classifiers'] = fc_list
@@ -310,10 +290,9 @@ class UnsetSfcPortChain(command.Command):
             ppg_list = client.find_resource(
                 resource, parsed_args.port_chain,
                 cmd_resource='sfc_port_chain')['port_pair_groups']
-            for ppg in parsed_args.port_pair_groups:
-                ppg_id = client.find_resource(
-                    'port_pair_group', ppg,
-                    cmd_resource='sfc_port_pair_group')['id']
+            for ppg_id in _get_ids(client, parsed_args.port_pair_groups,
+                                   'port_pair_group',
+                                   cmd_resource='sfc_port_pair_group'):
                 if ppg_id in ppg_list:
                     ppg_list.remove(ppg_id)
             if ppg_list == []:
@@ -337,13 +316,13 @@ def _get_common_attrs(client_manager, parsed_args, is_create=True):
     if parsed_args.description is not None:
         attrs['description'] = parsed_args.description
     if parsed_args.port_pair_groups:
-        attrs['port_pair_groups'] = [(_get_id(client_manager.neutronclient,
-                                              ppg, 'port_pair_group'))
-                                     for ppg in parsed_args.port_pair_groups]
+        attrs['port_pair_groups'] = _get_ids(
+            client_manager.neutronclient, parsed_args.port_pair_groups,
+            'port_pair_group', cmd_resource='sfc_port_pair_group')
     if parsed_args.flow_classifiers:
-        attrs['flow_classifiers'] = [(_get_id(client_manager.neutronclient, fc,
-                                      'flow_classifier'))
-                                     for fc in parsed_args.flow_classifiers]
+        attrs['flow_classifiers'] = _get_ids(
+            client_manager.neutronclient, parsed_args.flow_classifiers,
+            'flow_classifier', cmd_resource='sfc_flow_classifier')
     if is_create is True:
         _get_attrs(attrs, parsed_args)
     return attrs
@@ -362,3 +341,8 @@ def _get_attrs(attrs, parsed_args):
 
 def _get_id(client, id_or_name, resource):
     return client.find_resource(resource, id_or_name)['id']
+
+
+def _get_ids(client, ids_or_names, resource, cmd_resource=None):
+    return client.find_resources(resource, ids_or_names,
+                                 cmd_resource=cmd_resource).ids()
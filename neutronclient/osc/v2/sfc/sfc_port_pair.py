@@ -22,6 +22,7 @@ from osc_lib import utils
 
 from neutronclient._i18n import _
 from neutronclient.osc import utils as nc_osc_utils
+from neutronclient.osc.v2 import utils as v2_utils
 
 LOG = logging.getLogger(__name__)
 
@@ -110,27 +111,20 @@ class DeleteSfcPortPair(command.Command):
             raise exceptions.CommandError(msg)
 
 
-class ListSfcPortPair(command.Lister):
+class ListSfcPortPair(v2_utils.ListCommand):
     _description = _("List port pairs")
 
-    def get_parser(self, prog_name):
-        parser = super(ListSfcPortPair, self).get_parser(prog_name)
-        parser.add_argument(
-            '--long',
-            action='store_true',
-            help=_("List additional fields in output")
-        )
-        return parser
-
-    def take_action(self, parsed_args):
-        client = self.app.client_manager.neutronclient
-        data = client.list_sfc_port_pairs()
-        headers, columns = nc_osc_utils.get_column_definitions(
-            _attr_map, long_listing=parsed_args.long)
-        return (headers,
-                (utils.get_dict_properties(
-                    s, columns,
-                ) for s in data['port_pairs']))
+    list_method = 'list_sfc_port_pairs'
+    resource_plural = 'port_pairs'
+    _attr_map = _attr_map
+    filter_attrs = [
+        'name',
+        'project',
+        {'name': 'ingress',
+         'help': _("List port pairs with this ingress port (ID only)")},
+        {'name': 'egress',
+         'help': _("List port pairs with this egress port (ID only)")},
+    ]
 
 
 class SetSfcPortPair(command.Command):
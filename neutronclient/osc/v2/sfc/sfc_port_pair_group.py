@@ -22,6 +22,7 @@ from osc_lib import utils
 
 from neutronclient._i18n import _
 from neutronclient.osc import utils as nc_osc_utils
+from neutronclient.osc.v2 import utils as v2_utils
 
 LOG = logging.getLogger(__name__)
 
@@ -119,28 +120,13 @@ class DeleteSfcPortPairGroup(command.Command):
             raise exceptions.CommandError(msg)
 
 
-class ListSfcPortPairGroup(command.Lister):
+class ListSfcPortPairGroup(v2_utils.ListCommand):
     _description = _("List port pair group")
 
-    def get_parser(self, prog_name):
-        parser = super(ListSfcPortPairGroup, self).get_parser(prog_name)
-        parser.add_argument(
-            '--long',
-            action='store_true',
-            default=False,
-            help=_("List additional fields in output")
-        )
-        return parser
-
-    def take_action(self, parsed_args):
-        client = self.app.client_manager.neutronclient
-        data = client.list_sfc_port_pair_groups()
-        headers, columns = nc_osc_utils.get_column_definitions(
-            _attr_map, long_listing=parsed_args.long)
-        return (headers,
-                (utils.get_dict_properties(
-                    s, columns,
-                ) for s in data['port_pair_groups']))
+    list_method = 'list_sfc_port_pair_groups'
+    resource_plural = 'port_pair_groups'
+    _attr_map = _attr_map
+    filter_attrs = ['name', 'project']
 
 
 class SetSfcPortPairGroup(command.Command):
@@ -20,6 +20,7 @@ from osc_lib import utils
 
 from neutronclient._i18n import _
 from neutronclient.osc import utils as nc_osc_utils
+from neutronclient.osc.v2 import utils as v2_utils
 
 LOG = logging.getLogger(__name__)
 
@@ -124,27 +125,13 @@ class DeleteSfcServiceGraph(command.Command):
         client.delete_sfc_service_graph(id)
 
 
-class ListSfcServiceGraph(command.Lister):
+class ListSfcServiceGraph(v2_utils.ListCommand):
     _description = _("List service graphs")
 
-    def get_parser(self, prog_name):
-        parser = super(ListSfcServiceGraph, self).get_parser(prog_name)
-        parser.add_argument(
-            '--long',
-            action='store_true',
-            default=False,
-            help=_("List additional fields in output")
-        )
-        return parser
-
-    def take_action(self, parsed_args):
-        client = self.app.client_manager.neutronclient
-        data = client.list_sfc_service_graphs()
-        headers, columns = nc_osc_utils.get_column_definitions(
-            _attr_map, long_listing=parsed_args.long)
-        return (headers,
-                (utils.get_dict_properties(s, columns)
-                 for s in data['service_graphs']))
+    list_method = 'list_sfc_service_graphs'
+    resource_plural = 'service_graphs'
+    _attr_map = _attr_map
+    filter_attrs = ['name', 'project']
 
 
 class ShowSfcServiceGraph(command.ShowOne):
@@ -179,69 +166,90 @@ def _get_common_attrs(client_manager, parsed_args, is_create=True):
     return attrs
 
 
-def _validate_destination_chains(comma_split, attrs, client_manager, sc_):
-    for e in comma_split:
-        if e != "":
-            dc_ = _get_id(client_manager.neutronclient, e, 'port_chain')
-            attrs['port_chains'][sc_].append(dc_)
-            if _check_cycle(attrs['port_chains'], sc_, dc_):
-                raise(exceptions.CommandError(
-                    "Error: Service graph contains a cycle"))
-        else:
+def _parse_branching_points(branching_points):
+    """Split SRC_CHAIN:DST_CHAIN_1,...,DST_CHAIN_N options into pairs."""
+    parsed = []
+    for c in branching_points:
+        colon_split = c.split(':')
+        if len(colon_split) != 2 or '' in colon_split[1].split(','):
             raise exceptions.CommandError(
-                "Error: you must specify at least one "
-                "destination chain for each source chain")
-    return attrs
-
-
-def _check_cycle(graph, new_src, new_dest):
-    for src in graph:
-        if src == new_dest:
-            if _visit(graph, src, new_dest, new_src):
-                return True
-    return False
-
-
-def _visit(graph, src, new_dest, new_src):
-    if src in graph:
-        found_cycle = False
-        for dest in graph[src]:
-            if new_src == dest or found_cycle:
-                return True
+                "Error: You must specify at least one "
+                "destination chain for each source chain.")
+        src_chain, dst_chains = colon_split
+        parsed.append((src_chain, dst_chains.split(',')))
+    return parsed
+
+
+def _find_cycle(graph):
+    """Return a cycle of the graph as a list of chains, or None.
+
+    The graph maps each source chain to its destination chains. Every
+    chain is visited once, so this is linear in the size of the graph.
+    """
+    visited = set()
+    for root in graph:
+        if root in visited:
+            continue
+        visited.add(root)
+        path = [root]
+        on_path = set(path)
+        stack = [iter(graph[root])]
+        while stack:
+            for chain in stack[-1]:
+                if chain in on_path:
+                    return path[path.index(chain):] + [chain]
+                if chain not in visited:
+                    visited.add(chain)
+                    path.append(chain)
+                    on_path.add(chain)
+                    stack.append(iter(graph.get(chain, ())))
+                    break
             else:
-                found_cycle = _visit(graph, dest, new_dest, new_src)
-    return False
+                stack.pop()
+                on_path.discard(path.pop())
+    return None
 
 
 def _get_attrs_for_create(client_manager, attrs, parsed_args):
     if parsed_args.branching_points:
-        attrs['port_chains'] = {}
-        src_chain = None
-        for c in parsed_args.branching_points:
-            if ':' not in c:
+        branching_points = _parse_branching_points(
+            parsed_args.branching_points)
+        chains = [src for src, dsts in branching_points]
+        for src, dsts in branching_points:
+            chains.extend(dsts)
+        # Resolve all the chains at once rather than one by one.
+        ids = dict(zip(chains, _get_ids(client_manager.neutronclient,
+                                        chains, 'port_chain',
+                                        cmd_resource='sfc_port_chain')))
+        names = {}
+        for chain in chains:
+            names.setdefault(ids[chain], chain)
+        graph = {}
+        for src_chain, dst_chains in branching_points:
+            sc_ = ids[src_chain]
+            if sc_ in graph:
                 raise exceptions.CommandError(
-                    "Error: You must specify at least one "
-                    "destination chain for each source chain.")
-            colon_split = c.split(':')
-            src_chain = colon_split.pop(0)
-            sc_ = _get_id(client_manager.neutronclient,
-                          src_chain, 'port_chain')
-            for i in colon_split:
-                comma_split = i.split(',')
-                unique = set(comma_split)
-                if len(unique) != len(comma_split):
-                    raise exceptions.CommandError(
-                        "Error: Duplicate "
-                        "destination chains from "
-                        "source chain {}".format(src_chain))
-                if sc_ in attrs['port_chains']:
-                    raise exceptions.CommandError(
-                        "Error: Source chain {} is in "
-                        "use already ".format(src_chain))
-                attrs['port_chains'][sc_] = []
-                _validate_destination_chains(
-                    comma_split, attrs, client_manager, sc_)
+                    "Error: Source chain {} is in "
+                    "use already ".format(src_chain))
+            dcs = [ids[dst_chain] for dst_chain in dst_chains]
+            if len(set(dcs)) != len(dcs):
+                raise exceptions.CommandError(
+                    "Error: Duplicate "
+                    "destination chains from "
+                    "source chain {}".format(src_chain))
+            graph[sc_] = dcs
+        cycle = _find_cycle(graph)
+        if cycle:
+            raise exceptions.CommandError(
+                "Error: Service graph contains a cycle: {}".format(
+                    ' -> '.join(names[chain] for chain in cycle)))
+        attrs['port_chains'] = graph
 
 
 def _get_id(client, id_or_name, resource):
     return client.find_resource(resource, id_or_name)['id']
+
+
+def _get_ids(client, ids_or_names, resource, cmd_resource=None):
+    return client.find_resources(resource, ids_or_names,
+                                 cmd_resource=cmd_resource).ids()
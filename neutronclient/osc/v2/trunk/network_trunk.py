@@ -33,6 +33,11 @@ TRUNK = 'trunk'
 TRUNKS = 'trunks'
 SUB_PORTS = 'sub_ports'
 
+_formatters = {
+    'admin_state_up': v2_utils.AdminStateColumn,
+    'sub_ports': format_columns.ListDictColumn,
+}
+
 
 class CreateNetworkTrunk(command.ShowOne):
     """Create a network trunk for a given project"""
@@ -124,52 +129,30 @@ class DeleteNetworkTrunk(command.Command):
             raise exceptions.CommandError(msg)
 
 
-class ListNetworkTrunk(command.Lister):
+class ListNetworkTrunk(v2_utils.ListCommand):
     """List all network trunks"""
 
-    def get_parser(self, prog_name):
-        parser = super(ListNetworkTrunk, self).get_parser(prog_name)
-        parser.add_argument(
-            '--long',
-            action='store_true',
-            default=False,
-            help=_("List additional fields in output")
-        )
-        return parser
-
-    def take_action(self, parsed_args):
-        client = self.app.client_manager.neutronclient
-        data = client.list_trunks()
-        headers = (
-            'ID',
-            'Name',
-            'Parent Port',
-            'Description'
-        )
-        columns = (
-            'id',
-            'name',
-            'port_id',
-            'description'
-        )
-        if parsed_args.long:
-            headers += (
-                'Status',
-                'State',
-                'Created At',
-                'Updated At',
-            )
-            columns += (
-                'status',
-                'admin_state_up',
-                'created_at',
-                'updated_at'
-            )
-        return (headers,
-                (osc_utils.get_dict_properties(
-                    s, columns,
-                    formatters=_formatters,
-                ) for s in data[TRUNKS]))
+    list_method = 'list_trunks'
+    resource_plural = TRUNKS
+    _attr_map = (
+        ('id', 'ID', nc_osc_utils.LIST_BOTH),
+        ('name', 'Name', nc_osc_utils.LIST_BOTH),
+        ('port_id', 'Parent Port', nc_osc_utils.LIST_BOTH),
+        ('description', 'Description', nc_osc_utils.LIST_BOTH),
+        ('status', 'Status', nc_osc_utils.LIST_LONG_ONLY),
+        ('admin_state_up', 'State', nc_osc_utils.LIST_LONG_ONLY),
+        ('created_at', 'Created At', nc_osc_utils.LIST_LONG_ONLY),
+        ('updated_at', 'Updated At', nc_osc_utils.LIST_LONG_ONLY),
+    )
+    _formatters = _formatters
+    filter_attrs = [
+        'name',
+        'project',
+        {'name': 'port_id',
+         'help': _("List trunks with this parent port (ID only)")},
+        {'name': 'status',
+         'help': _("List trunks with this status")},
+    ]
 
 
 class SetNetworkTrunk(command.Command):
@@ -310,12 +293,6 @@ class UnsetNetworkTrunk(command.Command):
         client.trunk_remove_subports(trunk_id, attrs)
 
 
-_formatters = {
-    'admin_state_up': v2_utils.AdminStateColumn,
-    'sub_ports': format_columns.ListDictColumn,
-}
-
-
 def _get_columns(item):
     return tuple(sorted(list(item.keys())))
 
@@ -16,9 +16,185 @@
 to Networking v2 API and its extensions.
 """
 
+import functools
+import itertools
+
 from cliff import columns as cliff_columns
+from osc_lib.command import command
+from osc_lib import utils
+import six
+
+from neutronclient._i18n import _
+from neutronclient.common import utils as nc_utils
+from neutronclient.osc import utils as nc_osc_utils
 
 
 class AdminStateColumn(cliff_columns.FormattableColumn):
     def human_readable(self):
         return 'UP' if self._value else 'DOWN'
+
+
+def add_pagination_argument(parser, resources):
+    parser.add_argument(
+        '--limit',
+        metavar='<num>', type=int,
+        help=_("Maximum number of %s to list") % resources)
+    parser.add_argument(
+        '--marker',
+        metavar='<id>',
+        help=_("List the %s following the one with this ID") % resources)
+
+
+def add_sorting_argument(parser):
+    parser.add_argument(
+        '--sort-key',
+        dest='sort_key', metavar='<field>',
+        action='append', default=[],
+        help=_("Sort the list by this field. Repeat option to sort by "
+               "several fields"))
+    parser.add_argument(
+        '--sort-dir',
+        dest='sort_dir', metavar='{asc,desc}',
+        action='append', default=[], choices=['asc', 'desc'],
+        help=_("Sort direction of the corresponding --sort-key, "
+               "asc by default. Repeat option for each sort key"))
+
+
+class ListCommand(command.Lister):
+    """Base class of the list commands of Networking v2 resources.
+
+    It adds the ``--long``, pagination, sorting and filtering options, only
+    requests the attributes shown and passes the resources on to the
+    formatter page by page, as they are received.
+    """
+
+    # Name of the client method listing the resources, e.g. 'list_trunks'.
+    list_method = None
+    # Key of the resources in the response body, e.g. 'trunks'.
+    resource_plural = None
+    _attr_map = ()
+    _formatters = {}
+    # Columns computed on the client side, see get_list_fields().
+    _computed_fields = {}
+
+    # Attributes the resources can be filtered on. Each element is either
+    # the name of an attribute defined in default_attr_defs or a dict:
+    # {'name': attribute name, (mandatory)
+    #  'help': help message for CLI (mandatory)
+    #  'boolean': boolean parameter or not. (Default: False) (optional)
+    #  'argparse_kwargs': a dict of parameters passed to
+    #                     argparse add_argument()
+    #                     (Default: {}) (optional)
+    # }
+    # 'project' adds --project and --project-domain, filtering on the
+    # project resolved through the Identity service.
+    filter_attrs = []
+
+    default_attr_defs = {
+        'name': {
+            'help': _("List %s according to their name"),
+        },
+        'description': {
+            'help': _("List %s according to their description"),
+        },
+    }
+
+    def get_parser(self, prog_name):
+        parser = super(ListCommand, self).get_parser(prog_name)
+        resources = self.resource_plural.replace('_', ' ')
+        parser.add_argument(
+            '--long',
+            action='store_true',
+            default=False,
+            help=_("List additional fields in output")
+        )
+        add_pagination_argument(parser, resources)
+        add_sorting_argument(parser)
+        self.add_filtering_arguments(parser, resources)
+        return parser
+
+    def add_filtering_arguments(self, parser, resources):
+        for attr in self.filter_attrs:
+            if attr == 'project':
+                nc_osc_utils.add_project_owner_option_to_parser(parser)
+                continue
+            if isinstance(attr, six.string_types):
+                attr_name = attr
+                attr_defs = self.default_attr_defs[attr]
+            else:
+                attr_name = attr['name']
+                attr_defs = attr
+            params = attr_defs.get('argparse_kwargs', {})
+            try:
+                help_msg = attr_defs['help'] % resources
+            except TypeError:
+                help_msg = attr_defs['help']
+            if attr_defs.get('boolean', False):
+                add_arg_func = functools.partial(nc_utils.add_boolean_argument,
+                                                 parser)
+            else:
+                add_arg_func = parser.add_argument
+            add_arg_func('--%s' % attr_name.replace('_', '-'),
+                         help=help_msg, **params)
+
+    def args2search_opts(self, parsed_args):
+        search_opts = {'fields': nc_osc_utils.get_list_fields(
+            self._attr_map, parsed_args.long,
+            computed=self._computed_fields)}
+        for attr in self.filter_attrs:
+            if attr == 'project':
+                if parsed_args.project is not None:
+                    search_opts['tenant_id'] = nc_osc_utils.find_project(
+                        self.app.client_manager.identity,
+                        parsed_args.project,
+                        parsed_args.project_domain,
+                    ).id
+                continue
+            if isinstance(attr, six.string_types):
+                attr_name = attr
+            else:
+                attr_name = attr['name']
+            value = getattr(parsed_args, attr_name, None)
+            if value is not None:
+                search_opts[attr_name] = value
+        if parsed_args.limit:
+            search_opts['limit'] = parsed_args.limit
+        if parsed_args.marker:
+            search_opts['marker'] = parsed_args.marker
+        keys = parsed_args.sort_key
+        if keys:
+            dirs = parsed_args.sort_dir[:len(keys)]
+            dirs += ['asc'] * (len(keys) - len(dirs))
+            search_opts.update({'sort_key': keys, 'sort_dir': dirs})
+        return search_opts
+
+    def call_server(self, client, search_opts, parsed_args):
+        """Return an iterator over the pages of the listing."""
+        obj_lister = getattr(client, self.list_method)
+        return obj_lister(retrieve_all=False, **search_opts)
+
+    def retrieve_list(self, parsed_args):
+        client = self.app.client_manager.neutronclient
+        search_opts = self.args2search_opts(parsed_args)
+        pages = self.call_server(client, search_opts, parsed_args)
+        data = itertools.chain.from_iterable(
+            page[self.resource_plural] for page in pages)
+        if parsed_args.limit:
+            # Do not request the following pages.
+            data = itertools.islice(data, parsed_args.limit)
+        return data
+
+    def extend_item(self, item, parsed_args):
+        """Update a retrieved resource before it is formatted.
+
+        This allows to add columns computed on the client side.
+        """
+        return item
+
+    def take_action(self, parsed_args):
+        data = self.retrieve_list(parsed_args)
+        headers, columns = nc_osc_utils.get_column_definitions(
+            self._attr_map, long_listing=parsed_args.long)
+        return (headers, (utils.get_dict_properties(
+            self.extend_item(s, parsed_args), columns,
+            formatters=self._formatters) for s in data))
@@ -21,6 +21,7 @@ from oslo_log import log as logging
 
 from neutronclient._i18n import _
 from neutronclient.osc import utils as osc_utils
+from neutronclient.osc.v2 import utils as v2_utils
 
 
 LOG = logging.getLogger(__name__)
@@ -138,25 +139,18 @@ class DeleteEndpointGroup(command.Command):
             raise exceptions.CommandError(msg)
 
 
-class ListEndpointGroup(command.Lister):
+class ListEndpointGroup(v2_utils.ListCommand):
     _description = _("List endpoint groups that belong to a given project")
 
-    def get_parser(self, prog_name):
-        parser = super(ListEndpointGroup, self).get_parser(prog_name)
-        parser.add_argument(
-            '--long',
-            action='store_true',
-            default=False,
-            help=_("List additional fields in output")
-        )
-        return parser
-
-    def take_action(self, parsed_args):
-        client = self.app.client_manager.neutronclient
-        obj = client.list_endpoint_groups()['endpoint_groups']
-        headers, columns = osc_utils.get_column_definitions(
-            _attr_map, long_listing=parsed_args.long)
-        return (headers, (utils.get_dict_properties(s, columns) for s in obj))
+    list_method = 'list_endpoint_groups'
+    resource_plural = 'endpoint_groups'
+    _attr_map = _attr_map
+    filter_attrs = [
+        'name',
+        'project',
+        {'name': 'type',
+         'help': _("List endpoint groups of this type")},
+    ]
 
 
 class SetEndpointGroup(command.Command):
@@ -22,6 +22,7 @@ from oslo_log import log as logging
 from neutronclient._i18n import _
 from neutronclient.common import utils as nc_utils
 from neutronclient.osc import utils as osc_utils
+from neutronclient.osc.v2 import utils as v2_utils
 from neutronclient.osc.v2.vpnaas import utils as vpn_utils
 
 
@@ -168,24 +169,13 @@ class DeleteIKEPolicy(command.Command):
             raise exceptions.CommandError(msg)
 
 
-class ListIKEPolicy(command.Lister):
+class ListIKEPolicy(v2_utils.ListCommand):
     _description = _("List IKE policies that belong to a given project")
 
-    def get_parser(self, prog_name):
-        parser = super(ListIKEPolicy, self).get_parser(prog_name)
-        parser.add_argument(
-            '--long',
-            action='store_true',
-            help=_("List additional fields in output")
-        )
-        return parser
-
-    def take_action(self, parsed_args):
-        client = self.app.client_manager.neutronclient
-        obj = client.list_ikepolicies()['ikepolicies']
-        headers, columns = osc_utils.get_column_definitions(
-            _attr_map, long_listing=parsed_args.long)
-        return (headers, (utils.get_dict_properties(s, columns) for s in obj))
+    list_method = 'list_ikepolicies'
+    resource_plural = 'ikepolicies'
+    _attr_map = _attr_map
+    filter_attrs = ['name', 'project']
 
 
 class SetIKEPolicy(command.Command):
@@ -23,6 +23,7 @@ from oslo_log import log as logging
 from neutronclient._i18n import _
 from neutronclient.common import utils as nc_utils
 from neutronclient.osc import utils as osc_utils
+from neutronclient.osc.v2 import utils as v2_utils
 from neutronclient.osc.v2.vpnaas import utils as vpn_utils
 
 
@@ -279,27 +280,23 @@ class DeleteIPsecSiteConnection(command.Command):
             raise exceptions.CommandError(msg)
 
 
-class ListIPsecSiteConnection(command.Lister):
+class ListIPsecSiteConnection(v2_utils.ListCommand):
     _description = _("List IPsec site connections "
                      "that belong to a given project")
 
-    def get_parser(self, prog_name):
-        parser = super(ListIPsecSiteConnection, self).get_parser(prog_name)
-        parser.add_argument(
-            '--long',
-            action='store_true',
-            default=False,
-            help=_("List additional fields in output")
-        )
-        return parser
-
-    def take_action(self, parsed_args):
-        client = self.app.client_manager.neutronclient
-        obj = client.list_ipsec_site_connections()['ipsec_site_connections']
-        headers, columns = osc_utils.get_column_definitions(
-            _attr_map, long_listing=parsed_args.long)
-        return (headers, (utils.get_dict_properties(
-            s, columns, formatters=_formatters) for s in obj))
+    list_method = 'list_ipsec_site_connections'
+    resource_plural = 'ipsec_site_connections'
+    _attr_map = _attr_map
+    _formatters = _formatters
+    filter_attrs = [
+        'name',
+        'project',
+        {'name': 'vpnservice_id',
+         'help': _("List IPsec site connections of this VPN service "
+                   "(ID only)")},
+        {'name': 'status',
+         'help': _("List IPsec site connections with this status")},
+    ]
 
 
 class SetIPsecSiteConnection(command.Command):
@@ -21,6 +21,7 @@ from oslo_log import log as logging
 
 from neutronclient._i18n import _
 from neutronclient.osc import utils as osc_utils
+from neutronclient.osc.v2 import utils as v2_utils
 
 
 LOG = logging.getLogger(__name__)
@@ -159,25 +160,22 @@ class DeleteVPNService(command.Command):
             raise exceptions.CommandError(msg)
 
 
-class ListVPNService(command.Lister):
+class ListVPNService(v2_utils.ListCommand):
     _description = _("List VPN services that belong to a given project")
 
-    def get_parser(self, prog_name):
-        parser = super(ListVPNService, self).get_parser(prog_name)
-        parser.add_argument(
-            '--long',
-            action='store_true',
-            default=False,
-            help=_("List additional fields in output")
-        )
-        return parser
-
-    def take_action(self, parsed_args):
-        client = self.app.client_manager.neutronclient
-        obj = client.list_vpnservices()['vpnservices']
-        headers, columns = osc_utils.get_column_definitions(
-            _attr_map, long_listing=parsed_args.long)
-        return (headers, (utils.get_dict_properties(s, columns) for s in obj))
+    list_method = 'list_vpnservices'
+    resource_plural = 'vpnservices'
+    _attr_map = _attr_map
+    filter_attrs = [
+        'name',
+        'project',
+        {'name': 'router_id',
+         'help': _("List VPN services of this router (ID only)")},
+        {'name': 'subnet_id',
+         'help': _("List VPN services of this subnet (ID only)")},
+        {'name': 'status',
+         'help': _("List VPN services with this status")},
+    ]
 
 
 class SetVPNSercice(command.Command):
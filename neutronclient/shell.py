@@ -21,16 +21,24 @@ Command-line interface to the Neutron APIs
 from __future__ import print_function
 
 import argparse
+from concurrent import futures
 import inspect
 import itertools
 import logging
 import os
+import shlex
 import sys
 
+try:
+    from collections import abc as collections_abc
+except ImportError:  # Python 2
+    import collections as collections_abc
+
 from keystoneauth1 import session
-import os_client_config
+from oslo_serialization import jsonutils
 from oslo_utils import encodeutils
 from oslo_utils import netutils
+import six
 
 from cliff import app
 from cliff import command
@@ -38,9 +46,11 @@ from cliff import commandmanager
 
 from neutronclient._i18n import _
 from neutronclient.common import clientmanager
+from neutronclient.common import completion
 from neutronclient.common import exceptions as exc
 from neutronclient.common import extension as client_extension
-from neutronclient.neutron.v2_0 import subnet
+from neutronclient.common import metrics
+from neutronclient.common import token_cache
 from neutronclient.version import __version__
 
 
@@ -51,6 +61,10 @@ NAMESPACE_MAP = {NEUTRON_API_VERSION: 'neutron.cli.v2'}
 
 
 def run_command(cmd, cmd_parser, sub_argv):
+    # NOTE: imported here so that only the module of the command being run
+    # is loaded when the shell starts.
+    from neutronclient.neutron.v2_0 import subnet
+
     _argv = sub_argv
     index = -1
     values_specs = []
@@ -103,15 +117,115 @@ def check_non_negative_int(value):
     return value
 
 
+def check_positive_int(value):
+    try:
+        value = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(_("invalid int value: %r") % value)
+    if value < 1:
+        raise argparse.ArgumentTypeError(_("input value %d is not positive") %
+                                         value)
+    return value
+
+
 COMMANDS = {}
 
 
+class _CommandsDict(collections_abc.Mapping):
+    """Read-only mapping of command names to command classes.
+
+    A command class is only imported when it is looked up.
+    """
+
+    def __init__(self, command_manager):
+        self._command_manager = command_manager
+
+    def __getitem__(self, name):
+        if name not in self._command_manager.commands:
+            raise KeyError(name)
+        return self._command_manager.find_command([name])[0]
+
+    def __iter__(self):
+        return iter(self._command_manager.commands)
+
+    def __len__(self):
+        return len(self._command_manager.commands)
+
+
 # NOTE(amotoki): This is only to provide compatibility
 # to existing neutron CLI extensions. See bug 1706573 for detail.
 def _set_commands_dict_for_compat(apiversion, command_manager):
     global COMMANDS
-    COMMANDS = {apiversion: dict((cmd, command_manager.find_command([cmd])[0])
-                                 for cmd in command_manager.commands)}
+    COMMANDS = {apiversion: _CommandsDict(command_manager)}
+
+
+class NeutronCommandManager(commandmanager.CommandManager):
+    """Command manager loading the client extensions on demand.
+
+    The commands of the ``neutron.cli.v2`` namespace are only imported when
+    they are run. The ``neutronclient.extension`` plugins are imported the
+    first time a command is not found among them, or when all the commands
+    are listed.
+    """
+
+    def __init__(self, namespace, version):
+        self.version = version
+        self._extensions_loaded = False
+        super(NeutronCommandManager, self).__init__(namespace)
+
+    def load_extensions(self):
+        if self._extensions_loaded:
+            return
+        self._extensions_loaded = True
+        for name, module in itertools.chain(
+                client_extension._discover_via_entry_points()):
+            self._extend_commands(name, module)
+
+    def _extend_commands(self, name, module):
+        classes = inspect.getmembers(module, inspect.isclass)
+        for cls_name, cls in classes:
+            if (issubclass(cls, client_extension.NeutronClientExtension) and
+                    hasattr(cls, 'shell_command')):
+                cmd = cls.shell_command
+                if hasattr(cls, 'versions'):
+                    if self.version not in cls.versions:
+                        continue
+                try:
+                    name_prefix = "[%s]" % name
+                    cls.__doc__ = ("%s %s" % (name_prefix, cls.__doc__) if
+                                   cls.__doc__ else name_prefix)
+                    self.add_command(cmd, cls)
+                except TypeError:
+                    pass
+
+    def has_command(self, name):
+        if name not in self.commands:
+            self.load_extensions()
+        return name in self.commands
+
+    def find_command(self, argv):
+        try:
+            return super(NeutronCommandManager, self).find_command(argv)
+        except ValueError:
+            if self._extensions_loaded:
+                raise
+            self.load_extensions()
+            return super(NeutronCommandManager, self).find_command(argv)
+
+    def __iter__(self):
+        self.load_extensions()
+        return super(NeutronCommandManager, self).__iter__()
+
+
+class _BatchApp(object):
+    """Stand-in for the shell giving a batch command its own output."""
+
+    def __init__(self, shell, stdout):
+        self._shell = shell
+        self.stdout = stdout
+
+    def __getattr__(self, name):
+        return getattr(self._shell, name)
 
 
 class BashCompletionCommand(command.Command):
@@ -165,9 +279,7 @@ class NeutronShell(app.App):
         super(NeutronShell, self).__init__(
             description=description,
             version=VERSION,
-            command_manager=commandmanager.CommandManager(namespace), )
-
-        self._register_extensions(VERSION)
+            command_manager=NeutronCommandManager(namespace, VERSION), )
 
         # Pop the 'complete' to correct the outputs of 'neutron help'.
         self.command_manager.commands.pop('complete')
@@ -175,6 +287,10 @@ class NeutronShell(app.App):
         # This is instantiated in initialize_app() only when using
         # password flow auth
         self.auth_client = None
+        # Set by authenticate_user() when the token cache is used.
+        self._token_cache = None
+        # Set by authenticate_user() with --timing.
+        self._metrics = None
         self.api_version = apiversion
 
         _set_commands_dict_for_compat(apiversion, self.command_manager)
@@ -223,6 +339,28 @@ class NeutronShell(app.App):
             default=0,
             help=_("How many times the request to the Neutron server should "
                    "be retried if it fails."))
+        parser.add_argument(
+            '--batch',
+            metavar='FILE',
+            help=_("Run the commands read from FILE, or from the standard "
+                   "input if FILE is '-', one per line. They share a single "
+                   "authenticated session and the result of each one is "
+                   "printed as a line of JSON."))
+        parser.add_argument(
+            '--parallel',
+            metavar='N',
+            type=check_positive_int,
+            default=1,
+            help=_("Number of commands run at the same time with --batch, "
+                   "1 by default. Only use it if the commands do not depend "
+                   "on each other."))
+        parser.add_argument(
+            '--timing',
+            action='store_true',
+            default=False,
+            help=_("Print the number, duration and size of the requests "
+                   "sent to the Networking service, per method and path, "
+                   "to the standard error once done."))
         # FIXME(bklei): this method should come from keystoneauth1
         self._append_global_identity_args(parser)
 
@@ -432,42 +570,44 @@ class NeutronShell(app.App):
                    "not be verified against any certificate authorities. "
                    "This option should be used with caution."))
 
-    def _bash_completion(self):
-        """Prints all of the commands and options for bash-completion."""
-        commands = set()
-        options = set()
-        for option, _action in self.parser._option_string_actions.items():
-            options.add(option)
+        parser.add_argument(
+            '--token-cache',
+            action='store_true',
+            default=env('NEUTRONCLIENT_TOKEN_CACHE', default=False),
+            help=_("Save the Keystone token under ~/.neutronclient/tokens "
+                   "and reuse it in the next invocations until it expires. "
+                   "Defaults to env[NEUTRONCLIENT_TOKEN_CACHE]."))
+
+    def _build_completion_index(self):
+        options = sorted(self.parser._option_string_actions)
+        commands = {}
         for _name, _command in self.command_manager:
-            commands.add(_name)
             cmd_factory = _command.load()
             cmd = cmd_factory(self, None)
             cmd_parser = cmd.get_parser('')
-            for option, _action in cmd_parser._option_string_actions.items():
-                options.add(option)
-        print(' '.join(commands | options))
+            commands[_name] = sorted(cmd_parser._option_string_actions)
+        return {'options': options, 'commands': commands}
 
-    def _register_extensions(self, version):
-        for name, module in itertools.chain(
-                client_extension._discover_via_entry_points()):
-            self._extend_shell_commands(name, module, version)
+    def _bash_completion(self, argv=None):
+        """Prints all of the commands and options for bash-completion.
 
-    def _extend_shell_commands(self, name, module, version):
-        classes = inspect.getmembers(module, inspect.isclass)
-        for cls_name, cls in classes:
-            if (issubclass(cls, client_extension.NeutronClientExtension) and
-                    hasattr(cls, 'shell_command')):
-                cmd = cls.shell_command
-                if hasattr(cls, 'versions'):
-                    if version not in cls.versions:
-                        continue
-                try:
-                    name_prefix = "[%s]" % name
-                    cls.__doc__ = ("%s %s" % (name_prefix, cls.__doc__) if
-                                   cls.__doc__ else name_prefix)
-                    self.command_manager.add_command(cmd, cls)
-                except TypeError:
-                    pass
+        When a command is given, only its options are printed.
+        """
+        index = completion.get_index(self.api_version,
+                                     self._build_completion_index)
+        if argv and argv[0] in index['commands']:
+            print(' '.join(index['commands'][argv[0]]))
+            return
+        words = set(index['options']) | set(index['commands'])
+        for options in index['commands'].values():
+            words.update(options)
+        print(' '.join(words))
+
+    def _options_with_values(self):
+        """Return the global options followed by a separate value."""
+        return set(option for action in self.parser._actions
+                   if action.nargs != 0
+                   for option in action.option_strings)
 
     def run(self, argv):
         """Equivalent to the main program for the application.
@@ -480,28 +620,48 @@ class NeutronShell(app.App):
             command_pos = -1
             help_pos = -1
             help_command_pos = -1
+            value_options = self._options_with_values()
+            is_value = False
+            candidates = []
             for arg in argv:
-                if arg == 'bash-completion' and help_command_pos == -1:
-                    self._bash_completion()
+                if is_value:
+                    # Value of a global option, not a command.
+                    is_value = False
+                elif arg == 'bash-completion' and help_command_pos == -1:
+                    self._bash_completion(argv[index + 1:])
                     return 0
-                if arg in ('-h', '--help'):
+                elif arg in ('-h', '--help'):
                     if help_pos == -1:
                         help_pos = index
+                elif arg.startswith('-'):
+                    is_value = command_pos == -1 and arg in value_options
                 # self.command_manager.commands contains 'help',
                 # so we need to check this first.
                 elif arg == 'help':
                     if help_command_pos == -1:
                         help_command_pos = index
-                elif arg in self.command_manager.commands:
-                    if command_pos == -1:
+                elif command_pos == -1:
+                    # Only look for built-in commands at first, the
+                    # extensions are loaded if none of them matches.
+                    if arg in self.command_manager.commands:
                         command_pos = index
+                    else:
+                        candidates.append(index)
                 index = index + 1
+            if command_pos == -1:
+                for candidate in candidates:
+                    if self.command_manager.has_command(argv[candidate]):
+                        command_pos = candidate
+                        break
             if command_pos > -1 and help_pos > command_pos:
                 argv = ['help', argv[command_pos]]
             if help_command_pos > -1 and command_pos == -1:
                 argv[help_command_pos] = '--help'
             self.options, remainder = self.parser.parse_known_args(argv)
             self.configure_logging()
+            if self.options.batch and remainder:
+                raise exc.CommandError(
+                    _("No command can be given with --batch"))
             self.interactive_mode = not remainder
             self.initialize_app(remainder)
         except Exception as err:
@@ -511,11 +671,81 @@ class NeutronShell(app.App):
             else:
                 self.log.error(err)
             return 1
-        if self.interactive_mode:
-            _argv = [sys.argv[0]]
-            sys.argv = _argv
-            return self.interact()
-        return self.run_subcommand(remainder)
+        try:
+            if self.options.batch:
+                return self.run_batch(self.options.batch,
+                                      self.options.parallel)
+            if self.interactive_mode:
+                _argv = [sys.argv[0]]
+                sys.argv = _argv
+                return self.interact()
+            return self.run_subcommand(remainder)
+        finally:
+            self._save_cached_token()
+            self._print_timing()
+
+    def run_batch(self, path, parallel=1):
+        """Run the commands read from a file, one per line.
+
+        Blank lines and lines starting with '#' are skipped. For each
+        command, a JSON object is printed on its own line, in the order of
+        the commands, with the number of the line, the command, its exit
+        status, its output and its error message if it failed.
+
+        :param path: path of the file, '-' for the standard input.
+        :param parallel: number of commands run at the same time.
+        :returns: 0 if all the commands succeeded, 1 otherwise.
+        """
+        if path == '-':
+            return self._run_batch(self.stdin, parallel)
+        with open(path) as f:
+            return self._run_batch(f, parallel)
+
+    def _run_batch(self, lines, parallel):
+        commands = ((number, line.strip())
+                    for number, line in enumerate(lines, 1)
+                    if line.strip() and not line.strip().startswith('#'))
+        if parallel > 1:
+            # Create the client before the threads share it.
+            self.client_manager.neutron
+            with futures.ThreadPoolExecutor(max_workers=parallel) as executor:
+                return self._print_batch_results(executor.map(
+                    lambda command: self._run_batch_command(*command),
+                    commands))
+        return self._print_batch_results(
+            self._run_batch_command(number, line)
+            for number, line in commands)
+
+    def _print_batch_results(self, results):
+        failed = False
+        for result in results:
+            failed = failed or result['status'] != 0
+            self.stdout.write(jsonutils.dumps(result) + '\n')
+            self.stdout.flush()
+        return 1 if failed else 0
+
+    def _run_batch_command(self, number, line):
+        result = {'line': number, 'command': line, 'error': None}
+        stdout = six.StringIO()
+        try:
+            argv = shlex.split(line)
+            cmd_factory, cmd_name, sub_argv = (
+                self.command_manager.find_command(argv))
+            cmd = cmd_factory(_BatchApp(self, stdout), self.options)
+            self.prepare_to_run_command(cmd)
+            cmd_parser = cmd.get_parser(cmd_name)
+            result['status'] = run_command(cmd, cmd_parser, sub_argv) or 0
+        except SystemExit as e:
+            # argparse exits on invalid arguments, after printing the usage.
+            result['status'] = e.code
+            if e.code:
+                result['error'] = _("Invalid arguments")
+        except Exception as e:
+            self.log.debug("Batch command %d failed", number, exc_info=True)
+            result['status'] = 1
+            result['error'] = encodeutils.exception_to_unicode(e)
+        result['output'] = stdout.getvalue()
+        return result
 
     def run_subcommand(self, argv):
         subcommand = self.command_manager.find_command(argv)
@@ -546,6 +776,10 @@ class NeutronShell(app.App):
         Make sure the user has provided all of the authentication
         info we need.
         """
+        # NOTE: os_client_config takes a while to import and is not needed
+        # to show help messages.
+        import os_client_config
+
         cloud_config = os_client_config.OpenStackConfig().get_one_cloud(
             cloud=self.options.os_cloud, argparse=self.options,
             network_api_version=self.api_version,
@@ -567,10 +801,14 @@ class NeutronShell(app.App):
             auth_session = session.Session(
                 auth=auth, verify=verify, cert=cert,
                 timeout=self.options.http_timeout)
+            if self.options.token_cache:
+                self._load_cached_token(auth, auth_session, cloud_config)
 
         interface = self.options.os_endpoint_type or self.endpoint_type
         if interface.endswith('URL'):
             interface = interface[:-3]
+        if self.options.timing:
+            self._metrics = metrics.RequestMetrics()
         self.client_manager = clientmanager.ClientManager(
             retries=self.options.retries,
             raise_errors=False,
@@ -584,9 +822,46 @@ class NeutronShell(app.App):
             endpoint_type=interface,
             auth=auth,
             insecure=not verify,
-            log_credentials=True)
+            log_credentials=True,
+            metrics=self._metrics)
         return
 
+    def _load_cached_token(self, auth, auth_session, cloud_config):
+        """Reuse the token saved by a previous invocation.
+
+        If there is none, authenticate now with the cache locked and save
+        the token for the next invocations.
+        """
+        if not hasattr(auth, 'get_auth_state'):
+            return
+        cache = token_cache.TokenCache()
+        key = token_cache.cache_key(
+            region_name=cloud_config.get_region_name(),
+            auth_type=cloud_config.config.get('auth_type'),
+            **cloud_config.config.get('auth', {}))
+        with cache.lock(key):
+            auth_state = cache.get(key)
+            if auth_state is not None:
+                auth.set_auth_state(auth_state)
+            else:
+                auth.get_access(auth_session)
+                auth_state = auth.get_auth_state()
+                cache.set(key, auth_state)
+        self._token_cache = (cache, key, auth, auth_state)
+
+    def _print_timing(self):
+        if self._metrics is not None:
+            self.stderr.write(self._metrics.format_summary() + '\n')
+
+    def _save_cached_token(self):
+        """Save the token again if it was renewed, e.g. after a 401."""
+        if self._token_cache is None:
+            return
+        cache, key, auth, auth_state = self._token_cache
+        new_auth_state = auth.get_auth_state()
+        if new_auth_state and new_auth_state != auth_state:
+            cache.set(key, new_auth_state)
+
     def initialize_app(self, argv):
         """Global app init bits:
 
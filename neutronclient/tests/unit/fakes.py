@@ -0,0 +1,40 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Fake Keystone tokens shared by the unit tests."""
+
+import datetime
+import json
+
+from keystoneauth1 import fixture
+
+
+AUTH_URL = 'http://keystone.test:5000/v2.0'
+ENDPOINT_URL = 'http://neutron.test:9696'
+REGION = 'RegionOne'
+
+
+def token_body(token_id, expires_in=3600):
+    """Return a Keystone v2 token with a network endpoint."""
+    token = fixture.V2Token(
+        token_id=token_id,
+        expires=datetime.datetime.utcnow() +
+        datetime.timedelta(seconds=expires_in))
+    service = token.add_service('network')
+    service.add_endpoint(ENDPOINT_URL, region=REGION)
+    return token
+
+
+def auth_state(token_id, expires_in=3600):
+    """Return the keystoneauth authentication state of a token."""
+    return json.dumps({'auth_token': token_id,
+                       'body': token_body(token_id, expires_in)})
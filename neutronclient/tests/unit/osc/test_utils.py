@@ -43,6 +43,19 @@ class TestUtils(testtools.TestCase):
         self.assertEqual(['id', 'tenant_id', 'name'], columns)
         self.assertEqual(['ID', 'Project', 'Name'], headers)
 
+    def test_get_list_fields(self):
+        attr_map = (
+            ('id', 'ID', utils.LIST_BOTH),
+            ('tenant_id', 'Project', utils.LIST_LONG_ONLY),
+            ('name', 'Name', utils.LIST_BOTH),
+            ('summary', 'Summary', utils.LIST_SHORT_ONLY),
+        )
+        computed = {'summary': ['protocol', 'name']}
+        self.assertEqual(['id', 'name', 'protocol'],
+                         utils.get_list_fields(attr_map, False, computed))
+        self.assertEqual(['id', 'tenant_id', 'name'],
+                         utils.get_list_fields(attr_map, True, computed))
+
     def test_get_columns(self):
         item = {
             'id': 'test-id',
@@ -41,7 +41,8 @@ class TestListBgpSpeaker(fakes.TestNeutronDynamicRoutingOSCV2):
         parsed_args = self.check_parser(self.cmd, [], [])
 
         columns, data = self.cmd.take_action(parsed_args)
-        self.neutronclient.list_bgp_speakers.assert_called_once_with()
+        self.neutronclient.list_bgp_speakers.assert_called_once_with(
+            fields=['id', 'name', 'local_as', 'ip_version'])
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.data, list(data))
 
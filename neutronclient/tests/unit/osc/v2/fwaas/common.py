@@ -14,6 +14,7 @@
 #    under the License.
 #
 
+import mock
 import testtools
 
 from osc_lib import exceptions
@@ -30,7 +31,8 @@ class TestListFWaaS(test_fakes.TestNeutronClientOSCV2):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(
+            retrieve_all=False, fields=mock.ANY)
         self.assertEqual(list(self.list_headers), headers)
         self.assertEqual([self.list_data], list(data))
 
@@ -40,7 +42,8 @@ class TestListFWaaS(test_fakes.TestNeutronClientOSCV2):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(
+            retrieve_all=False, fields=mock.ANY)
         self.assertEqual(list(self.headers), headers)
         self.assertListItemEqual([self.data], list(data))
 
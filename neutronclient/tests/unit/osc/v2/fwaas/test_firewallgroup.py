@@ -331,7 +331,7 @@ class TestListFirewallGroup(TestFirewallGroup, common.TestListFWaaS):
         super(TestListFirewallGroup, self).setUp()
         # Mock objects
         self.neutronclient.list_fwaas_firewall_groups = mock.Mock(
-            return_value={self.res_plural: [_fwg]})
+            return_value=[{self.res_plural: [_fwg]}])
         self.mocked = self.neutronclient.list_fwaas_firewall_groups
         self.cmd = firewallgroup.ListFirewallGroup(self.app, self.namespace)
 
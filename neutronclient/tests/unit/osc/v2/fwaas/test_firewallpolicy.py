@@ -91,6 +91,12 @@ class TestFirewallPolicy(test_fakes.TestNeutronClientOSCV2):
 
         self.neutronclient.find_resource = mock.Mock(
             side_effect=_find_resource)
+
+        def _find_resources(resource, names_or_ids, **kwargs):
+            return mock.Mock(ids=mock.Mock(return_value=list(names_or_ids)))
+
+        self.neutronclient.find_resources = mock.Mock(
+            side_effect=_find_resources)
         osc_utils.find_project = mock.Mock()
         osc_utils.find_project.id = _fwp['tenant_id']
         self.res = 'firewall_policy'
@@ -198,13 +204,6 @@ class TestCreateFirewallPolicy(TestFirewallPolicy, common.TestCreateFWaaS):
         rule1 = 'rule1'
         rule2 = 'rule2'
 
-        def _mock_policy(*args, **kwargs):
-            self.neutronclient.find_resource.assert_called_with(
-                'firewall_rule', args[1], cmd_resource=const.CMD_FWR)
-            return {'id': args[1]}
-
-        self.neutronclient.find_resource.side_effect = _mock_policy
-
         arglist = [
             name,
             '--firewall-rule', rule1,
@@ -218,7 +217,8 @@ class TestCreateFirewallPolicy(TestFirewallPolicy, common.TestCreateFWaaS):
         self._update_expect_response(request, response)
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
-        self.assertEqual(2, self.neutronclient.find_resource.call_count)
+        self.neutronclient.find_resources.assert_called_once_with(
+            'firewall_rule', [rule1, rule2], cmd_resource=const.CMD_FWR)
 
         self.check_results(headers, data, request)
 
@@ -309,7 +309,7 @@ class TestListFirewallPolicy(TestFirewallPolicy, common.TestListFWaaS):
     def setUp(self):
         super(TestListFirewallPolicy, self).setUp()
         self.neutronclient.list_fwaas_firewall_policies = mock.Mock(
-            return_value={'firewall_policies': [_fwp]})
+            return_value=[{'firewall_policies': [_fwp]}])
         self.mocked = self.neutronclient.list_fwaas_firewall_policies
         self.cmd = firewallpolicy.ListFirewallPolicy(self.app, self.namespace)
 
@@ -348,14 +348,6 @@ class TestSetFirewallPolicy(TestFirewallPolicy, common.TestSetFWaaS):
                 self.neutronclient.find_resource.assert_called_with(
                     self.res, args[1], cmd_resource=const.CMD_FWP)
                 return {'firewall_rules': _fwp['firewall_rules']}
-            # 3. Find specified firewall_rule
-            if self.neutronclient.find_resource.call_count == 3:
-                self.neutronclient.find_resource.assert_called_with(
-                    'firewall_rule', args[1], cmd_resource=const.CMD_FWR)
-            # 4. Find specified firewall_rule
-            if self.neutronclient.find_resource.call_count == 4:
-                self.neutronclient.find_resource.assert_called_with(
-                    'firewall_rule', args[1], cmd_resource=const.CMD_FWR)
             return {'id': args[1]}
 
         self.neutronclient.find_resource.side_effect = _mock_policy
@@ -375,7 +367,10 @@ class TestSetFirewallPolicy(TestFirewallPolicy, common.TestSetFWaaS):
         expect = _fwp['firewall_rules'] + [rule1, rule2]
         body = {self.res: {'firewall_rules': expect}}
         self.mocked.assert_called_once_with(target, body)
-        self.assertEqual(4, self.neutronclient.find_resource.call_count)
+        self.assertEqual(2, self.neutronclient.find_resource.call_count)
+        # 3. Find specified firewall_rules at once
+        self.neutronclient.find_resources.assert_called_once_with(
+            'firewall_rule', [rule1, rule2], cmd_resource=const.CMD_FWR)
         self.assertIsNone(result)
 
     def test_set_no_rules(self):
@@ -410,7 +405,9 @@ class TestSetFirewallPolicy(TestFirewallPolicy, common.TestSetFWaaS):
 
         body = {self.res: {'firewall_rules': [rule1]}}
         self.mocked.assert_called_once_with(target, body)
-        self.assertEqual(2, self.neutronclient.find_resource.call_count)
+        self.assertEqual(1, self.neutronclient.find_resource.call_count)
+        self.neutronclient.find_resources.assert_called_once_with(
+            'firewall_rule', [rule1], cmd_resource=const.CMD_FWR)
         self.assertIsNone(result)
 
     def test_set_audited(self):
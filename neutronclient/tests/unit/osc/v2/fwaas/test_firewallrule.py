@@ -315,7 +315,7 @@ class TestListFirewallRule(TestFirewallRule):
         )
         self._setup_summary()
         self.neutronclient.list_fwaas_firewall_rules = mock.Mock(
-            return_value={self.res_plural: [_fwr]})
+            return_value=[{self.res_plural: [_fwr]}])
         self.mocked = self.neutronclient.list_fwaas_firewall_rules
 
     def test_list_with_long_option(self):
@@ -324,7 +324,8 @@ class TestListFirewallRule(TestFirewallRule):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(
+            retrieve_all=False, fields=mock.ANY)
         self.assertEqual(list(self.headers), headers)
         self.assertListItemEqual([self.data], list(data))
 
@@ -334,7 +335,8 @@ class TestListFirewallRule(TestFirewallRule):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(
+            retrieve_all=False, fields=mock.ANY)
         self.assertEqual(list(self.short_header), headers)
         self.assertListItemEqual([self.short_data], list(data))
 
@@ -312,7 +312,7 @@ class TestListNetworkLog(TestNetworkLog):
         )
         self._setup_summary()
         self.neutronclient.list_network_logs = mock.Mock(
-            return_value={'logs': [self.res]})
+            return_value=[{'logs': [self.res]}])
         self.mocked = self.neutronclient.list_network_logs
 
     def test_list_with_long_option(self):
@@ -321,7 +321,8 @@ class TestListNetworkLog(TestNetworkLog):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(
+            retrieve_all=False, fields=mock.ANY)
         self.assertEqual(list(self.headers), headers)
         self.assertEqual([self.data], list(data))
 
@@ -331,7 +332,10 @@ class TestListNetworkLog(TestNetworkLog):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(
+            retrieve_all=False,
+            fields=['id', 'enabled', 'name', 'resource_type', 'event',
+                    'target_id', 'resource_id'])
         self.assertEqual(list(self.short_header), headers)
         self.assertEqual([self.short_data], list(data))
 
@@ -343,7 +347,7 @@ class TestListNetworkLog(TestNetworkLog):
         log = fakes.NetworkLog().create({
             'target_id': target_id,
             'resource_id': resource_id})
-        self.mocked.return_value = {'logs': [log]}
+        self.mocked.return_value = [{'logs': [log]}]
         logged = 'Logged: (security_group) %(res_id)s on (port) %(t_id)s' % {
             'res_id': resource_id, 't_id': target_id}
         expect_log = copy.deepcopy(log)
@@ -354,7 +358,8 @@ class TestListNetworkLog(TestNetworkLog):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(
+            retrieve_all=False, fields=mock.ANY)
         self.assertEqual(list(self.short_header), headers)
         self.assertEqual([self.short_data], list(data))
 
@@ -363,7 +368,7 @@ class TestListNetworkLog(TestNetworkLog):
         verifylist = []
         resource_id = 'bbbbbbbb-bbbb-bbbb-bbbbbbbbbbbbbbbbb'
         log = fakes.NetworkLog().create({'resource_id': resource_id})
-        self.mocked.return_value = {'logs': [log]}
+        self.mocked.return_value = [{'logs': [log]}]
         logged = 'Logged: (security_group) %s' % resource_id
         expect_log = copy.deepcopy(log)
         expect_log.update({
@@ -373,7 +378,8 @@ class TestListNetworkLog(TestNetworkLog):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(
+            retrieve_all=False, fields=mock.ANY)
         self.assertEqual(list(self.short_header), headers)
         self.assertEqual([self.short_data], list(data))
 
@@ -382,7 +388,7 @@ class TestListNetworkLog(TestNetworkLog):
         verifylist = []
         target_id = 'aaaaaaaa-aaaa-aaaa-aaaaaaaaaaaaaaaaa'
         log = fakes.NetworkLog().create({'target_id': target_id})
-        self.mocked.return_value = {'logs': [log]}
+        self.mocked.return_value = [{'logs': [log]}]
         logged = 'Logged: (port) %s' % target_id
         expect_log = copy.deepcopy(log)
         expect_log.update({
@@ -392,10 +398,31 @@ class TestListNetworkLog(TestNetworkLog):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(
+            retrieve_all=False, fields=mock.ANY)
         self.assertEqual(list(self.short_header), headers)
         self.assertEqual([self.short_data], list(data))
 
+    def test_list_with_filters(self):
+        arglist = [
+            '--resource-type', 'security_group',
+            '--target-id', 'aaaaaaaa-aaaa-aaaa-aaaaaaaaaaaaaaaaa',
+            '--enabled', 'True',
+        ]
+        verifylist = [
+            ('resource_type', 'security_group'),
+            ('target_id', 'aaaaaaaa-aaaa-aaaa-aaaaaaaaaaaaaaaaa'),
+            ('enabled', 'True'),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        headers, data = self.cmd.take_action(parsed_args)
+
+        self.mocked.assert_called_once_with(
+            retrieve_all=False, fields=mock.ANY,
+            resource_type='security_group',
+            target_id='aaaaaaaa-aaaa-aaaa-aaaaaaaaaaaaaaaaa', enabled='True')
+        self.assertEqual(list(self.short_header), headers)
+
 
 class TestShowNetworkLog(TestNetworkLog):
 
@@ -26,6 +26,7 @@ class TestNeutronClientOSCV2(utils.TestCommand):
 
     def setUp(self):
         super(TestNeutronClientOSCV2, self).setUp()
+        self.addCleanup(mock.patch.stopall)
         self.namespace = argparse.Namespace()
         self.app.client_manager.session = mock.Mock()
         self.app.client_manager.neutronclient = mock.Mock()
@@ -326,7 +326,7 @@ class TestListSfcFlowClassifier(fakes.TestNeutronClientOSCV2):
         super(TestListSfcFlowClassifier, self).setUp()
         mock.patch(get_id, new=_get_id).start()
         self.neutronclient.list_sfc_flow_classifiers = mock.Mock(
-            return_value={'flow_classifiers': self._fc}
+            return_value=[{'flow_classifiers': self._fc}]
         )
         # Get the command object to test
         self.cmd = sfc_flow_classifier.ListSfcFlowClassifier(self.app,
@@ -338,7 +338,7 @@ class TestListSfcFlowClassifier(fakes.TestNeutronClientOSCV2):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns = self.cmd.take_action(parsed_args)
         fcs = self.neutronclient \
-            .list_sfc_flow_classifiers()['flow_classifiers']
+            .list_sfc_flow_classifiers()[0]['flow_classifiers']
         fc = fcs[0]
         data = [
             fc['id'],
@@ -356,7 +356,7 @@ class TestListSfcFlowClassifier(fakes.TestNeutronClientOSCV2):
         arglist = ['--long']
         verifylist = [('long', True)]
         fcs = self.neutronclient \
-            .list_sfc_flow_classifiers()['flow_classifiers']
+            .list_sfc_flow_classifiers()[0]['flow_classifiers']
         fc = fcs[0]
         data = [
             fc['id'],
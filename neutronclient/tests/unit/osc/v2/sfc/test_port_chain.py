@@ -25,6 +25,10 @@ def _get_id(client, id_or_name, resource):
     return id_or_name
 
 
+def _get_ids(client, ids_or_names, resource, cmd_resource=None):
+    return list(ids_or_names)
+
+
 class TestCreateSfcPortChain(fakes.TestNeutronClientOSCV2):
     # The new port_chain created
     _port_chain = fakes.FakeSfcPortChain.create_port_chain()
@@ -55,6 +59,9 @@ class TestCreateSfcPortChain(fakes.TestNeutronClientOSCV2):
         mock.patch(
             'neutronclient.osc.v2.sfc.sfc_port_chain._get_id',
             new=_get_id).start()
+        self.get_ids = mock.patch(
+            'neutronclient.osc.v2.sfc.sfc_port_chain._get_ids',
+            side_effect=_get_ids).start()
         self.neutronclient.create_sfc_port_chain = mock.Mock(
             return_value={'port_chain': self._port_chain})
         self.data = self.get_data()
@@ -182,7 +189,7 @@ class TestListSfcPortChain(fakes.TestNeutronClientOSCV2):
             'neutronclient.osc.v2.sfc.sfc_port_chain._get_id',
             new=_get_id).start()
         self.neutronclient.list_sfc_port_chains = mock.Mock(
-            return_value={'port_chains': self._port_chains}
+            return_value=[{'port_chains': self._port_chains}]
         )
         # Get the command object to test
         self.cmd = sfc_port_chain.ListSfcPortChain(self.app, self.namespace)
@@ -192,7 +199,7 @@ class TestListSfcPortChain(fakes.TestNeutronClientOSCV2):
         verifylist = []
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns = self.cmd.take_action(parsed_args)[0]
-        pcs = self.neutronclient.list_sfc_port_chains()['port_chains']
+        pcs = self.neutronclient.list_sfc_port_chains()[0]['port_chains']
         pc = pcs[0]
         data = [
             pc['id'],
@@ -210,7 +217,7 @@ class TestListSfcPortChain(fakes.TestNeutronClientOSCV2):
         verifylist = [('long', True)]
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns = self.cmd.take_action(parsed_args)[0]
-        pcs = self.neutronclient.list_sfc_port_chains()['port_chains']
+        pcs = self.neutronclient.list_sfc_port_chains()[0]['port_chains']
         pc = pcs[0]
         data = [
             pc['id'],
@@ -240,6 +247,9 @@ class TestSetSfcPortChain(fakes.TestNeutronClientOSCV2):
         mock.patch(
             'neutronclient.osc.v2.sfc.sfc_port_chain._get_id',
             new=_get_id).start()
+        self.get_ids = mock.patch(
+            'neutronclient.osc.v2.sfc.sfc_port_chain._get_ids',
+            side_effect=_get_ids).start()
         self.mocked = self.neutronclient.update_sfc_port_chain
         self.cmd = sfc_port_chain.SetSfcPortChain(self.app, self.namespace)
 
@@ -269,23 +279,8 @@ class TestSetSfcPortChain(fakes.TestNeutronClientOSCV2):
         fc1 = 'flow_classifier1'
         fc2 = 'flow_classifier2'
 
-        def _mock_flow_classifier(*args, **kwargs):
-            if self.neutronclient.find_resource.call_count == 1:
-                self.neutronclient.find_resource.assert_called_with(
-                    self.res, target, cmd_resource='sfc_port_chain')
-                return {'flow_classifiers': [self.pc_fc]}
-
-            if self.neutronclient.find_resource.call_count == 2:
-                self.neutronclient.find_resource.assert_called_with(
-                    'flow_classifier', fc1, cmd_resource='sfc_flow_classifier')
-                return {'id': args[1]}
-
-            if self.neutronclient.find_resource.call_count == 3:
-                self.neutronclient.find_resource.assert_called_with(
-                    'flow_classifier', fc2, cmd_resource='sfc_flow_classifier')
-                return {'id': args[1]}
-
-        self.neutronclient.find_resource.side_effect = _mock_flow_classifier
+        self.neutronclient.find_resource = mock.Mock(
+            return_value={'flow_classifiers': [self.pc_fc]})
         arglist = [
             target,
             '--flow-classifier', fc1,
@@ -299,7 +294,11 @@ class TestSetSfcPortChain(fakes.TestNeutronClientOSCV2):
         result = self.cmd.take_action(parsed_args)
         expect = {'flow_classifiers': [self.pc_fc, fc1, fc2]}
         self.mocked.assert_called_once_with(target, {self.res: expect})
-        self.assertEqual(3, self.neutronclient.find_resource.call_count)
+        self.neutronclient.find_resource.assert_called_once_with(
+            self.res, target, cmd_resource='sfc_port_chain')
+        self.get_ids.assert_called_once_with(
+            self.neutronclient, [fc1, fc2], 'flow_classifier',
+            cmd_resource='sfc_flow_classifier')
         self.assertIsNone(result)
 
     def test_set_no_flow_classifier(self):
@@ -326,25 +325,8 @@ class TestSetSfcPortChain(fakes.TestNeutronClientOSCV2):
         ppg1 = 'port_pair_group1'
         ppg2 = 'port_pair_group2'
 
-        def _mock_flow_classifier(*args, **kwargs):
-            if self.neutronclient.find_resource.call_count == 1:
-                self.neutronclient.find_resource.assert_called_with(
-                    self.res, target, cmd_resource='sfc_port_chain')
-                return {'port_pair_groups': [self.pc_ppg]}
-
-            if self.neutronclient.find_resource.call_count == 2:
-                self.neutronclient.find_resource.assert_called_with(
-                    'port_pair_group', ppg1,
-                    cmd_resource='sfc_port_pair_group')
-                return {'id': args[1]}
-
-            if self.neutronclient.find_resource.call_count == 3:
-                self.neutronclient.find_resource.assert_called_with(
-                    'port_pair_group', ppg2,
-                    cmd_resource='sfc_port_pair_group')
-                return {'id': args[1]}
-
-        self.neutronclient.find_resource.side_effect = _mock_flow_classifier
+        self.neutronclient.find_resource = mock.Mock(
+            return_value={'port_pair_groups': [self.pc_ppg]})
         arglist = [
             target,
             '--port-pair-group', ppg1,
@@ -358,21 +340,17 @@ class TestSetSfcPortChain(fakes.TestNeutronClientOSCV2):
         result = self.cmd.take_action(parsed_args)
         expect = {'port_pair_groups': [existing_ppg, ppg1, ppg2]}
         self.mocked.assert_called_once_with(target, {self.res: expect})
-        self.assertEqual(3, self.neutronclient.find_resource.call_count)
+        self.neutronclient.find_resource.assert_called_once_with(
+            self.res, target, cmd_resource='sfc_port_chain')
+        self.get_ids.assert_called_once_with(
+            self.neutronclient, [ppg1, ppg2], 'port_pair_group',
+            cmd_resource='sfc_port_pair_group')
         self.assertIsNone(result)
 
     def test_set_no_port_pair_group(self):
         target = self.resource['id']
         ppg1 = 'port_pair_group1'
 
-        def _mock_port_pair_group(*args, **kwargs):
-
-            if self.neutronclient.find_resource.call_count == 1:
-                self.neutronclient.find_resource.assert_called_with(
-                    'port_pair_group', ppg1,
-                    cmd_resource='sfc_port_pair_group')
-                return {'id': args[1]}
-        self.neutronclient.find_resource.side_effect = _mock_port_pair_group
         arglist = [
             target,
             '--no-port-pair-group',
@@ -387,7 +365,10 @@ class TestSetSfcPortChain(fakes.TestNeutronClientOSCV2):
         result = self.cmd.take_action(parsed_args)
         expect = {'port_pair_groups': [ppg1]}
         self.mocked.assert_called_once_with(target, {self.res: expect})
-        self.assertEqual(1, self.neutronclient.find_resource.call_count)
+        self.neutronclient.find_resource.assert_not_called()
+        self.get_ids.assert_called_once_with(
+            self.neutronclient, [ppg1], 'port_pair_group',
+            cmd_resource='sfc_port_pair_group')
         self.assertIsNone(result)
 
     def test_set_only_no_port_pair_group(self):
@@ -471,6 +452,9 @@ class TestUnsetSfcPortChain(fakes.TestNeutronClientOSCV2):
         mock.patch(
             'neutronclient.osc.v2.sfc.sfc_port_chain._get_id',
             new=_get_id).start()
+        self.get_ids = mock.patch(
+            'neutronclient.osc.v2.sfc.sfc_port_chain._get_ids',
+            side_effect=_get_ids).start()
         self.neutronclient.update_sfc_port_chain = mock.Mock(
             return_value=None)
         self.mocked = self.neutronclient.update_sfc_port_chain
@@ -480,22 +464,8 @@ class TestUnsetSfcPortChain(fakes.TestNeutronClientOSCV2):
         target = self.resource['id']
         ppg1 = 'port_pair_group1'
 
-        def _mock_port_pair_group(*args, **kwargs):
-            if self.neutronclient.find_resource.call_count == 1:
-                self.neutronclient.find_resource.assert_called_with(
-                    self.res, target, cmd_resource='sfc_port_chain')
-                return {'port_pair_groups': [self.pc_ppg]}
-
-            if self.neutronclient.find_resource.call_count == 2:
-                self.neutronclient.find_resource.assert_called_with(
-                    'port_pair_group', ppg1,
-                    cmd_resource='sfc_port_pair_group')
-                return {'id': args[1]}
-            if self.neutronclient.find_resource.call_count == 3:
-                self.neutronclient.find_resource.assert_called_with(
-                    self.res, target, cmd_resource='sfc_port_chain')
-                return {'id': args[1]}
-        self.neutronclient.find_resource.side_effect = _mock_port_pair_group
+        self.neutronclient.find_resource = mock.Mock(
+            return_value={'port_pair_groups': [self.pc_ppg]})
 
         arglist = [
             target,
@@ -509,23 +479,17 @@ class TestUnsetSfcPortChain(fakes.TestNeutronClientOSCV2):
         result = self.cmd.take_action(parsed_args)
         expect = {'port_pair_groups': [self.pc_ppg]}
         self.mocked.assert_called_once_with(target, {self.res: expect})
+        self.get_ids.assert_called_once_with(
+            self.neutronclient, [ppg1], 'port_pair_group',
+            cmd_resource='sfc_port_pair_group')
         self.assertIsNone(result)
 
     def test_unset_flow_classifier(self):
         target = self.resource['id']
         fc1 = 'flow_classifier1'
 
-        def _mock_flow_classifier(*args, **kwargs):
-            if self.neutronclient.find_resource.call_count == 1:
-                self.neutronclient.find_resource.assert_called_with(
-                    self.res, target, cmd_resource='sfc_port_chain')
-                return {'flow_classifiers': [self.pc_fc]}
-
-            if self.neutronclient.find_resource.call_count == 2:
-                self.neutronclient.find_resource.assert_called_with(
-                    'flow_classifier', fc1, cmd_resource='sfc_flow_classifier')
-                return {'id': args[1]}
-        self.neutronclient.find_resource.side_effect = _mock_flow_classifier
+        self.neutronclient.find_resource = mock.Mock(
+            return_value={'flow_classifiers': [self.pc_fc]})
 
         arglist = [
             target,
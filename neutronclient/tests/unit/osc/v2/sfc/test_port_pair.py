@@ -182,7 +182,7 @@ class TestListSfcPortPair(fakes.TestNeutronClientOSCV2):
         mock.patch('neutronclient.osc.v2.sfc.sfc_port_pair._get_id',
                    new=_get_id).start()
         self.neutronclient.list_sfc_port_pairs = mock.Mock(
-            return_value={'port_pairs': self._port_pairs}
+            return_value=[{'port_pairs': self._port_pairs}]
         )
         # Get the command object to test
         self.cmd = sfc_port_pair.ListSfcPortPair(self.app, self.namespace)
@@ -192,7 +192,8 @@ class TestListSfcPortPair(fakes.TestNeutronClientOSCV2):
         verifylist = []
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns = self.cmd.take_action(parsed_args)[0]
-        port_pairs = self.neutronclient.list_sfc_port_pairs()['port_pairs']
+        port_pairs = self.neutronclient.list_sfc_port_pairs()[0][
+            'port_pairs']
         port_pair = port_pairs[0]
         data = [
             port_pair['id'],
@@ -206,7 +207,8 @@ class TestListSfcPortPair(fakes.TestNeutronClientOSCV2):
     def test_list_with_long_option(self):
         arglist = ['--long']
         verifylist = [('long', True)]
-        port_pairs = self.neutronclient.list_sfc_port_pairs()['port_pairs']
+        port_pairs = self.neutronclient.list_sfc_port_pairs()[0][
+            'port_pairs']
         port_pair = port_pairs[0]
         data = [
             port_pair['id'],
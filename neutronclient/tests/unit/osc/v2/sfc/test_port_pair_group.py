@@ -209,7 +209,7 @@ class TestListSfcPortPairGroup(fakes.TestNeutronClientOSCV2):
             new=_get_id).start()
 
         self.neutronclient.list_sfc_port_pair_groups = mock.Mock(
-            return_value={'port_pair_groups': self._ppgs}
+            return_value=[{'port_pair_groups': self._ppgs}]
         )
         # Get the command object to test
         self.cmd = sfc_port_pair_group.ListSfcPortPairGroup(self.app,
@@ -221,7 +221,7 @@ class TestListSfcPortPairGroup(fakes.TestNeutronClientOSCV2):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns = self.cmd.take_action(parsed_args)[0]
         ppgs = self.neutronclient \
-            .list_sfc_port_pair_groups()['port_pair_groups']
+            .list_sfc_port_pair_groups()[0]['port_pair_groups']
         ppg = ppgs[0]
         data = [
             ppg['id'],
@@ -237,7 +237,7 @@ class TestListSfcPortPairGroup(fakes.TestNeutronClientOSCV2):
         arglist = ['--long']
         verifylist = [('long', True)]
         ppgs = self.neutronclient \
-            .list_sfc_port_pair_groups()['port_pair_groups']
+            .list_sfc_port_pair_groups()[0]['port_pair_groups']
         ppg = ppgs[0]
         data = [
             ppg['id'],
@@ -15,15 +15,21 @@
 import mock
 from osc_lib import exceptions
 from osc_lib.tests import utils as tests_utils
+from requests_mock.contrib import fixture as mock_fixture
 
 from neutronclient.osc.v2.sfc import sfc_service_graph
 from neutronclient.tests.unit.osc.v2.sfc import fakes
+from neutronclient.v2_0 import client
 
 
 def _get_id(client, id_or_name, resource):
     return id_or_name
 
 
+def _get_ids(client, ids_or_names, resource, cmd_resource=None):
+    return list(ids_or_names)
+
+
 class TestListSfcServiceGraph(fakes.TestNeutronClientOSCV2):
     _service_graphs = fakes.FakeSfcServiceGraph.create_sfc_service_graphs(
         count=1)
@@ -51,7 +57,7 @@ class TestListSfcServiceGraph(fakes.TestNeutronClientOSCV2):
             'neutronclient.osc.v2.sfc.sfc_service_graph._get_id',
             new=_get_id).start()
         self.neutronclient.list_sfc_service_graphs = mock.Mock(
-            return_value={'service_graphs': self._service_graphs}
+            return_value=[{'service_graphs': self._service_graphs}]
         )
         # Get the command object to test
         self.cmd = sfc_service_graph.ListSfcServiceGraph(
@@ -62,7 +68,8 @@ class TestListSfcServiceGraph(fakes.TestNeutronClientOSCV2):
         verifylist = []
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns = self.cmd.take_action(parsed_args)[0]
-        sgs = self.neutronclient.list_sfc_service_graphs()['service_graphs']
+        sgs = self.neutronclient.list_sfc_service_graphs()[0][
+            'service_graphs']
         sg = sgs[0]
         data = [
             sg['id'],
@@ -77,7 +84,8 @@ class TestListSfcServiceGraph(fakes.TestNeutronClientOSCV2):
         verifylist = [('long', True)]
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns = self.cmd.take_action(parsed_args)[0]
-        sgs = self.neutronclient.list_sfc_service_graphs()['service_graphs']
+        sgs = self.neutronclient.list_sfc_service_graphs()[0][
+            'service_graphs']
         sg = sgs[0]
         data = [
             sg['id'],
@@ -107,8 +115,9 @@ class TestCreateSfcServiceGraph(fakes.TestNeutronClientOSCV2):
 
     def setUp(self):
         super(TestCreateSfcServiceGraph, self).setUp()
-        mock.patch('neutronclient.osc.v2.sfc.sfc_service_graph._get_id',
-                   new=_get_id).start()
+        self.get_ids = mock.patch(
+            'neutronclient.osc.v2.sfc.sfc_service_graph._get_ids',
+            side_effect=_get_ids).start()
         self.neutronclient.create_sfc_service_graph = mock.Mock(
             return_value={'service_graph': self._service_graph})
         self.data = self.get_data()
@@ -152,6 +161,9 @@ class TestCreateSfcServiceGraph(fakes.TestNeutronClientOSCV2):
                 'port_chains': pcs
             }
         })
+        self.get_ids.assert_called_once_with(
+            self.neutronclient, ['pc1', 'pc2', 'pc2', 'pc3', 'pc4'],
+            'port_chain', cmd_resource='sfc_port_chain')
         self.assertEqual(self.columns_long, columns)
         self.assertEqual(self.data, data)
 
@@ -177,6 +189,36 @@ class TestCreateSfcServiceGraph(fakes.TestNeutronClientOSCV2):
         self.assertRaises(
             exceptions.CommandError, self.cmd.take_action, parsed_args)
 
+    def test_create_sfc_service_graph_reports_cycle(self):
+        arglist = [
+            "--branching-point", 'pc1:pc2,pc3',
+            "--branching-point", 'pc3:pc4',
+            "--branching-point", 'pc4:pc5,pc1',
+            self._service_graph['name']]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+        e = self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args)
+        self.assertIn('pc1 -> pc3 -> pc4 -> pc1', str(e))
+        self.neutronclient.create_sfc_service_graph.assert_not_called()
+
+    def test_create_sfc_service_graph_self_loop(self):
+        arglist = [
+            "--branching-point", 'pc1:pc1',
+            self._service_graph['name']]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args)
+
+    def test_create_sfc_service_graph_duplicate_resolved_dst_chains(self):
+        self.get_ids.side_effect = lambda client, chains, resource, **kw: [
+            'pc2-id' if c in ('pc2', 'pc2-id') else c for c in chains]
+        arglist = [
+            "--branching-point", 'pc1:pc2,pc2-id',
+            self._service_graph['name']]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args)
+
     def test_create_sfc_service_graph_invalid_port_chains(self):
         bp1_str = 'pc1:pc2,pc3:'
         self.cmd = sfc_service_graph.CreateSfcServiceGraph(
@@ -220,6 +262,45 @@ class TestCreateSfcServiceGraph(fakes.TestNeutronClientOSCV2):
             exceptions.CommandError, self.cmd.take_action, parsed_args)
 
 
+class TestFindCycle(tests_utils.TestCase):
+
+    def test_no_cycle_in_diamond(self):
+        graph = {'a': ['b', 'c'], 'b': ['d'], 'c': ['d']}
+        self.assertIsNone(sfc_service_graph._find_cycle(graph))
+
+    def test_cycle(self):
+        graph = {'a': ['b'], 'b': ['c', 'd'], 'd': ['b']}
+        self.assertEqual(['b', 'd', 'b'],
+                         sfc_service_graph._find_cycle(graph))
+
+    def test_large_branching_graph(self):
+        # A ladder where every chain branches to the next two, which has
+        # an exponential number of paths.
+        count = 5000
+        graph = dict((i, [i + 1, i + 2]) for i in range(count))
+        self.assertIsNone(sfc_service_graph._find_cycle(graph))
+        graph[count] = [0]
+        cycle = sfc_service_graph._find_cycle(graph)
+        self.assertEqual(cycle[0], cycle[-1])
+        for src, dst in zip(cycle, cycle[1:]):
+            self.assertIn(dst, graph[src])
+
+
+class TestGetIds(tests_utils.TestCase):
+
+    def test_get_ids_of_port_chains(self):
+        requests = self.useFixture(mock_fixture.Fixture())
+        url = 'http://neutron.test:9696/v2.0/sfc/port_chains'
+        requests.get(url, json={'port_chains': [
+            {'id': 'pc1-id', 'name': 'pc1'}, {'id': 'pc2-id', 'name': 'pc2'}]})
+        neutron = client.Client(token='token',
+                                endpoint_url='http://neutron.test:9696')
+        self.assertEqual(['pc2-id', 'pc1-id'], sfc_service_graph._get_ids(
+            neutron, ['pc2', 'pc1'], 'port_chain',
+            cmd_resource='sfc_port_chain'))
+        self.assertEqual(['pc2', 'pc1'], requests.last_request.qs['name'])
+
+
 class TestDeleteSfcServiceGraph(fakes.TestNeutronClientOSCV2):
 
     _service_graph = fakes.FakeSfcServiceGraph.create_sfc_service_graphs(
@@ -390,7 +390,7 @@ class TestListNetworkTrunk(test_fakes.TestNeutronClientOSCV2):
         mock.patch('neutronclient.osc.v2.trunk.network_trunk._get_id',
                    new=_get_id).start()
         self.neutronclient.list_trunks = mock.Mock(
-            return_value={trunk.TRUNKS: self._trunks})
+            return_value=[{trunk.TRUNKS: self._trunks}])
 
         # Get the command object to test
         self.cmd = trunk.ListNetworkTrunk(self.app, self.namespace)
@@ -402,8 +402,10 @@ class TestListNetworkTrunk(test_fakes.TestNeutronClientOSCV2):
 
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.neutronclient.list_trunks.assert_called_once_with()
-        self.assertEqual(self.columns, columns)
+        self.neutronclient.list_trunks.assert_called_once_with(
+            retrieve_all=False,
+            fields=['id', 'name', 'port_id', 'description'])
+        self.assertEqual(list(self.columns), columns)
         self.assertListItemEqual(self.data, list(data))
 
     def test_trunk_list_long(self):
@@ -417,10 +419,52 @@ class TestListNetworkTrunk(test_fakes.TestNeutronClientOSCV2):
 
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.neutronclient.list_trunks.assert_called_once_with()
-        self.assertEqual(self.columns_long, columns)
+        self.neutronclient.list_trunks.assert_called_once_with(
+            retrieve_all=False,
+            fields=['id', 'name', 'port_id', 'description', 'status',
+                    'admin_state_up', 'created_at', 'updated_at'])
+        self.assertEqual(list(self.columns_long), columns)
         self.assertListItemEqual(self.data_long, list(data))
 
+    def test_trunk_list_pagination_and_sorting(self):
+        arglist = [
+            '--limit', '1',
+            '--marker', 'trunk-marker',
+            '--sort-key', 'name',
+            '--sort-key', 'status',
+            '--sort-dir', 'desc',
+        ]
+        verifylist = [
+            ('limit', 1),
+            ('marker', 'trunk-marker'),
+            ('sort_key', ['name', 'status']),
+            ('sort_dir', ['desc']),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.neutronclient.list_trunks.assert_called_once_with(
+            retrieve_all=False,
+            fields=['id', 'name', 'port_id', 'description'],
+            limit=1, marker='trunk-marker',
+            sort_key=['name', 'status'], sort_dir=['desc', 'asc'])
+        self.assertListItemEqual(self.data[:1], list(data))
+
+    def test_trunk_list_stops_paging_at_limit(self):
+        pages = iter([{trunk.TRUNKS: self._trunks[:1]},
+                      {trunk.TRUNKS: self._trunks[1:]}])
+        self.neutronclient.list_trunks.return_value = pages
+        arglist = ['--limit', '1']
+        verifylist = [('limit', 1)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertListItemEqual(self.data[:1], list(data))
+        # The second page is never requested.
+        self.assertEqual(1, len(list(pages)))
+
 
 class TestSetNetworkTrunk(test_fakes.TestNeutronClientOSCV2):
     # Create trunks to be listed.
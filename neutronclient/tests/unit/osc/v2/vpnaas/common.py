@@ -14,6 +14,7 @@
 #    under the License.
 #
 
+import mock
 import testtools
 
 from osc_lib import exceptions
@@ -85,7 +86,8 @@ class TestListVPNaaS(test_fakes.TestNeutronClientOSCV2):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(
+            retrieve_all=False, fields=mock.ANY)
         self.assertEqual(list(self.list_headers), headers)
         self.assertEqual([self.list_data], list(data))
 
@@ -95,7 +97,8 @@ class TestListVPNaaS(test_fakes.TestNeutronClientOSCV2):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(
+            retrieve_all=False, fields=mock.ANY)
         self.assertEqual(list(self.headers), headers)
         self.assertEqual([self.data], list(data))
 
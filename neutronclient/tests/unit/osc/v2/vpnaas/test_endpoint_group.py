@@ -213,7 +213,7 @@ class TestListEndpointGroup(TestEndpointGroup):
         )
 
         self.neutronclient.list_endpoint_groups = mock.Mock(
-            return_value={self.res_plural: [_endpoint_group]})
+            return_value=[{self.res_plural: [_endpoint_group]}])
         self.mocked = self.neutronclient.list_endpoint_groups
 
     def test_list_with_long_option(self):
@@ -222,7 +222,8 @@ class TestListEndpointGroup(TestEndpointGroup):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(
+            retrieve_all=False, fields=mock.ANY)
         self.assertEqual(list(self.headers), headers)
         self.assertEqual([self.data], list(data))
 
@@ -232,7 +233,8 @@ class TestListEndpointGroup(TestEndpointGroup):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(
+            retrieve_all=False, fields=mock.ANY)
         self.assertEqual(list(self.short_header), headers)
         self.assertEqual([self.short_data], list(data))
 
@@ -320,7 +320,7 @@ class TestListIPsecSiteConn(TestIPsecSiteConn):
         )
 
         self.neutronclient.list_ipsec_site_connections = mock.Mock(
-            return_value={self.res_plural: [_ipsec_site_conn]})
+            return_value=[{self.res_plural: [_ipsec_site_conn]}])
         self.mocked = self.neutronclient.list_ipsec_site_connections
 
     def test_list_with_long_option(self):
@@ -329,7 +329,8 @@ class TestListIPsecSiteConn(TestIPsecSiteConn):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(
+            retrieve_all=False, fields=mock.ANY)
         self.assertEqual(list(self.headers), headers)
         self.assertListItemEqual([self.data], list(data))
 
@@ -339,7 +340,8 @@ class TestListIPsecSiteConn(TestIPsecSiteConn):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(
+            retrieve_all=False, fields=mock.ANY)
         self.assertEqual(list(self.short_header), headers)
         self.assertEqual([self.short_data], list(data))
 
@@ -244,7 +244,7 @@ class TestListIPSecPolicy(TestIPSecPolicy):
         )
 
         self.neutronclient.list_ipsecpolicies = mock.Mock(
-            return_value={self.res_plural: [_ipsecpolicy]})
+            return_value=[{self.res_plural: [_ipsecpolicy]}])
         self.mocked = self.neutronclient.list_ipsecpolicies
 
     def test_list_with_long_option(self):
@@ -253,7 +253,8 @@ class TestListIPSecPolicy(TestIPSecPolicy):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(
+            retrieve_all=False, fields=mock.ANY)
         self.assertEqual(list(self.headers), headers)
         self.assertEqual([self.data], list(data))
 
@@ -263,7 +264,8 @@ class TestListIPSecPolicy(TestIPSecPolicy):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(
+            retrieve_all=False, fields=mock.ANY)
         self.assertEqual(list(self.short_header), headers)
         self.assertEqual([self.short_data], list(data))
 
@@ -246,7 +246,7 @@ class TestListVPNService(TestVPNService):
         )
 
         self.neutronclient.list_vpnservices = mock.Mock(
-            return_value={self.res_plural: [_vpnservice]})
+            return_value=[{self.res_plural: [_vpnservice]}])
         self.mocked = self.neutronclient.list_vpnservices
 
     def test_list_with_long_option(self):
@@ -255,7 +255,8 @@ class TestListVPNService(TestVPNService):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(
+            retrieve_all=False, fields=mock.ANY)
         self.assertEqual(list(self.headers), headers)
         self.assertEqual([self.data], list(data))
 
@@ -265,7 +266,8 @@ class TestListVPNService(TestVPNService):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(
+            retrieve_all=False, fields=mock.ANY)
         self.assertEqual(list(self.short_header), headers)
         self.assertEqual([self.short_data], list(data))
 
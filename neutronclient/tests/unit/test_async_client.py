@@ -0,0 +1,346 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+import json
+
+import fixtures
+import requests
+import six
+import testtools
+
+from neutronclient.common import cache
+from neutronclient.common import exceptions
+from neutronclient.common import metrics
+from neutronclient.common import ratelimit
+
+if six.PY3:
+    import asyncio
+
+    from neutronclient.v2_0 import async_client
+else:
+    async_client = None
+
+ENDPOINT_URL = 'http://localhost:9696'
+TOKEN = 'testtoken'
+
+
+def _resp(status_code, body):
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp.headers['x-openstack-request-id'] = 'req-%d' % status_code
+    text = json.dumps(body) if body is not None else ''
+    return resp, text
+
+
+@testtools.skipIf(async_client is None or async_client.aiohttp is None,
+                  'AsyncClient requires Python 3 and aiohttp')
+class AsyncClientTest(testtools.TestCase):
+
+    def setUp(self):
+        super(AsyncClientTest, self).setUp()
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        self.client = async_client.AsyncClient(token=TOKEN,
+                                               endpoint_url=ENDPOINT_URL,
+                                               loop=self.loop)
+        self.requests = []
+        self.responses = []
+        self.client.async_httpclient.request = self._fake_request
+
+    def _fake_request(self, url, method, body=None, headers=None):
+        self.requests.append((method, url, body, headers))
+        future = self.loop.create_future()
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            future.set_exception(response)
+        else:
+            future.set_result(response)
+        return future
+
+    def _done(self):
+        future = self.loop.create_future()
+        future.set_result(None)
+        return future
+
+    def _run(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def test_show(self):
+        self.responses.append(_resp(200, {'network': {'id': 'net1'}}))
+        res = self._run(self.client.show_network('net1'))
+        self.assertEqual({'network': {'id': 'net1'}}, res)
+        self.assertEqual(['req-200'], res.request_ids)
+        method, url, body, headers = self.requests[0]
+        self.assertEqual('GET', method)
+        self.assertEqual(ENDPOINT_URL + '/v2.0/networks/net1', url)
+        self.assertEqual(TOKEN, headers['X-Auth-Token'])
+
+    def test_show_response_cache_ignored(self):
+        self.client.response_cache = cache.LRUCache(None, maxbytes=1024)
+        self.responses.append(_resp(200, {'network': {
+            'id': 'net1', 'revision_number': 1}}))
+        res = self._run(self.client.show_network('net1'))
+        self.assertEqual('net1', res['network']['id'])
+        self.assertEqual(0, len(self.client.response_cache))
+
+    def test_concurrent_requests(self):
+        # The authentication lock works on a loop which is not the
+        # default one.
+        self.responses.append(_resp(200, {'network': {'id': 'net1'}}))
+        self.responses.append(_resp(200, {'network': {'id': 'net2'}}))
+        tasks = [self.loop.create_task(self.client.show_network(net_id))
+                 for net_id in ('net1', 'net2')]
+        self.assertEqual(['net1', 'net2'],
+                         [self._run(task)['network']['id'] for task in tasks])
+
+    def test_lookup_during_mutation_forgotten(self):
+        self.client.resolution_cache = cache.LRUCache(10)
+        fake_request = self.client.async_httpclient.request
+
+        def _request(url, method, *args, **kwargs):
+            if method == 'DELETE':
+                # Remembered while the network is being deleted.
+                self.client.resolution_cache.set('network', {'id': 'net1'})
+            return fake_request(url, method, *args, **kwargs)
+
+        self.client.async_httpclient.request = _request
+        self.responses.append(_resp(204, None))
+        delete = self.client.delete_network('net1')
+        self.client.resolution_cache.set('network', {'id': 'net1'})
+        self._run(delete)
+        self.assertEqual(0, len(self.client.resolution_cache))
+
+    def test_create(self):
+        self.responses.append(_resp(201, {'port': {'id': 'p1'}}))
+        res = self._run(self.client.create_port({'port': {'name': 'a'}}))
+        self.assertEqual('p1', res['port']['id'])
+        method, url, body, headers = self.requests[0]
+        self.assertEqual('POST', method)
+        self.assertEqual({'port': {'name': 'a'}}, json.loads(body))
+        self.assertEqual('application/json', headers['Content-Type'])
+
+    def test_error(self):
+        self.responses.append(_resp(404, {'NeutronError': {
+            'type': 'NetworkNotFound', 'message': 'not found',
+            'detail': ''}}))
+        self.assertRaises(exceptions.NetworkNotFoundClient,
+                          self._run, self.client.show_network('net1'))
+
+    def _stub_two_pages(self):
+        next_href = ENDPOINT_URL + '/v2.0/ports?marker=p1&limit=1'
+        self.responses.append(_resp(200, {
+            'ports': [{'id': 'p1'}],
+            'ports_links': [{'rel': 'next', 'href': next_href}]}))
+        self.responses.append(_resp(200, {'ports': [{'id': 'p2'}]}))
+
+    def test_list_retrieve_all(self):
+        self._stub_two_pages()
+        res = self._run(self.client.list_ports(limit=1))
+        self.assertEqual({'ports': [{'id': 'p1'}, {'id': 'p2'}]}, res)
+        self.assertEqual(['req-200', 'req-200'], res.request_ids)
+        self.assertIn('marker=p1', self.requests[1][1])
+
+    def _collect(self, iterator):
+        items = []
+        while True:
+            try:
+                items.append(self._run(iterator.__anext__()))
+            except StopAsyncIteration:
+                return items
+
+    def test_list_pages(self):
+        self._stub_two_pages()
+        pages = self._collect(self.client.list_ports(retrieve_all=False,
+                                                     limit=1))
+        self.assertEqual([[{'id': 'p1'}], [{'id': 'p2'}]],
+                         [page['ports'] for page in pages])
+
+    def test_list_stream(self):
+        self._stub_two_pages()
+        items = self._collect(self.client.list_ports(stream=True, limit=1))
+        self.assertEqual([{'id': 'p1'}, {'id': 'p2'}], items)
+
+    def test_find_resource_by_name(self):
+        self.responses.append(_resp(200, {'networks': [{'id': 'net1'}]}))
+        res = self._run(self.client.find_resource('network', 'private'))
+        self.assertEqual({'id': 'net1'}, res)
+        self.assertIn('name=private', self.requests[0][1])
+
+    def test_find_resources(self):
+        net_id = '4f6f4bd1-3b2a-4c4b-8e0a-2c3a8f6b9d10'
+        self.responses.append(_resp(200, {'networks': [
+            {'id': net_id, 'name': 'public'}]}))
+        self.responses.append(_resp(200, {'networks': [
+            {'id': 'net2', 'name': 'private'}]}))
+        found = self._run(self.client.find_resources(
+            'network', [net_id, 'private', 'missing']))
+        self.assertEqual([net_id, 'private'], list(found))
+        self.assertEqual('net2', found['private']['id'])
+        self.assertEqual(['missing'], found.missing)
+        self.assertIn('name=private&name=missing', self.requests[1][1])
+
+    def test_quota_usage_report(self):
+        self.responses.append(_resp(200, {'quotas': [
+            {'tenant_id': 'a', 'network': 2}]}))
+        self.responses.append(_resp(200, {'networks': [
+            {'tenant_id': 'a'}, {'tenant_id': 'b'}, {'tenant_id': ''}]}))
+        self.responses.append(_resp(200, {'quota': {'network': 10}}))
+        report = self._run(self.client.quota_usage_report(
+            resources=['network']))
+        self.assertEqual(
+            [('a', 1, 2, 0.5), ('b', 1, 10, 0.1)],
+            [(row['tenant_id'], row['used'], row['limit'],
+              row['utilization']) for row in report])
+        self.assertIn('/quotas/b/default', self.requests[2][1])
+
+    def test_list_by_ids(self):
+        self.responses.append(_resp(200, {'subnets': [{'id': 's1'},
+                                                      {'id': 's2'}]}))
+        res = self._run(self.client.list_by_ids('subnets',
+                                                ['s1', 's2', 's1']))
+        self.assertEqual({'s1': {'id': 's1'}, 's2': {'id': 's2'}}, res)
+        self.assertEqual(1, len(self.requests))
+        self.assertIn('id=s1&id=s2', self.requests[0][1])
+
+    def test_watch(self):
+        sleep = self._patch_sleep()
+        self.responses.append(_resp(200, {'ports': [
+            {'id': 'p1', 'revision_number': 1}]}))
+        self.responses.append(_resp(200, {'ports': [
+            {'id': 'p1', 'name': 'a'}]}))
+        self.responses.append(_resp(200, {'ports': []}))
+        watch = self.client.watch_ports(interval=7)
+        self.assertEqual(('added', {'id': 'p1', 'name': 'a'}),
+                         self._run(watch.__anext__()))
+        self.assertEqual(('deleted', {'id': 'p1', 'name': 'a'}),
+                         self._run(watch.__anext__()))
+        sleep.assert_called_once_with(7)
+        self.assertIn('fields=id', self.requests[0][1])
+        self.assertIn('id=p1', self.requests[1][1])
+
+    def test_governor(self):
+        self.client.governor = ratelimit.Governor(concurrency=1)
+        in_flight = []
+        fake_request = self.client.async_httpclient.request
+
+        def _request(*args, **kwargs):
+            in_flight.append(
+                self.client.governor.stats()['all']['in_flight'])
+            return fake_request(*args, **kwargs)
+
+        self.client.async_httpclient.request = _request
+        self.responses.append(_resp(200, {'network': {'id': 'net1'}}))
+        self.responses.append(_resp(200, {'network': {'id': 'net2'}}))
+        tasks = [self.loop.create_task(self.client.show_network(net_id))
+                 for net_id in ('net1', 'net2')]
+        for task in tasks:
+            self._run(task)
+        self.assertEqual([1, 1], in_flight)
+        stats = self.client.governor.stats()['all']
+        self.assertEqual(0, stats['in_flight'])
+        self.assertEqual(2, stats['wait']['count'])
+
+    def test_governor_many_requests(self):
+        # Requests waiting for their turn do not take the executor threads
+        # the authentication runs in.
+        self.client.governor = ratelimit.Governor(concurrency=1)
+        httpclient = self.client.async_httpclient
+        httpclient.auth_token = None
+        httpclient._fetch_auth = lambda reauthenticate: (TOKEN, ENDPOINT_URL)
+        net_ids = ['net%d' % i for i in range(64)]
+        for net_id in net_ids:
+            self.responses.append(_resp(200, {'network': {'id': net_id}}))
+        tasks = [self.loop.create_task(self.client.show_network(net_id))
+                 for net_id in net_ids]
+        self.assertEqual(
+            net_ids,
+            [self._run(asyncio.wait_for(task, 10))['network']['id']
+             for task in tasks])
+        stats = self.client.governor.stats()['all']
+        self.assertEqual(0, stats['in_flight'])
+        self.assertEqual(0, stats['queued'])
+        self.assertEqual(64, stats['wait']['count'])
+
+    def test_governor_rate(self):
+        self.client.governor = ratelimit.Governor(rate=1000, burst=1)
+        net_ids = ['net1', 'net2', 'net3']
+        for net_id in net_ids:
+            self.responses.append(_resp(200, {'network': {'id': net_id}}))
+        tasks = [self.loop.create_task(self.client.show_network(net_id))
+                 for net_id in net_ids]
+        self.assertEqual(net_ids,
+                         [self._run(task)['network']['id'] for task in tasks])
+        self.assertEqual(3, self.client.governor.stats()['all']['wait'][
+            'count'])
+
+    def _patch_sleep(self):
+        return self.useFixture(fixtures.MockPatch(
+            'asyncio.sleep', side_effect=lambda delay: self._done())).mock
+
+    def test_retry_on_connection_failure(self):
+        sleep = self._patch_sleep()
+        self.client.retries = 1
+        self.responses.append(exceptions.ConnectionFailed(reason='down'))
+        self.responses.append(_resp(200, {'network': {'id': 'net1'}}))
+        res = self._run(self.client.show_network('net1'))
+        self.assertEqual('net1', res['network']['id'])
+        self.assertEqual(2, len(self.requests))
+        self.assertEqual(1, sleep.call_count)
+
+    def test_retry_policy(self):
+        sleep = self._patch_sleep()
+        self.client.retries = 2
+        resp, text = _resp(503, None)
+        resp.headers['Retry-After'] = '3'
+        self.responses.append((resp, text))
+        self.responses.append(_resp(200, {'network': {'id': 'net1'}}))
+        res = self._run(self.client.show_network('net1'))
+        self.assertEqual('net1', res['network']['id'])
+        sleep.assert_called_once_with(3)
+        self.assertEqual(1, self.client.retry_policy.stats()['retried'])
+
+    def test_metrics(self):
+        self._patch_sleep()
+        records = []
+        self.client.metrics = metrics.RequestMetrics(
+            callbacks=[records.append])
+        self.client.retries = 1
+        self.responses.append(_resp(503, None))
+        self.responses.append(_resp(200, {'network': {'id': 'net1'}}))
+        self._run(self.client.show_network('net1'))
+        self.assertEqual(
+            [('GET', 503, 0, 'req-503'), ('GET', 200, 1, 'req-200')],
+            [(r.method, r.status, r.attempt, r.request_id)
+             for r in records])
+        self.assertEqual(metrics.path_template('/networks/net1'),
+                         records[0].path)
+
+    def test_retry_gives_up(self):
+        self._patch_sleep()
+        self.client.retries = 1
+        self.responses.append(_resp(503, None))
+        self.responses.append(_resp(503, None))
+        self.assertRaises(exceptions.ServiceUnavailable,
+                          self._run, self.client.show_network('net1'))
+        self.assertEqual(2, len(self.requests))
+
+    def test_reauthenticate_on_401(self):
+        self.client.httpclient.authenticate = lambda: None
+        self.responses.append(_resp(401, None))
+        self.responses.append(_resp(200, {'network': {'id': 'net1'}}))
+        res = self._run(self.client.show_network('net1'))
+        self.assertEqual('net1', res['network']['id'])
+        self.assertEqual(2, len(self.requests))
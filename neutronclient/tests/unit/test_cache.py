@@ -0,0 +1,71 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import testtools
+
+from neutronclient.common import cache
+
+
+class LRUCacheTest(testtools.TestCase):
+
+    def setUp(self):
+        super(LRUCacheTest, self).setUp()
+        self.now = 0
+        self.cache = cache.LRUCache(2, ttl=10, timer=lambda: self.now)
+
+    def test_get_and_set(self):
+        self.assertIsNone(self.cache.get('a'))
+        self.cache.set('a', 1)
+        self.assertEqual(1, self.cache.get('a'))
+        self.assertEqual({'hits': 1, 'misses': 1, 'size': 1, 'maxsize': 2},
+                         self.cache.stats())
+
+    def test_evicts_least_recently_used(self):
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+        self.cache.get('a')
+        self.cache.set('c', 3)
+        self.assertEqual(1, self.cache.get('a'))
+        self.assertIsNone(self.cache.get('b'))
+        self.assertEqual(3, self.cache.get('c'))
+
+    def test_expiry(self):
+        self.cache.set('a', 1)
+        self.now = 9
+        self.assertEqual(1, self.cache.get('a'))
+        self.now = 10
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(0, len(self.cache))
+
+    def test_invalidate(self):
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+        self.cache.invalidate('a')
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(2, self.cache.get('b'))
+        self.cache.invalidate()
+        self.assertEqual(0, len(self.cache))
+
+    def test_maxbytes(self):
+        cache_ = cache.LRUCache(None, maxbytes=10)
+        cache_.set('a', 1, size=4)
+        cache_.set('b', 2, size=4)
+        cache_.set('c', 3, size=4)
+        self.assertIsNone(cache_.get('a'))
+        self.assertEqual(2, cache_.get('b'))
+        self.assertEqual(8, cache_.stats()['bytes'])
+        cache_.set('d', 4, size=11)
+        self.assertIsNone(cache_.get('d'))
+        cache_.set('b', 2, size=1)
+        self.assertEqual(5, cache_.nbytes)
+        cache_.invalidate('c')
+        self.assertEqual(1, cache_.nbytes)
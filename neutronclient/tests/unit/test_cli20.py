@@ -18,6 +18,7 @@ import contextlib
 import itertools
 import json
 import sys
+import threading
 
 import mock
 from mox3 import mox
@@ -61,6 +62,9 @@ class FakeStdout(object):
     def write(self, text):
         self.content.append(text)
 
+    def flush(self):
+        pass
+
     def make_string(self):
         result = ''
         for line in self.content:
@@ -181,6 +185,10 @@ class CLITestV20Base(base.BaseTestCase):
                          cmd_resource=None, parent_id=None):
         return name_or_id
 
+    def _find_resourceids(self, client, resource, names_or_ids,
+                          cmd_resource=None, parent_id=None):
+        return list(names_or_ids)
+
     def setUp(self, plurals=None):
         """Prepare the test environment."""
         super(CLITestV20Base, self).setUp()
@@ -198,6 +206,8 @@ class CLITestV20Base(base.BaseTestCase):
                    new=self._find_resourceid).start()
         mock.patch('neutronclient.neutron.v2_0.find_resourceid_by_id',
                    new=self._find_resourceid).start()
+        mock.patch('neutronclient.neutron.v2_0.find_resourceids_by_name_or_id',
+                   new=self._find_resourceids).start()
 
         self.client = client.Client(token=TOKEN, endpoint_url=self.endurl)
 
@@ -800,6 +810,197 @@ class ClientV2TestJson(CLITestV20Base):
         self.mox.VerifyAll()
         self.mox.UnsetStubs()
 
+    def _stub_two_page_list(self, path, resources):
+        fake_query = "marker=myid2&limit=2"
+        reses1 = {resources: [{'id': 'myid1', },
+                              {'id': 'myid2', }],
+                  '%s_links' % resources: [{'href': end_url(path, fake_query),
+                                            'rel': 'next'}]}
+        reses2 = {resources: [{'id': 'myid3', },
+                              {'id': 'myid4', }]}
+        resp_headers = {'x-openstack-request-id': REQUEST_ID}
+        self.client.httpclient.request(
+            end_url(path, ""), 'GET',
+            body=None,
+            headers=mox.ContainsKeyValue(
+                'X-Auth-Token', TOKEN)).AndReturn(
+                    (MyResp(200, resp_headers),
+                     self.client.serialize(reses1)))
+        self.client.httpclient.request(
+            MyUrlComparator(end_url(path, fake_query), self.client), 'GET',
+            body=None,
+            headers=mox.ContainsKeyValue(
+                'X-Auth-Token', TOKEN)).AndReturn(
+                    (MyResp(200, resp_headers),
+                     self.client.serialize(reses2)))
+
+    def test_list_with_prefetch(self):
+        self.mox.StubOutWithMock(self.client.httpclient, "request")
+        self._stub_two_page_list('/test', 'tests')
+        self.mox.ReplayAll()
+        result = self.client.list('tests', '/test', prefetch=2)
+        self.mox.VerifyAll()
+        self.mox.UnsetStubs()
+
+        self.assertEqual(['myid1', 'myid2', 'myid3', 'myid4'],
+                         [r['id'] for r in result['tests']])
+        self.assertEqual([REQUEST_ID, REQUEST_ID], result.request_ids)
+
+    def test_list_with_client_prefetch_retrieve_all_false(self):
+        self.client.page_prefetch = 1
+        self.mox.StubOutWithMock(self.client.httpclient, "request")
+        self._stub_two_page_list('/test', 'tests')
+        self.mox.ReplayAll()
+        result = self.client.list('tests', '/test', retrieve_all=False)
+        pages = [[r['id'] for r in page['tests']] for page in result]
+        self.mox.VerifyAll()
+        self.mox.UnsetStubs()
+
+        self.assertEqual([['myid1', 'myid2'], ['myid3', 'myid4']], pages)
+        self.assertEqual([REQUEST_ID, REQUEST_ID], result.request_ids)
+
+    def test_list_with_prefetch_propagates_errors(self):
+        self.mox.StubOutWithMock(self.client.httpclient, "request")
+        self.client.httpclient.request(
+            end_url('/test', ""), 'GET',
+            body=None,
+            headers=mox.ContainsKeyValue(
+                'X-Auth-Token', TOKEN)).AndReturn((MyResp(404), ''))
+        self.mox.ReplayAll()
+        self.assertRaises(exceptions.NotFound,
+                          self.client.list, 'tests', '/test', prefetch=2)
+        self.mox.VerifyAll()
+        self.mox.UnsetStubs()
+
+    def test_list_with_prefetch_stopped_early(self):
+        closed = threading.Event()
+
+        def _pagination(collection, path, **params):
+            try:
+                while True:
+                    yield {collection: [{'id': 'myid'}]}
+            finally:
+                closed.set()
+
+        with mock.patch.object(self.client, '_pagination',
+                               side_effect=_pagination):
+            pages = self.client._prefetch_pagination(1, 'tests', '/test')
+            next(pages)
+            pages.close()
+            # The fetcher gives up on its full queue and returns.
+            self.assertTrue(closed.wait(5))
+
+    def test_create_bulk(self):
+        ports = [{'name': 'port%d' % i} for i in range(3)]
+        self.mox.StubOutWithMock(self.client.httpclient, "request")
+        for req_id, chunk in (('req-1', ports[:2]), ('req-2', ports[2:])):
+            created = [dict(port, id='id-' + port['name']) for port in chunk]
+            self.client.httpclient.request(
+                end_url('/ports'), 'POST',
+                body=MyComparator({'ports': chunk}, self.client),
+                headers=mox.ContainsKeyValue('X-Auth-Token', TOKEN)
+            ).AndReturn((MyResp(201, {'x-openstack-request-id': req_id}),
+                         self.client.serialize({'ports': created})))
+        self.mox.ReplayAll()
+        result = self.client.create_ports_bulk(ports, chunk_size=2)
+        self.mox.VerifyAll()
+        self.mox.UnsetStubs()
+
+        self.assertEqual(['id-port0', 'id-port1', 'id-port2'],
+                         [port['id'] for port in result['ports']])
+        self.assertEqual(['req-1', 'req-2'], result.request_ids)
+        self.assertEqual([['req-1'], ['req-1'], ['req-2']],
+                         [port.request_ids for port in result['ports']])
+
+    def test_list_by_ids(self):
+        self.mox.StubOutWithMock(self.client.httpclient, "request")
+        self.client.httpclient.request(
+            MyUrlComparator(end_url('/subnets',
+                                    'id=b&id=a&fields=cidr&fields=id'),
+                            self.client),
+            'GET', body=None,
+            headers=mox.ContainsKeyValue('X-Auth-Token', TOKEN)
+        ).AndReturn((MyResp(200), self.client.serialize(
+            {'subnets': [{'id': 'a', 'cidr': '10.0.0.0/24'}]})))
+        self.mox.ReplayAll()
+        result = self.client.list_by_ids('subnets', ['b', 'a', 'b', None],
+                                         fields='cidr')
+        self.mox.VerifyAll()
+        self.mox.UnsetStubs()
+        self.assertEqual({'a': {'id': 'a', 'cidr': '10.0.0.0/24'}}, result)
+
+    def test_list_by_ids_parallel_chunks(self):
+        # Room for a single 'id=N' filter per request.
+        mock.patch('neutronclient.v2_0.client.FILTER_URI_RESERVED',
+                   new=client.client.MAX_URI_LEN - 5).start()
+        ids = [str(i) for i in range(6)]
+        with mock.patch.object(self.client, 'list_ports') as list_ports:
+            list_ports.side_effect = lambda **params: {
+                'ports': [{'id': i} for i in params['id']]}
+            result = self.client.list_by_ids('ports', ids + ids,
+                                             concurrency=3)
+        self.assertEqual(6, list_ports.call_count)
+        self.assertEqual(sorted(ids), sorted(result))
+        for call in list_ports.call_args_list:
+            self.assertEqual(1, len(call[1]['id']))
+
+    def _stream_resp(self, body):
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.headers = {'x-openstack-request-id': REQUEST_ID}
+        resp.raw = six.BytesIO(self.client.serialize(body).encode('utf-8'))
+        resp.request = MyRequest('GET')
+        return resp
+
+    def test_list_stream(self):
+        self.mox.StubOutWithMock(self.client.httpclient, "request")
+        path = '/test'
+        resources = 'tests'
+        fake_query = "marker=myid2&limit=2"
+        reses1 = {'%s_links' % resources: [{'href': end_url(path, fake_query),
+                                            'rel': 'next'}],
+                  resources: [{'id': 'myid1', },
+                              {'id': 'myid2', }]}
+        reses2 = {resources: [{'id': 'myid3', }]}
+        self.client.httpclient.request(
+            end_url(path, ""), 'GET',
+            body=None, stream=True,
+            headers=mox.ContainsKeyValue(
+                'X-Auth-Token', TOKEN)).AndReturn(
+                    (self._stream_resp(reses1), None))
+        self.client.httpclient.request(
+            MyUrlComparator(end_url(path, fake_query), self.client), 'GET',
+            body=None, stream=True,
+            headers=mox.ContainsKeyValue(
+                'X-Auth-Token', TOKEN)).AndReturn(
+                    (self._stream_resp(reses2), None))
+        self.mox.ReplayAll()
+        result = self.client.list(resources, path, stream=True)
+        self.assertEqual({'id': 'myid1'}, next(result))
+        self.assertEqual([REQUEST_ID], result.request_ids)
+        self.assertEqual(['myid2', 'myid3'], [r['id'] for r in result])
+        self.assertEqual([REQUEST_ID, REQUEST_ID], result.request_ids)
+        self.mox.VerifyAll()
+        self.mox.UnsetStubs()
+
+    def test_list_stream_error(self):
+        self.mox.StubOutWithMock(self.client.httpclient, "request")
+        resp = self._stream_resp({'NeutronError': {'type': 'NotFound',
+                                                   'message': 'gone',
+                                                   'detail': ''}})
+        resp.status_code = 404
+        self.client.httpclient.request(
+            end_url('/test', ""), 'GET',
+            body=None, stream=True,
+            headers=mox.ContainsKeyValue(
+                'X-Auth-Token', TOKEN)).AndReturn((resp, None))
+        self.mox.ReplayAll()
+        result = self.client.list('tests', '/test', stream=True)
+        error = self.assertRaises(exceptions.NotFound, next, result)
+        self.assertIn('gone', error.message)
+        self.mox.VerifyAll()
+        self.mox.UnsetStubs()
+
     def test_deserialize_without_data(self):
         data = u''
         result = self.client.deserialize(data, 200)
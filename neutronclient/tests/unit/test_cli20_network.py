@@ -16,9 +16,12 @@
 import itertools
 import sys
 
+import mock
 from mox3 import mox
 from oslo_serialization import jsonutils
+from oslo_utils import uuidutils
 
+from neutronclient import client
 from neutronclient.common import exceptions
 from neutronclient.neutron.v2_0 import network
 from neutronclient import shell
@@ -587,6 +590,44 @@ class CLITestV20DeleteNetworkJSON(test_cli20.CLITestV20Base):
                           resource, cmd, myid1, args, extra_id=myid2,
                           delete_fail=True)
 
+    def test_bulk_delete_network_concurrency(self):
+        cmd = network.DeleteNetwork(test_cli20.MyApp(sys.stdout), None)
+        uuid1 = uuidutils.generate_uuid()
+        uuid2 = uuidutils.generate_uuid()
+        names = ['net%d' % i for i in range(6)]
+        args = ['--concurrency', '3', uuid1] + names + [uuid2]
+
+        def _find(client, resource, name_or_id, **kwargs):
+            if name_or_id == 'net2':
+                raise exceptions.NeutronClientNoUniqueMatch(
+                    resource=resource, name=name_or_id)
+            return 'id-' + name_or_id
+
+        def _delete(net_id):
+            if net_id in (uuid2, 'id-net4'):
+                raise exceptions.NetworkNotFoundClient()
+
+        neutron_client = mock.Mock()
+        neutron_client.delete_network.side_effect = _delete
+        with mock.patch.object(cmd, 'get_client',
+                               return_value=neutron_client), \
+                mock.patch('neutronclient.neutron.v2_0.'
+                           'find_resourceid_by_name_or_id',
+                           side_effect=_find) as find:
+            cmd_parser = cmd.get_parser('delete_network')
+            parsed_args = cmd_parser.parse_args(args)
+            e = self.assertRaises(exceptions.NeutronCLIError,
+                                  cmd.take_action, parsed_args)
+
+        # UUIDs are deleted without being looked up first.
+        self.assertEqual(sorted(names),
+                         sorted(c[0][2] for c in find.call_args_list))
+        self.assertEqual(7, neutron_client.delete_network.call_count)
+        self.assertIn("'net4, %s'" % uuid2, str(e))
+        self.assertIn("'net2'", str(e))
+        self.assertIn('Deleted network(s): %s, net0, net1, net3, net5' %
+                      uuid1, self.fake_stdout.make_string())
+
 
 class CLITestV20ExtendListNetworkJSON(test_cli20.CLITestV20Base):
     def _test_extend_list(self, mox_calls):
@@ -634,19 +675,15 @@ class CLITestV20ExtendListNetworkJSON(test_cli20.CLITestV20Base):
 
     def test_extend_list_exceed_max_uri_len(self):
         def mox_calls(path, data):
+            # Leave room for 9 'id=mysubidN' filters only, the request has
+            # to be split in 2 up front.
+            mock.patch('neutronclient.v2_0.client.FILTER_URI_RESERVED',
+                       new=client.MAX_URI_LEN - 110).start()
+            mock.patch('neutronclient.v2_0.client.LIST_BY_IDS_CONCURRENCY',
+                       new=1).start()
             sub_data_lists = [data[:len(data) - 1], data[len(data) - 1:]]
-            filters, response = self._build_test_data(data)
-
-            # 1 char of extra URI len will cause a split in 2 requests
-            self.mox.StubOutWithMock(self.client.httpclient,
-                                     "_check_uri_length")
-            self.client.httpclient._check_uri_length(mox.IgnoreArg()).AndRaise(
-                exceptions.RequestURITooLong(excess=1))
-
             for data in sub_data_lists:
                 filters, response = self._build_test_data(data)
-                self.client.httpclient._check_uri_length(
-                    mox.IgnoreArg()).AndReturn(None)
                 self.client.httpclient.request(
                     test_cli20.MyUrlComparator(
                         test_cli20.end_url(
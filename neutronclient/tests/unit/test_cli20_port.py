@@ -17,8 +17,10 @@
 import itertools
 import sys
 
+import mock
 from mox3 import mox
 
+from neutronclient.common import exceptions
 from neutronclient.neutron.v2_0 import port
 from neutronclient import shell
 from neutronclient.tests.unit import test_cli20
@@ -28,6 +30,33 @@ class CLITestV20PortJSON(test_cli20.CLITestV20Base):
     def setUp(self):
         super(CLITestV20PortJSON, self).setUp(plurals={'tags': 'tag'})
 
+    def test_bulk_create_port(self):
+        cmd = port.BulkCreatePort(test_cli20.MyApp(sys.stdout), None)
+        lines = ['{"network_id": "netid", "name": "port1"}\n',
+                 '\n',
+                 '# a comment\n',
+                 '{network_id: netid, name: port2}\n']
+        created = {'ports': [{'id': 'id1', 'name': 'port1'},
+                             {'id': 'id2', 'name': 'port2'}]}
+        self.client.create_ports_bulk = mock.Mock(return_value=created)
+        parsed_args = cmd.get_parser('port-bulk-create').parse_args(
+            ['--chunk-size', '10'])
+        with mock.patch.object(cmd, 'get_client', return_value=self.client), \
+                mock.patch('sys.stdin', new=iter(lines)):
+            columns, data = cmd.take_action(parsed_args)
+        self.client.create_ports_bulk.assert_called_once_with(
+            [{'network_id': 'netid', 'name': 'port1'},
+             {'network_id': 'netid', 'name': 'port2'}], chunk_size=10)
+        self.assertEqual(['id', 'name'], columns)
+        self.assertEqual([('id1', 'port1'), ('id2', 'port2')], list(data))
+
+    def test_bulk_create_port_invalid_line(self):
+        cmd = port.BulkCreatePort(test_cli20.MyApp(sys.stdout), None)
+        parsed_args = cmd.get_parser('port-bulk-create').parse_args([])
+        with mock.patch('sys.stdin', new=iter(['[1, 2]\n'])):
+            self.assertRaises(exceptions.CommandError,
+                              cmd.take_action, parsed_args)
+
     def test_create_port(self):
         # Create port: netid.
         resource = 'port'
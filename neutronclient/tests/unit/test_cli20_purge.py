@@ -16,6 +16,8 @@
 
 import sys
 
+import mock
+
 from neutronclient.neutron.v2_0 import purge
 from neutronclient.tests.unit import test_cli20
 
@@ -98,3 +100,50 @@ class CLITestV20Purge(test_cli20.CLITestV20Base):
         # and all are not deleteable
         deleted = self._generate_resources_dict()
         self._verify_result(my_purge, deleted, failed)
+
+    def test_purge(self):
+        tenant_id = 'my-tenant'
+        my_purge = purge.Purge(test_cli20.MyApp(sys.stdout), None)
+        neutron_client = mock.Mock()
+        neutron_client.list_floatingips.return_value = iter(
+            [{'floatingips': [{'id': 'fip1', 'tenant_id': tenant_id}]}])
+        neutron_client.list_ports.return_value = iter(
+            [{'ports': [{'id': 'port1', 'tenant_id': tenant_id,
+                         'device_id': 'router1',
+                         'device_owner': 'network:router_interface'},
+                        {'id': 'port2', 'tenant_id': tenant_id,
+                         'device_id': 'vm1',
+                         'device_owner': 'compute:nova'}]},
+             {'ports': [{'id': 'port3', 'tenant_id': tenant_id,
+                         'device_id': 'vm2',
+                         'device_owner': 'compute:nova'}]}])
+        neutron_client.list_routers.return_value = iter(
+            [{'routers': [{'id': 'router1', 'tenant_id': tenant_id}]}])
+        neutron_client.list_networks.return_value = iter(
+            [{'networks': [{'id': 'net1', 'tenant_id': tenant_id},
+                           {'id': 'net2', 'tenant_id': 'other'}]}])
+        neutron_client.list_security_groups.return_value = iter([])
+        neutron_client.delete_network.side_effect = Exception()
+
+        args = ['--concurrency', '2', tenant_id]
+        parsed_args = my_purge.get_parser('purge').parse_args(args)
+        with mock.patch.object(my_purge, 'get_client',
+                               return_value=neutron_client):
+            my_purge.take_action(parsed_args)
+
+        neutron_client.list_ports.assert_called_once_with(
+            retrieve_all=False, tenant_id=tenant_id, limit=my_purge.page_size,
+            fields=['id', 'tenant_id', 'device_id', 'device_owner'])
+        calls = [name for name, args, kwargs in neutron_client.mock_calls
+                 if not name.startswith('list_')]
+        self.assertEqual(['delete_floatingip', 'remove_interface_router',
+                          'delete_port', 'delete_port', 'delete_router',
+                          'delete_network'], calls)
+        neutron_client.remove_interface_router.assert_called_once_with(
+            'router1', {'port_id': 'port1'})
+        self.assertEqual(5, my_purge.deleted_resources)
+        self.assertEqual(5, my_purge.total_resources)
+        output = self.fake_stdout.make_string()
+        self.assertIn('100% complete (5/5', output)
+        self.assertIn('The following resources could not be deleted: '
+                      '1 network', output)
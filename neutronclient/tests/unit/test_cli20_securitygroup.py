@@ -16,11 +16,12 @@
 
 import sys
 
+import mock
 from mox3 import mox
 from oslo_utils import uuidutils
 import six
 
-from neutronclient.common import exceptions
+from neutronclient import client
 from neutronclient.common import utils
 from neutronclient.neutron.v2_0 import securitygroup
 from neutronclient.tests.unit import test_cli20
@@ -240,31 +241,23 @@ class CLITestV20SecurityGroupsJSON(test_cli20.CLITestV20Base):
         self.mox.VerifyAll()
         self.mox.UnsetStubs()
 
-    def _build_test_data(self, data, excess=0):
-        # Length of a query filter on security group rule id
-        # in these testcases, id='secgroupid%02d' (with len(id)=12)
-        sec_group_id_filter_len = 12
-
+    def _build_test_data(self, data, chunk_size=None):
         response = []
         replace_rules = {'security_group_id': 'security_group',
                          'remote_group_id': 'remote_group'}
 
         search_opts = {'fields': ['id', 'name']}
-        sec_group_ids = set()
+        sec_group_ids = []
         for rule in data:
             for key in replace_rules:
-                if rule.get(key):
-                    sec_group_ids.add(rule[key])
+                if rule.get(key) and rule[key] not in sec_group_ids:
+                    sec_group_ids.append(rule[key])
                     response.append({'id': rule[key], 'name': 'default'})
-        sec_group_ids = list(sec_group_ids)
 
         result = []
 
-        sec_group_count = len(sec_group_ids)
-        max_size = ((sec_group_id_filter_len * sec_group_count) - excess)
-        chunk_size = max_size // sec_group_id_filter_len
-
-        for i in range(0, sec_group_count, chunk_size):
+        chunk_size = chunk_size or len(sec_group_ids)
+        for i in range(0, len(sec_group_ids), chunk_size):
             search_opts['id'] = sec_group_ids[i: i + chunk_size]
             params = utils.safe_encode_dict(search_opts)
             resp_str = self.client.serialize({'security_groups': response})
@@ -296,16 +289,15 @@ class CLITestV20SecurityGroupsJSON(test_cli20.CLITestV20Base):
 
     def test_extend_list_exceed_max_uri_len(self):
         def mox_calls(path, data):
-            # 1 char of extra URI len will cause a split in 2 requests
-            self.mox.StubOutWithMock(self.client.httpclient,
-                                     '_check_uri_length')
-            self.client.httpclient._check_uri_length(mox.IgnoreArg()).AndRaise(
-                exceptions.RequestURITooLong(excess=1))
-            responses = self._build_test_data(data, excess=1)
+            # Leave room for 20 'id=secgroupidNN' filters only, the 21
+            # security groups have to be split in 2 requests up front.
+            mock.patch('neutronclient.v2_0.client.FILTER_URI_RESERVED',
+                       new=client.MAX_URI_LEN - 330).start()
+            mock.patch('neutronclient.v2_0.client.LIST_BY_IDS_CONCURRENCY',
+                       new=1).start()
+            responses = self._build_test_data(data, chunk_size=20)
 
             for item in responses:
-                self.client.httpclient._check_uri_length(
-                    mox.IgnoreArg()).AndReturn(None)
                 self.client.httpclient.request(
                     test_cli20.MyUrlComparator(
                         test_cli20.end_url(path, item['filter']), self.client),
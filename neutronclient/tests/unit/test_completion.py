@@ -0,0 +1,70 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+
+import fixtures
+import mock
+import testtools
+
+from neutronclient.common import completion
+
+
+class CompletionIndexTest(testtools.TestCase):
+
+    index = {'options': ['--os-cloud'], 'commands': {'net-list': ['-h']}}
+
+    def setUp(self):
+        super(CompletionIndexTest, self).setUp()
+        self.cache_dir = self.useFixture(fixtures.TempDir()).path
+        self.entry_points = []
+        self.useFixture(fixtures.MockPatch(
+            'pkg_resources.iter_entry_points',
+            side_effect=lambda namespace: iter(self.entry_points)))
+
+    def test_cache_key_changes_with_extensions(self):
+        key = completion.cache_key('2.0')
+        self.assertEqual(key, completion.cache_key('2.0'))
+        self.entry_points.append('fox_sockets = fox.sockets')
+        self.assertNotEqual(key, completion.cache_key('2.0'))
+
+    def test_get_index_builds_once(self):
+        build = mock.Mock(return_value=self.index)
+        self.assertEqual(self.index, completion.get_index(
+            '2.0', build, cache_dir=self.cache_dir))
+        self.assertEqual(self.index, completion.get_index(
+            '2.0', build, cache_dir=self.cache_dir))
+        build.assert_called_once_with()
+
+    def test_get_index_replaces_outdated_index(self):
+        build = mock.Mock(return_value=self.index)
+        completion.get_index('2.0', build, cache_dir=self.cache_dir)
+        self.entry_points.append('fox_sockets = fox.sockets')
+        completion.get_index('2.0', build, cache_dir=self.cache_dir)
+        self.assertEqual(2, build.call_count)
+        self.assertEqual(
+            [os.path.basename(completion.cache_path(
+                completion.cache_key('2.0')))],
+            os.listdir(self.cache_dir))
+
+    def test_load_index_ignores_corrupted_file(self):
+        path = os.path.join(self.cache_dir, 'completion-x.json')
+        with open(path, 'w') as f:
+            f.write('{"commands": ')
+        self.assertIsNone(completion.load_index(path))
+        self.assertIsNone(completion.load_index(path + '.missing'))
+
+    def test_save_index_ignores_errors(self):
+        path = os.path.join(self.cache_dir, 'file', 'completion-x.json')
+        open(os.path.join(self.cache_dir, 'file'), 'w').close()
+        completion.save_index(path, self.index)
+        self.assertIsNone(completion.load_index(path))
@@ -141,6 +141,39 @@ class TestHTTPClient(TestHTTPClientMixin, testtools.TestCase):
         self.assertEqual(200, resp.status_code)
         self.assertEqual(text, resp_text)
 
+    def test_request_reuses_session(self):
+        self.requests.register_uri(METHOD, URL)
+        session = self.http.session
+        self.http.request(URL, METHOD)
+        self.http.request(URL, METHOD)
+        self.assertIs(session, self.http.session)
+        self.assertEqual(2, self.requests.call_count)
+
+    def test_default_pool_settings(self):
+        adapter = self.http.session.get_adapter('https://test.test')
+        self.assertEqual(client.DEFAULT_POOL_CONNECTIONS,
+                         adapter._pool_connections)
+        self.assertEqual(client.DEFAULT_POOL_MAXSIZE, adapter._pool_maxsize)
+        self.assertFalse(adapter._pool_block)
+
+    def test_custom_pool_settings(self):
+        http = client.construct_http_client(token=AUTH_TOKEN,
+                                            endpoint_url=END_URL,
+                                            pool_connections=4,
+                                            pool_maxsize=32,
+                                            pool_block=True)
+        for scheme in ('http', 'https'):
+            adapter = http.session.get_adapter('%s://test.test' % scheme)
+            self.assertEqual(4, adapter._pool_connections)
+            self.assertEqual(32, adapter._pool_maxsize)
+            self.assertTrue(adapter._pool_block)
+
+    def test_keep_alive_disabled(self):
+        self.http = client.HTTPClient(token=AUTH_TOKEN, endpoint_url=END_URL,
+                                      keep_alive=False)
+        self._test_headers({'Accept': 'application/json',
+                            'Connection': 'close'})
+
 
 class TestHTTPClientWithReqId(TestHTTPClientMixin, testtools.TestCase):
     """Tests for when global_request_id is set."""
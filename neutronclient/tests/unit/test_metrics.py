@@ -0,0 +1,133 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+from oslo_utils import uuidutils
+from requests_mock.contrib import fixture as mock_fixture
+import testtools
+
+from neutronclient.common import exceptions
+from neutronclient.common import metrics
+from neutronclient.v2_0 import client
+
+
+ENDPOINT_URL = 'http://neutron.test:9696'
+
+
+def _record(path='/ports/%s', status=200, latency=0.2, attempt=0):
+    return metrics.RequestRecord(
+        method='GET', path=path, status=status, latency=latency,
+        request_bytes=0, response_bytes=100, attempt=attempt,
+        request_id='req-1')
+
+
+class RequestMetricsTest(testtools.TestCase):
+
+    def test_path_template(self):
+        port_id = uuidutils.generate_uuid()
+        self.assertEqual('/ports/%s', metrics.path_template(
+            '/ports/%s?fields=id' % port_id))
+        self.assertEqual('/quotas/%s', metrics.path_template(
+            '/quotas/' + uuidutils.generate_uuid(dashed=False)))
+        self.assertEqual('/lbaas/loadbalancers/%s/stats',
+                         metrics.path_template(
+                             '/lbaas/loadbalancers/%s/stats' % port_id))
+        self.assertEqual('/networks/my-net',
+                         metrics.path_template('/networks/my-net'))
+
+    def test_stats(self):
+        request_metrics = metrics.RequestMetrics()
+        request_metrics.record(_record(latency=0.2))
+        request_metrics.record(_record(latency=0.5, attempt=1))
+        request_metrics.record(_record(status=404))
+        stats = request_metrics.stats()
+        self.assertEqual(2, len(stats))
+        self.assertEqual(
+            {'method': 'GET', 'path': '/ports/%s', 'status': 200,
+             'count': 2, 'retries': 1, 'request_bytes': 0,
+             'response_bytes': 200, 'latency_sum': 0.7,
+             'latency_max': 0.5},
+            dict((k, v) for k, v in stats[0].items()
+                 if k != 'latency_buckets'))
+
+    def test_callbacks(self):
+        callback = mock.Mock()
+        request_metrics = metrics.RequestMetrics(
+            callbacks=[mock.Mock(side_effect=ValueError), callback])
+        record = _record()
+        request_metrics.record(record)
+        callback.assert_called_once_with(record)
+
+    def test_to_prometheus(self):
+        request_metrics = metrics.RequestMetrics()
+        request_metrics.record(_record(path='/ports/"%s"', latency=0.02))
+        text = request_metrics.to_prometheus()
+        labels = 'method="GET",path="/ports/\\"%s\\"",status="200"'
+        self.assertIn('# TYPE neutronclient_requests_total counter\n'
+                      'neutronclient_requests_total{%s} 1\n' % labels, text)
+        self.assertIn('neutronclient_request_duration_seconds_bucket'
+                      '{%s,le="0.01"} 0\n' % labels, text)
+        self.assertIn('neutronclient_request_duration_seconds_bucket'
+                      '{%s,le="0.05"} 1\n' % labels, text)
+        self.assertIn('neutronclient_request_duration_seconds_bucket'
+                      '{%s,le="+Inf"} 1\n' % labels, text)
+        self.assertIn('neutronclient_request_duration_seconds_count'
+                      '{%s} 1\n' % labels, text)
+
+    def test_format_summary(self):
+        request_metrics = metrics.RequestMetrics()
+        request_metrics.record(_record(path='/ports', latency=0.1))
+        request_metrics.record(_record(latency=0.3))
+        lines = request_metrics.format_summary().splitlines()
+        self.assertEqual(4, len(lines))
+        self.assertIn('/ports/%s', lines[1])
+        self.assertIn('/ports ', lines[2])
+        self.assertEqual('Total: 2 requests in 0.400 seconds', lines[3])
+
+
+class ClientMetricsTest(testtools.TestCase):
+
+    def setUp(self):
+        super(ClientMetricsTest, self).setUp()
+        self.requests = self.useFixture(mock_fixture.Fixture())
+        self.metrics = metrics.RequestMetrics()
+        self.records = []
+        self.metrics.callbacks.append(self.records.append)
+        self.client = client.Client(token='token', endpoint_url=ENDPOINT_URL,
+                                    retries=1, metrics=self.metrics)
+        patcher = mock.patch('time.sleep')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_records(self):
+        network_id = uuidutils.generate_uuid()
+        url = '%s/v2.0/networks/%s' % (ENDPOINT_URL, network_id)
+        self.requests.put(url, [
+            {'status_code': 503},
+            {'json': {'network': {'id': network_id}},
+             'headers': {'x-openstack-request-id': 'req-2'}}])
+        self.client.update_network(network_id, {'network': {'name': 'n'}})
+        self.assertEqual([('PUT', '/networks/%s', 503, 0, None),
+                          ('PUT', '/networks/%s', 200, 1, 'req-2')],
+                         [(r.method, r.path, r.status, r.attempt,
+                           r.request_id) for r in self.records])
+        self.assertEqual(len(self.requests.last_request.body),
+                         self.records[1].request_bytes)
+        self.assertGreater(self.records[1].response_bytes, 0)
+
+    def test_connection_failure(self):
+        self.requests.post(ENDPOINT_URL + '/v2.0/networks',
+                           exc=exceptions.ConnectionFailed)
+        self.assertRaises(exceptions.ConnectionFailed,
+                          self.client.create_network, {'network': {}})
+        self.assertEqual(1, len(self.records))
+        self.assertIsNone(self.records[0].status)
@@ -225,3 +225,146 @@ class CLITestNameorID(testtools.TestCase):
 
     def test_get_resourceid_by_id(self):
         self._test_get_resource_by_id(id_only=True)
+
+
+class CLITestNameorIDCache(testtools.TestCase):
+
+    def setUp(self):
+        super(CLITestNameorIDCache, self).setUp()
+        self.mox = mox.Mox()
+        self.client = client.Client(token=test_cli20.TOKEN,
+                                    endpoint_url=test_cli20.ENDURL,
+                                    resolution_cache_size=10)
+        self.addCleanup(self.mox.VerifyAll)
+        self.addCleanup(self.mox.UnsetStubs)
+        self.mox.StubOutWithMock(self.client.httpclient, "request")
+
+    def _expect_lookup(self, _id):
+        path = getattr(self.client, "networks_path")
+        resstr = self.client.serialize({'networks': [{'id': _id}]})
+        self.client.httpclient.request(
+            test_cli20.MyUrlComparator(
+                test_cli20.end_url(path, "fields=id&id=" + _id),
+                self.client),
+            'GET',
+            body=None,
+            headers=mox.ContainsKeyValue('X-Auth-Token', test_cli20.TOKEN)
+        ).AndReturn((test_cli20.MyResp(200), resstr))
+
+    def test_cached_lookup(self):
+        _id = uuidutils.generate_uuid()
+        self._expect_lookup(_id)
+        self.mox.ReplayAll()
+        for i in range(2):
+            returned_id = neutronV20.find_resourceid_by_name_or_id(
+                self.client, 'network', _id)
+            self.assertEqual(_id, returned_id)
+        self.assertEqual(1, self.client.resolution_cache.hits)
+        self.assertEqual(1, self.client.resolution_cache.misses)
+
+    def test_cache_invalidated_by_mutation(self):
+        _id = uuidutils.generate_uuid()
+        self._expect_lookup(_id)
+        self.client.httpclient.request(
+            test_cli20.MyUrlComparator(
+                test_cli20.end_url(self.client.network_path % _id),
+                self.client),
+            'DELETE',
+            body=None,
+            headers=mox.ContainsKeyValue('X-Auth-Token', test_cli20.TOKEN)
+        ).AndReturn((test_cli20.MyResp(204), None))
+        self._expect_lookup(_id)
+        self.mox.ReplayAll()
+        neutronV20.find_resourceid_by_name_or_id(self.client, 'network', _id)
+        self.client.delete_network(_id)
+        neutronV20.find_resourceid_by_name_or_id(self.client, 'network', _id)
+        self.assertEqual(0, self.client.resolution_cache.hits)
+
+
+    def test_lookup_during_mutation_forgotten(self):
+        _id = uuidutils.generate_uuid()
+        self.client.httpclient.request(
+            test_cli20.MyUrlComparator(
+                test_cli20.end_url(self.client.network_path % _id),
+                self.client),
+            'DELETE',
+            body=None,
+            headers=mox.ContainsKeyValue('X-Auth-Token', test_cli20.TOKEN)
+        ).WithSideEffects(
+            # Looked up while the network is being deleted.
+            lambda *args, **kwargs: neutronV20.find_resourceid_by_name_or_id(
+                self.client, 'network', _id)
+        ).AndReturn((test_cli20.MyResp(204), None))
+        self._expect_lookup(_id)
+        self.mox.ReplayAll()
+        self.client.delete_network(_id)
+        self.assertEqual(0, len(self.client.resolution_cache))
+
+class CLITestFindResources(testtools.TestCase):
+
+    def setUp(self):
+        super(CLITestFindResources, self).setUp()
+        self.mox = mox.Mox()
+        self.client = client.Client(token=test_cli20.TOKEN,
+                                    endpoint_url=test_cli20.ENDURL)
+        self.addCleanup(self.mox.VerifyAll)
+        self.addCleanup(self.mox.UnsetStubs)
+        self.mox.StubOutWithMock(self.client.httpclient, "request")
+
+    def _expect_list(self, query, networks):
+        path = getattr(self.client, "networks_path")
+        resstr = self.client.serialize({'networks': networks})
+        self.client.httpclient.request(
+            test_cli20.MyUrlComparator(test_cli20.end_url(path, query),
+                                       self.client),
+            'GET',
+            body=None,
+            headers=mox.ContainsKeyValue('X-Auth-Token', test_cli20.TOKEN)
+        ).AndReturn((test_cli20.MyResp(200), resstr))
+
+    def test_find_resources(self):
+        id1 = uuidutils.generate_uuid()
+        id2 = uuidutils.generate_uuid()
+        id3 = uuidutils.generate_uuid()
+        self._expect_list("fields=id&fields=name&id=%s&id=%s" % (id1, id2),
+                          [{'id': id1, 'name': 'net1'}])
+        self._expect_list("fields=id&fields=name&name=%s&name=net2&"
+                          "name=dup&name=missing" % id2,
+                          [{'id': id3, 'name': 'net2'},
+                           {'id': id2, 'name': 'dup'},
+                           {'id': id1, 'name': 'dup'}])
+        self.mox.ReplayAll()
+        found = self.client.find_resources(
+            'network', [id1, id2, 'net2', 'dup', 'missing', id1],
+            fields='id')
+        self.assertEqual([id1, 'net2'], list(found))
+        self.assertEqual(id3, found['net2']['id'])
+        self.assertEqual([id2, 'missing'], found.missing)
+        self.assertEqual(['dup'], found.ambiguous)
+        exc = self.assertRaises(exceptions.NotFound, found.ids)
+        self.assertIn(id2, str(exc))
+
+    def test_find_resources_ids(self):
+        id1 = uuidutils.generate_uuid()
+        self._expect_list("id=%s" % id1, [{'id': id1, 'name': 'net1'}])
+        self._expect_list("name=net2", [{'id': 'id2', 'name': 'net2'}])
+        self.mox.ReplayAll()
+        found = self.client.find_resources('network', ['net2', id1, 'net2'])
+        self.assertEqual(['id2', id1, 'id2'], found.ids())
+
+    def test_find_resources_ambiguous(self):
+        self._expect_list("name=dup", [{'id': 'id1', 'name': 'dup'},
+                                       {'id': 'id2', 'name': 'dup'}])
+        self.mox.ReplayAll()
+        found = self.client.find_resources('network', ['dup'])
+        self.assertRaises(exceptions.NeutronClientNoUniqueMatch, found.ids)
+
+    def test_find_resources_split_by_uri_length(self):
+        names = ['n%04d' % i for i in range(1000)]
+        chunks = list(self.client._chunk_filter_values('name', names))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(names, sum(chunks, []))
+        for chunk in chunks:
+            query = '&'.join('name=%s' % n for n in chunk)
+            self.assertLessEqual(
+                len(query), 8192 - client.FILTER_URI_RESERVED)
@@ -16,11 +16,18 @@
 
 import sys
 
+import mock
 from mox3 import mox
+from requests_mock.contrib import fixture as mock_fixture
+import testtools
 
 from neutronclient.common import exceptions
 from neutronclient.neutron.v2_0 import quota as test_quota
 from neutronclient.tests.unit import test_cli20
+from neutronclient.v2_0 import client
+
+
+ENDPOINT_URL = 'http://neutron.test:9696'
 
 
 class CLITestV20Quota(test_cli20.CLITestV20Base):
@@ -100,3 +107,95 @@ class CLITestV20Quota(test_cli20.CLITestV20Base):
         self.assertRaises(exceptions.CommandError, self._test_update_resource,
                           resource, cmd, self.test_id, args=args,
                           extrafields=None)
+
+    def test_quota_usage_report(self):
+        cmd = test_quota.QuotaUsageReport(test_cli20.MyApp(sys.stdout), None)
+        report = [
+            {'tenant_id': 'a', 'resource': 'network', 'used': 1,
+             'limit': 10, 'utilization': 0.1},
+            {'tenant_id': 'a', 'resource': 'port', 'used': 3,
+             'limit': -1, 'utilization': None},
+            {'tenant_id': 'b', 'resource': 'network', 'used': 9,
+             'limit': 10, 'utilization': 0.9}]
+        with mock.patch.object(cmd, 'get_client', return_value=self.client), \
+                mock.patch.object(self.client, 'quota_usage_report',
+                                  return_value=report) as report_mock:
+            parsed_args = cmd.get_parser('quota-usage-report').parse_args(
+                ['--resource', 'network', '--resource', 'port'])
+            columns, data = cmd.take_action(parsed_args)
+            rows = list(data)
+        report_mock.assert_called_once_with(resources=['network', 'port'])
+        self.assertEqual(
+            ('tenant_id', 'resource', 'used', 'limit', 'utilization'),
+            columns)
+        self.assertEqual([('b', 'network', 9, 10, 90.0),
+                          ('a', 'network', 1, 10, 10.0),
+                          ('a', 'port', 3, -1, '')], rows)
+
+
+class QuotaUsageReportTest(testtools.TestCase):
+
+    def setUp(self):
+        super(QuotaUsageReportTest, self).setUp()
+        self.requests = self.useFixture(mock_fixture.Fixture())
+        self.client = client.Client(token='token', endpoint_url=ENDPOINT_URL)
+        self.requests.get(
+            ENDPOINT_URL + '/v2.0/quotas',
+            json={'quotas': [{'tenant_id': 'a', 'network': 2, 'port': -1}]})
+        self.defaults = self.requests.get(
+            ENDPOINT_URL + '/v2.0/quotas/b/default',
+            json={'quota': {'network': 10, 'port': 50}})
+
+    def _list(self, collection, pages):
+        responses = []
+        for i, tenant_ids in enumerate(pages):
+            body = {collection: [{'tenant_id': tenant_id}
+                                 for tenant_id in tenant_ids]}
+            if i + 1 < len(pages):
+                body[collection + '_links'] = [{
+                    'rel': 'next',
+                    'href': '%s/v2.0/%s?marker=%d' % (ENDPOINT_URL,
+                                                      collection, i)}]
+            responses.append({'json': body})
+        return self.requests.get(ENDPOINT_URL + '/v2.0/' + collection,
+                                 responses)
+
+    def test_report(self):
+        networks = self._list('networks', [['a', 'b'], ['a']])
+        ports = self._list('ports', [['b'] * 5])
+        report = self.client.quota_usage_report(
+            resources=['network', 'port'])
+        self.assertEqual([
+            {'tenant_id': 'a', 'resource': 'network', 'used': 2,
+             'limit': 2, 'utilization': 1.0},
+            {'tenant_id': 'a', 'resource': 'port', 'used': 0,
+             'limit': -1, 'utilization': None},
+            {'tenant_id': 'b', 'resource': 'network', 'used': 1,
+             'limit': 10, 'utilization': 0.1},
+            {'tenant_id': 'b', 'resource': 'port', 'used': 5,
+             'limit': 50, 'utilization': 0.1}], report)
+        # A single listing of the tenant IDs per resource, page by page.
+        self.assertEqual(2, networks.call_count)
+        self.assertEqual(1, ports.call_count)
+        self.assertEqual(['tenant_id'], ports.last_request.qs['fields'])
+        self.assertEqual(1, self.defaults.call_count)
+
+    def test_report_serial(self):
+        self._list('networks', [['a']])
+        report = self.client.quota_usage_report(resources=['network'],
+                                                concurrency=1)
+        self.assertEqual([{'tenant_id': 'a', 'resource': 'network',
+                           'used': 1, 'limit': 2, 'utilization': 0.5}],
+                         report)
+        self.assertEqual(0, self.defaults.call_count)
+
+    def test_report_ownerless_resources(self):
+        self._list('ports', [['a', '', None]])
+        report = self.client.quota_usage_report(resources=['port'])
+        self.assertEqual([{'tenant_id': 'a', 'resource': 'port', 'used': 1,
+                           'limit': -1, 'utilization': None}], report)
+        self.assertEqual(0, self.defaults.call_count)
+
+    def test_report_unknown_resource(self):
+        self.assertRaises(ValueError, self.client.quota_usage_report,
+                          resources=['unknown'])
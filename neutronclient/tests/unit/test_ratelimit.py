@@ -0,0 +1,139 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+import time
+
+from requests_mock.contrib import fixture as mock_fixture
+import testtools
+
+from neutronclient.common import ratelimit
+from neutronclient.v2_0 import client
+
+
+class TokenBucketTest(testtools.TestCase):
+
+    def test_consume(self):
+        now = [0]
+        bucket = ratelimit.TokenBucket(2, 3, timer=lambda: now[0])
+        self.assertTrue(bucket.consume(3))
+        self.assertFalse(bucket.consume())
+        now[0] = 0.5
+        self.assertTrue(bucket.consume())
+        self.assertFalse(bucket.consume())
+        now[0] = 10
+        self.assertTrue(bucket.consume(3))
+        self.assertFalse(bucket.consume())
+
+    def test_wait_time(self):
+        now = [0]
+        bucket = ratelimit.TokenBucket(4, 1, timer=lambda: now[0])
+        self.assertEqual(0, bucket.wait_time())
+        bucket.consume()
+        self.assertEqual(0.25, bucket.wait_time())
+
+
+class HistogramTest(testtools.TestCase):
+
+    def test_snapshot(self):
+        histogram = ratelimit.Histogram(buckets=(1, 5))
+        for value in (0.5, 1, 3, 7):
+            histogram.observe(value)
+        self.assertEqual({'buckets': [(1, 2), (5, 3), (float('inf'), 4)],
+                          'count': 4, 'sum': 11.5},
+                         histogram.snapshot())
+
+
+class LimiterTest(testtools.TestCase):
+
+    def _wait_queued(self, limiter, queued):
+        for _i in range(1000):
+            if limiter.stats()['queued'] == queued:
+                return
+            time.sleep(0.001)
+        self.fail('%d requests not queued' % queued)
+
+    def test_concurrency_fifo(self):
+        limiter = ratelimit.Limiter(concurrency=1)
+        limiter.acquire()
+        order = []
+
+        def request(i):
+            limiter.acquire()
+            order.append(i)
+            limiter.release()
+
+        threads = []
+        for i in range(5):
+            thread = threading.Thread(target=request, args=(i,))
+            thread.start()
+            threads.append(thread)
+            self._wait_queued(limiter, i + 1)
+        self.assertEqual([], order)
+        limiter.release()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(list(range(5)), order)
+        stats = limiter.stats()
+        self.assertEqual(0, stats['in_flight'])
+        self.assertEqual(6, stats['wait']['count'])
+
+    def test_rate(self):
+        limiter = ratelimit.Limiter(rate=50, burst=1)
+        start = time.time()
+        for _i in range(3):
+            limiter.acquire()
+            limiter.release()
+        self.assertGreaterEqual(time.time() - start, 0.035)
+        self.assertGreater(limiter.stats()['wait']['sum'], 0.035)
+
+
+class GovernorTest(testtools.TestCase):
+
+    def test_matching_limits(self):
+        governor = ratelimit.Governor(
+            concurrency=10, limits={'PUT': {'concurrency': 2},
+                                    '/ports': {'rate': 100}})
+        with governor.request('PUT', '/ports/p1'):
+            stats = governor.stats()
+            self.assertEqual(1, stats['all']['in_flight'])
+            self.assertEqual(1, stats['PUT']['in_flight'])
+            self.assertEqual(1, stats['/ports']['in_flight'])
+        with governor.request('GET', '/networks'):
+            stats = governor.stats()
+            self.assertEqual(1, stats['all']['in_flight'])
+            self.assertEqual(0, stats['PUT']['in_flight'])
+            self.assertEqual(0, stats['/ports']['in_flight'])
+        self.assertEqual(0, governor.stats()['all']['in_flight'])
+        self.assertEqual(2, governor.stats()['all']['wait']['count'])
+
+    def test_released_on_error(self):
+        governor = ratelimit.Governor(concurrency=1)
+
+        def fail():
+            with governor.request('GET', '/networks'):
+                raise ValueError()
+
+        self.assertRaises(ValueError, fail)
+        self.assertEqual(0, governor.stats()['all']['in_flight'])
+
+    def test_client(self):
+        requests = self.useFixture(mock_fixture.Fixture())
+        requests.get('http://neutron.test:9696/v2.0/ports', json={
+            'ports': []})
+        governor = ratelimit.Governor(limits={'/ports': {'concurrency': 1}})
+        neutron = client.Client(token='token',
+                                endpoint_url='http://neutron.test:9696',
+                                governor=governor)
+        neutron.list_ports(device_owner='network:dhcp')
+        neutron.list_ports()
+        self.assertEqual(2, governor.stats()['/ports']['wait']['count'])
@@ -0,0 +1,109 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from requests_mock.contrib import fixture as mock_fixture
+import testtools
+
+from neutronclient.common import exceptions
+from neutronclient.v2_0 import client
+
+
+ENDPOINT_URL = 'http://neutron.test:9696'
+NETWORK_URL = ENDPOINT_URL + '/v2.0/networks/net1'
+
+
+def _network(revision_number=1, **attrs):
+    network = {'id': 'net1', 'name': 'net', 'revision_number': revision_number}
+    network.update(attrs)
+    return {'network': network}
+
+
+class ResponseCacheTest(testtools.TestCase):
+
+    def setUp(self):
+        super(ResponseCacheTest, self).setUp()
+        self.requests = self.useFixture(mock_fixture.Fixture())
+        self.client = client.Client(token='token', endpoint_url=ENDPOINT_URL,
+                                    response_cache_size=1024)
+
+    def _revision_probe(self, revision_number):
+        return {'json': {'network': {'revision_number': revision_number}}}
+
+    def test_disabled_by_default(self):
+        self.requests.get(NETWORK_URL, json=_network())
+        neutron = client.Client(token='token', endpoint_url=ENDPOINT_URL)
+        neutron.show_network('net1')
+        neutron.show_network('net1')
+        self.assertIsNone(neutron.response_cache)
+        self.assertEqual(2, self.requests.call_count)
+
+    def test_revision_probe(self):
+        self.requests.get(NETWORK_URL, [
+            {'json': _network(1)},
+            self._revision_probe(1),
+            self._revision_probe(2),
+            {'json': _network(2, name='renamed')}])
+        self.assertEqual(_network(1), self.client.show_network('net1'))
+        cached = self.client.show_network('net1')
+        self.assertEqual(_network(1), cached)
+        self.assertEqual(['revision_number'],
+                         self.requests.request_history[1].qs['fields'])
+        # Changing the returned body does not alter the cached one.
+        cached['network']['name'] = 'changed'
+        self.assertEqual(_network(2, name='renamed'),
+                         self.client.show_network('net1'))
+        self.assertNotIn('fields', self.requests.request_history[3].qs)
+        self.assertEqual(4, self.requests.call_count)
+
+    def test_etag(self):
+        self.requests.get(NETWORK_URL, [
+            {'json': _network(1), 'headers': {'ETag': '"1"'}},
+            {'status_code': 304, 'headers': {'ETag': '"1"'}},
+            {'json': _network(2), 'headers': {'ETag': '"2"'}}])
+        self.client.show_network('net1')
+        self.assertEqual(_network(1), self.client.show_network('net1'))
+        self.assertEqual('"1"',
+                         self.requests.last_request.headers['If-None-Match'])
+        self.assertEqual(_network(2), self.client.show_network('net1'))
+        self.assertEqual(3, self.requests.call_count)
+
+    def test_params_cached_separately(self):
+        self.requests.get(NETWORK_URL, json=_network())
+        self.client.show_network('net1')
+        self.client.show_network('net1', fields=['id', 'revision_number'])
+        self.assertEqual(2, len(self.client.response_cache))
+
+    def test_listings_not_cached(self):
+        self.requests.get(ENDPOINT_URL + '/v2.0/networks',
+                          json={'networks': [_network()['network']]})
+        self.client.list_networks()
+        self.client.list_networks()
+        self.assertEqual(2, self.requests.call_count)
+        self.assertEqual(0, len(self.client.response_cache))
+
+    def test_deleted_resource_forgotten(self):
+        self.requests.get(NETWORK_URL, [
+            {'json': _network()},
+            {'status_code': 404, 'json': {'NeutronError': {
+                'type': 'NetworkNotFound', 'message': 'not found',
+                'detail': ''}}}])
+        self.client.show_network('net1')
+        self.assertRaises(exceptions.NetworkNotFoundClient,
+                          self.client.show_network, 'net1')
+        self.assertEqual(0, len(self.client.response_cache))
+
+    def test_bounded_by_size(self):
+        neutron = client.Client(token='token', endpoint_url=ENDPOINT_URL,
+                                response_cache_size=100)
+        self.requests.get(NETWORK_URL, json=_network(description='x' * 100))
+        neutron.show_network('net1')
+        self.assertEqual(0, len(neutron.response_cache))
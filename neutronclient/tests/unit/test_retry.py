@@ -0,0 +1,140 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+from requests_mock.contrib import fixture as mock_fixture
+import testtools
+
+from neutronclient.common import exceptions
+from neutronclient.common import retry
+from neutronclient.v2_0 import client
+
+
+ENDPOINT_URL = 'http://neutron.test:9696'
+NETWORK_URL = ENDPOINT_URL + '/v2.0/networks/net1'
+
+
+class ParseRetryAfterTest(testtools.TestCase):
+
+    def test_seconds(self):
+        self.assertEqual(120, retry.parse_retry_after('120'))
+
+    def test_date(self):
+        self.assertEqual(30, retry.parse_retry_after(
+            'Thu, 01 Jan 1970 00:01:00 GMT', timer=lambda: 30))
+        self.assertEqual(0, retry.parse_retry_after(
+            'Thu, 01 Jan 1970 00:01:00 GMT', timer=lambda: 90))
+
+    def test_invalid(self):
+        self.assertIsNone(retry.parse_retry_after(None))
+        self.assertIsNone(retry.parse_retry_after('soon'))
+
+
+class RetryPolicyTest(testtools.TestCase):
+
+    def setUp(self):
+        super(RetryPolicyTest, self).setUp()
+        self.policy = retry.RetryPolicy(base_delay=1, max_delay=10)
+
+    def _error(self, status_code, retry_after=None):
+        error = exceptions.NeutronClientException(status_code=status_code)
+        error.retry_after = retry_after
+        return error
+
+    @mock.patch('random.uniform', side_effect=lambda low, high: high)
+    def test_backoff(self, uniform):
+        error = exceptions.ConnectionFailed()
+        self.assertEqual([1, 2, 4, 8, 10, 10], [
+            self.policy.get_delay('GET', error, attempt, 10)
+            for attempt in range(6)])
+        uniform.assert_called_with(0, 10)
+
+    def test_status_matrix(self):
+        self.assertIsNotNone(self.policy.get_delay('PUT', self._error(503),
+                                                   0, 1))
+        self.assertIsNone(self.policy.get_delay('POST', self._error(503),
+                                                0, 1))
+        self.assertIsNone(self.policy.get_delay('GET', self._error(404),
+                                                0, 1))
+        self.assertIsNone(self.policy.get_delay(
+            'POST', exceptions.ConnectionFailed(), 0, 1))
+
+    def test_retry_after(self):
+        self.assertEqual(5, self.policy.get_delay(
+            'GET', self._error(429, retry_after=5), 0, 1))
+        self.assertIsNone(self.policy.get_delay(
+            'GET', self._error(429, retry_after=60), 0, 1))
+
+    def test_budget(self):
+        policy = retry.RetryPolicy(budget_rate=0.001, budget_burst=2)
+        delays = [policy.get_delay('GET', self._error(503), 0, 1)
+                  for _i in range(3)]
+        self.assertIsNone(delays[2])
+        self.assertEqual({'retried': 2, 'retried_by_cause': {503: 2},
+                          'gave_up': 0, 'budget_exhausted': 1},
+                         policy.stats())
+
+    def test_no_budget(self):
+        policy = retry.RetryPolicy(budget_rate=None)
+        for _i in range(100):
+            self.assertIsNotNone(policy.get_delay('GET', self._error(503),
+                                                  0, 1))
+
+    def test_gave_up(self):
+        self.assertIsNone(self.policy.get_delay('GET', self._error(503),
+                                                1, 1))
+        self.assertEqual(1, self.policy.stats()['gave_up'])
+
+
+class ClientRetryTest(testtools.TestCase):
+
+    def setUp(self):
+        super(ClientRetryTest, self).setUp()
+        self.requests = self.useFixture(mock_fixture.Fixture())
+        self.client = client.Client(token='token', endpoint_url=ENDPOINT_URL,
+                                    retries=2)
+        patcher = mock.patch('time.sleep')
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_retry_status(self):
+        self.requests.get(NETWORK_URL, [
+            {'status_code': 503},
+            {'status_code': 429, 'headers': {'Retry-After': '3'}},
+            {'json': {'network': {'id': 'net1'}}}])
+        self.assertEqual({'network': {'id': 'net1'}},
+                         self.client.show_network('net1'))
+        self.assertEqual(3, self.requests.call_count)
+        self.assertEqual(mock.call(3), self.sleep.call_args)
+        self.assertEqual({503: 1, 429: 1},
+                         self.client.retry_policy.stats()['retried_by_cause'])
+
+    def test_retries_exhausted(self):
+        self.requests.delete(NETWORK_URL, status_code=409)
+        self.assertRaises(exceptions.Conflict,
+                          self.client.delete_network, 'net1')
+        self.assertEqual(3, self.requests.call_count)
+        self.assertEqual(1, self.client.retry_policy.stats()['gave_up'])
+
+    def test_post_not_retried(self):
+        self.requests.post(ENDPOINT_URL + '/v2.0/networks', status_code=503)
+        self.assertRaises(exceptions.ServiceUnavailable,
+                          self.client.create_network, {'network': {}})
+        self.assertEqual(1, self.requests.call_count)
+
+    def test_not_retried_by_default(self):
+        neutron = client.Client(token='token', endpoint_url=ENDPOINT_URL)
+        self.requests.get(NETWORK_URL, status_code=503)
+        self.assertRaises(exceptions.ServiceUnavailable,
+                          neutron.show_network, 'net1')
+        self.assertEqual(1, self.requests.call_count)
+        self.assertFalse(self.sleep.called)
@@ -0,0 +1,71 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+
+import testtools
+
+from neutronclient.common import exceptions
+from neutronclient.common import serializer
+
+
+def _chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class JSONCollectionStreamDeserializerTest(testtools.TestCase):
+
+    doc = {'ports_links': [{'rel': 'next', 'href': 'http://x/ports?marker=b'}],
+           'ports': [{'id': 'a', 'fixed_ips': [{'ip_address': '10.0.0.1'}]},
+                     {'id': 'b', 'name': u'网络', 'mtu': 1450}],
+           'count': 12345}
+
+    def _decode(self, chunks):
+        deserializer = serializer.JSONCollectionStreamDeserializer('ports')
+        items = list(deserializer.iter_items(chunks))
+        return items, deserializer.extra
+
+    def test_items_and_extra(self):
+        data = json.dumps(self.doc, indent=2).encode('utf-8')
+        for size in (1, 3, 7, len(data)):
+            items, extra = self._decode(_chunked(data, size))
+            self.assertEqual(self.doc['ports'], items)
+            self.assertEqual(self.doc['ports_links'], extra['ports_links'])
+            self.assertEqual(12345, extra['count'])
+
+    def test_text_chunks(self):
+        data = json.dumps(self.doc)
+        items, _extra = self._decode(_chunked(data, 5))
+        self.assertEqual(self.doc['ports'], items)
+
+    def test_items_are_lazy(self):
+        data = json.dumps(self.doc).encode('utf-8')
+        chunks = iter(_chunked(data, 4))
+        deserializer = serializer.JSONCollectionStreamDeserializer('ports')
+        self.assertEqual('a', next(deserializer.iter_items(chunks))['id'])
+        self.assertNotEqual([], list(chunks))
+
+    def test_empty_collection(self):
+        items, extra = self._decode([b'{"ports": [ ]}'])
+        self.assertEqual([], items)
+        self.assertEqual({}, extra)
+
+    def test_empty_object(self):
+        self.assertEqual(([], {}), self._decode([b'{}']))
+
+    def test_truncated_body(self):
+        self.assertRaises(exceptions.MalformedResponseBody,
+                          self._decode, [b'{"ports": [{"id": "a"}, {"id'])
+
+    def test_not_an_object(self):
+        self.assertRaises(exceptions.MalformedResponseBody,
+                          self._decode, [b'[{"id": "a"}]'])
@@ -19,16 +19,20 @@ import os
 import re
 import sys
 
+from cliff import command
 import fixtures
 from keystoneauth1 import session
 import mock
+from oslo_serialization import jsonutils
 import six
 import testtools
 from testtools import matchers
 
 from neutronclient.common import clientmanager
+from neutronclient.common import metrics
 from neutronclient.neutron.v2_0 import network
 from neutronclient import shell as openstack_shell
+from neutronclient.tests.unit import fakes
 
 
 DEFAULT_USERNAME = 'username'
@@ -47,6 +51,21 @@ DEFAULT_RETRIES = 3
 DEFAULT_TIMEOUT = 3.0
 
 
+class FakeEchoCommand(command.Command):
+    """Print its argument."""
+
+    def get_parser(self, prog_name):
+        parser = super(FakeEchoCommand, self).get_parser(prog_name)
+        parser.add_argument('word')
+        parser.add_argument('--fail', action='store_true')
+        return parser
+
+    def take_action(self, parsed_args):
+        if parsed_args.fail:
+            raise Exception('failed %s' % parsed_args.word)
+        self.app.stdout.write(parsed_args.word)
+
+
 class ShellTest(testtools.TestCase):
 
     FAKE_ENV = {
@@ -63,6 +82,9 @@ class ShellTest(testtools.TestCase):
     # Patch os.environ to avoid required auth info.
     def setUp(self):
         super(ShellTest, self).setUp()
+        self.cache_dir = self.useFixture(fixtures.TempDir()).path
+        self.useFixture(fixtures.MockPatch(
+            'neutronclient.common.completion.CACHE_DIR', self.cache_dir))
         for var in self.FAKE_ENV:
             self.useFixture(
                 fixtures.EnvironmentVariable(
@@ -111,6 +133,23 @@ class ShellTest(testtools.TestCase):
             bash_completion,
             matchers.MatchesRegex(required))
 
+    def test_bash_completion_uses_index(self):
+        index = {'options': ['--os-cloud'],
+                 'commands': {'net-list': ['--tenant-id', '-h'],
+                              'net-show': ['-F']}}
+        build = self.useFixture(fixtures.MockPatchObject(
+            openstack_shell.NeutronShell, '_build_completion_index',
+            return_value=index)).mock
+        stdout, stderr = self.shell('bash-completion')
+        self.assertEqual(
+            set(['--os-cloud', 'net-list', 'net-show', '--tenant-id', '-h',
+                 '-F']),
+            set(stdout.split()))
+        stdout, stderr = self.shell('bash-completion net-list')
+        self.assertEqual(['--tenant-id', '-h'], stdout.split())
+        # The index is only built once, then read from the cache.
+        self.assertEqual(1, build.call_count)
+
     def test_help_on_subcommand(self):
         required = [
             '.*?^usage: .* quota-list']
@@ -230,7 +269,9 @@ class ShellTest(testtools.TestCase):
                         'http_timeout': DEFAULT_TIMEOUT,
                         'region_name': DEFAULT_REGION,
                         'network_service_name': DEFAULT_SERVICE_NAME,
-                        'neutron_service_type': DEFAULT_SERVICE_TYPE}
+                        'neutron_service_type': DEFAULT_SERVICE_TYPE,
+                        'token_cache': False,
+                        'timing': False}
 
         options.update(base_options)
         if options.get('os_token'):
@@ -282,7 +323,8 @@ class ShellTest(testtools.TestCase):
             endpoint_type=DEFAULT_ENDPOINT_TYPE,
             auth=auth,
             insecure=expect_insecure,
-            log_credentials=True)
+            log_credentials=True,
+            metrics=None)
 
     def test_authenticate_secure_with_cacert_with_cert(self):
         self._test_authenticate_user(
@@ -364,3 +406,135 @@ class ShellTest(testtools.TestCase):
              'net-show': network.ShowNetwork,
              'net-update': network.UpdateNetwork},
             openstack_shell.COMMANDS['2.0'])
+
+    def test_commands_loaded_on_demand(self):
+        discover = self.useFixture(fixtures.MockPatch(
+            'neutronclient.common.extension._discover_via_entry_points',
+            return_value=[])).mock
+        find_command = self.useFixture(fixtures.MockPatchObject(
+            openstack_shell.commandmanager.CommandManager, 'find_command',
+            side_effect=lambda argv: (None, argv[0], argv[1:]))).mock
+        neutron_shell = openstack_shell.NeutronShell('2.0')
+        self.assertFalse(discover.called)
+        self.assertFalse(find_command.called)
+
+        self.assertTrue(neutron_shell.command_manager.has_command('net-list'))
+        self.assertFalse(discover.called)
+        self.assertFalse(
+            neutron_shell.command_manager.has_command('no-such-command'))
+        discover.assert_called_once_with()
+
+    def test_run_skips_global_option_values(self):
+        discover = self.useFixture(fixtures.MockPatch(
+            'neutronclient.common.extension._discover_via_entry_points',
+            return_value=[])).mock
+        neutron_shell = openstack_shell.NeutronShell('2.0')
+        self.useFixture(fixtures.MockPatchObject(
+            neutron_shell, 'initialize_app'))
+        run_subcommand = self.useFixture(fixtures.MockPatchObject(
+            neutron_shell, 'run_subcommand', return_value=0)).mock
+        neutron_shell.run(['--os-cloud', 'mycloud', '--os-region-name=r1',
+                           'net-list'])
+        run_subcommand.assert_called_once_with(['net-list'])
+        self.assertFalse(discover.called)
+
+    def test_extensions_loaded_for_unknown_command(self):
+        discover = self.useFixture(fixtures.MockPatch(
+            'neutronclient.common.extension._discover_via_entry_points',
+            return_value=[])).mock
+        neutron_shell = openstack_shell.NeutronShell('2.0')
+        self.assertRaises(ValueError,
+                          neutron_shell.command_manager.find_command,
+                          ['no-such-command'])
+        self.assertRaises(ValueError,
+                          neutron_shell.command_manager.find_command,
+                          ['no-such-command'])
+        discover.assert_called_once_with()
+
+    def _run_batch(self, lines, parallel=1):
+        neutron_shell = openstack_shell.NeutronShell('2.0')
+        neutron_shell.options, remainder = (
+            neutron_shell.parser.parse_known_args([]))
+        neutron_shell.command_manager.add_command('echo', FakeEchoCommand)
+        neutron_shell.client_manager = mock.Mock()
+        neutron_shell.stdin = six.StringIO(lines)
+        neutron_shell.stdout = six.StringIO()
+        ret = neutron_shell.run_batch('-', parallel=parallel)
+        return ret, [jsonutils.loads(line) for line in
+                     neutron_shell.stdout.getvalue().splitlines()]
+
+    def test_run_batch(self):
+        ret, results = self._run_batch(
+            "echo first\n\n# a comment\necho 'second word' --fail\n"
+            "echo\nunknown-command\n")
+        self.assertEqual(1, ret)
+        self.assertEqual(
+            [{'line': 1, 'command': 'echo first', 'status': 0,
+              'output': 'first', 'error': None},
+             {'line': 4, 'command': "echo 'second word' --fail", 'status': 1,
+              'output': '', 'error': 'failed second word'},
+             {'line': 5, 'command': 'echo', 'status': 2, 'output': '',
+              'error': 'Invalid arguments'}],
+            results[:3])
+        self.assertEqual(6, results[3]['line'])
+        self.assertEqual(1, results[3]['status'])
+
+    def test_run_batch_parallel(self):
+        lines = ''.join('echo %d\n' % i for i in range(20))
+        ret, results = self._run_batch(lines, parallel=4)
+        self.assertEqual(0, ret)
+        self.assertEqual([str(i) for i in range(20)],
+                         [result['output'] for result in results])
+
+    def test_batch_with_command(self):
+        self.useFixture(fixtures.FakeLogger(level=logging.DEBUG))
+        stdout, stderr = self.shell('--batch - net-list')
+        self.assertIn('No command can be given with --batch', stderr)
+
+    def test_print_timing(self):
+        neutron_shell = openstack_shell.NeutronShell(DEFAULT_API_VERSION)
+        neutron_shell.stderr = six.StringIO()
+        neutron_shell._print_timing()
+        self.assertEqual('', neutron_shell.stderr.getvalue())
+        neutron_shell._metrics = metrics.RequestMetrics()
+        neutron_shell._metrics.record(metrics.RequestRecord(
+            method='GET', path='/networks', status=200, latency=0.25,
+            request_bytes=0, response_bytes=10, attempt=0,
+            request_id=None))
+        neutron_shell._print_timing()
+        output = neutron_shell.stderr.getvalue()
+        self.assertIn('/networks', output)
+        self.assertIn('Total: 1 requests in 0.250 seconds', output)
+
+    def test_token_cache(self):
+        self.useFixture(fixtures.MockPatch(
+            'neutronclient.common.token_cache.CACHE_DIR', self.cache_dir))
+        auth_state = fakes.auth_state('token1')
+        cloud_config = mock.Mock(config={
+            'auth_type': 'password',
+            'auth': {'auth_url': DEFAULT_AUTH_URL,
+                     'username': DEFAULT_USERNAME,
+                     'password': DEFAULT_PASSWORD}})
+        cloud_config.get_region_name.return_value = DEFAULT_REGION
+
+        auth = mock.Mock()
+        auth.get_auth_state.return_value = auth_state
+        openstack_shell.NeutronShell('2.0')._load_cached_token(
+            auth, 'session', cloud_config)
+        auth.get_access.assert_called_once_with('session')
+
+        # The next invocation reuses the token.
+        auth = mock.Mock()
+        neutron_shell = openstack_shell.NeutronShell('2.0')
+        neutron_shell._load_cached_token(auth, 'session', cloud_config)
+        auth.set_auth_state.assert_called_once_with(auth_state)
+        self.assertFalse(auth.get_access.called)
+
+        # A token renewed during the command replaces the cached one.
+        new_auth_state = fakes.auth_state('token2')
+        auth.get_auth_state.return_value = new_auth_state
+        neutron_shell._save_cached_token()
+        auth = mock.Mock()
+        openstack_shell.NeutronShell('2.0')._load_cached_token(
+            auth, 'session', cloud_config)
+        auth.set_auth_state.assert_called_once_with(new_auth_state)
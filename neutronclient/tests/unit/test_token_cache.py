@@ -0,0 +1,144 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+
+import fixtures
+from requests_mock.contrib import fixture as mock_fixture
+import testtools
+
+from neutronclient import client
+from neutronclient.common import token_cache
+from neutronclient.tests.unit import fakes
+
+
+class TokenCacheTest(testtools.TestCase):
+
+    def setUp(self):
+        super(TokenCacheTest, self).setUp()
+        self.cache_dir = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'tokens')
+        self.cache = token_cache.TokenCache(self.cache_dir)
+
+    def test_cache_key(self):
+        key = token_cache.cache_key(auth_url=fakes.AUTH_URL, username='user',
+                                    project_name='project')
+        self.assertEqual(key, token_cache.cache_key(
+            auth_url=fakes.AUTH_URL, username='user', project_name='project',
+            project_id=None))
+        self.assertNotEqual(key, token_cache.cache_key(
+            auth_url=fakes.AUTH_URL, username='user', project_name='other'))
+
+    def test_cache_key_secret(self):
+        key = token_cache.cache_key(auth_url=fakes.AUTH_URL, username='user',
+                                    password='secret')
+        self.assertEqual(key, token_cache.cache_key(
+            auth_url=fakes.AUTH_URL, username='user', password='secret'))
+        self.assertNotEqual(key, token_cache.cache_key(
+            auth_url=fakes.AUTH_URL, username='user', password='other'))
+        self.assertNotEqual(key, token_cache.cache_key(
+            auth_url=fakes.AUTH_URL, username='user'))
+        self.assertNotIn('secret', key)
+
+    def test_set_get(self):
+        auth_state = fakes.auth_state('token1')
+        self.assertIsNone(self.cache.get('key'))
+        self.cache.set('key', auth_state)
+        self.assertEqual(auth_state, self.cache.get('key'))
+        self.assertEqual(0o700, os.stat(self.cache_dir).st_mode & 0o777)
+        self.assertEqual(
+            0o600,
+            os.stat(os.path.join(self.cache_dir, 'key.json')).st_mode & 0o777)
+
+    def test_get_expired(self):
+        self.cache.set('key', fakes.auth_state('token1', expires_in=10))
+        self.assertIsNone(self.cache.get('key'))
+
+    def test_get_corrupted(self):
+        self.cache.set('key', '{"auth_token": ')
+        self.assertIsNone(self.cache.get('key'))
+
+    def test_delete_only_given_token(self):
+        self.cache.set('key', fakes.auth_state('token2'))
+        self.cache.delete('key', auth_token='token1')
+        self.assertIsNotNone(self.cache.get('key'))
+        self.cache.delete('key', auth_token='token2')
+        self.assertIsNone(self.cache.get('key'))
+        self.cache.delete('key')
+
+    def test_lock(self):
+        with self.cache.lock('key'):
+            self.cache.set('key', fakes.auth_state('token1'))
+        self.assertTrue(os.path.exists(
+            os.path.join(self.cache_dir, 'key.json.lock')))
+
+    def test_unusable_cache_dir(self):
+        path = self.useFixture(fixtures.TempDir()).path
+        open(os.path.join(path, 'file'), 'w').close()
+        cache = token_cache.TokenCache(os.path.join(path, 'file'))
+        with cache.lock('key'):
+            cache.set('key', fakes.auth_state('token1'))
+        self.assertIsNone(cache.get('key'))
+
+
+class HTTPClientTokenCacheTest(testtools.TestCase):
+
+    def setUp(self):
+        super(HTTPClientTokenCacheTest, self).setUp()
+        self.requests = self.useFixture(mock_fixture.Fixture())
+        self.cache = token_cache.TokenCache(
+            self.useFixture(fixtures.TempDir()).path)
+        self.tokens = self.requests.post(
+            fakes.AUTH_URL + '/tokens',
+            [{'json': fakes.token_body('token1')},
+             {'json': fakes.token_body('token2')}])
+
+    def _client(self, password='secret'):
+        return client.HTTPClient(username='user', password=password,
+                                 project_name='project',
+                                 auth_url=fakes.AUTH_URL,
+                                 region_name=fakes.REGION,
+                                 token_cache=self.cache)
+
+    def test_token_reused_by_other_clients(self):
+        self.requests.get(fakes.ENDPOINT_URL + '/v2.0/networks', text='{}')
+        self._client().do_request('/v2.0/networks', 'GET')
+        http = self._client()
+        http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual(1, self.tokens.call_count)
+        self.assertEqual('token1', http.auth_token)
+        self.assertEqual(fakes.ENDPOINT_URL, http.endpoint_url)
+
+    def test_rejected_token_renewed(self):
+        self._client().authenticate()
+        self.requests.get(fakes.ENDPOINT_URL + '/v2.0/networks',
+                          [{'status_code': 401}, {'text': '{}'}])
+        http = self._client()
+        http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual(2, self.tokens.call_count)
+        self.assertEqual('token2', http.auth_token)
+        self.assertEqual('token2',
+                         self.requests.last_request.headers['X-Auth-Token'])
+        # The new token replaced the rejected one in the cache.
+        http = self._client()
+        http.authenticate()
+        self.assertEqual('token2', http.auth_token)
+        self.assertEqual(2, self.tokens.call_count)
+
+    def test_other_password_not_reused(self):
+        self.requests.get(fakes.ENDPOINT_URL + '/v2.0/networks', text='{}')
+        self._client().do_request('/v2.0/networks', 'GET')
+        http = self._client(password='wrong')
+        http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual(2, self.tokens.call_count)
+        self.assertEqual('wrong', self.tokens.last_request.json()[
+            'auth']['passwordCredentials']['password'])
@@ -14,9 +14,14 @@
 #    under the License.
 
 import argparse
+import hashlib
+import logging
+import threading
 
+import fixtures
+import mock
 from oslo_utils import netutils
-
+import requests
 import testtools
 
 from neutronclient.common import exceptions
@@ -153,6 +158,131 @@ class TestUtils(testtools.TestCase):
         self.assertFalse(netutils.is_valid_cidr('10.10.10..0/24'))
         self.assertFalse(netutils.is_valid_cidr('wrong_cidr_format'))
 
+    def _response(self, content_type, content):
+        resp = requests.Response()
+        resp.headers['Content-Type'] = content_type
+        resp._content = content
+        return resp
+
+    def test_response_text_json(self):
+        body = u'{"name": "r\xe9seau"}'
+        resp = self._response('application/json', body.encode('utf-8'))
+        with mock.patch.object(requests.Response, 'apparent_encoding',
+                               new_callable=mock.PropertyMock) as guess:
+            self.assertEqual(body, utils.response_text(resp))
+        self.assertFalse(guess.called)
+
+    def test_response_text_charset(self):
+        resp = self._response('application/json; charset=latin-1',
+                              u'r\xe9seau'.encode('latin-1'))
+        resp.encoding = 'latin-1'
+        self.assertEqual(u'r\xe9seau', utils.response_text(resp))
+        resp = self._response('text/html', b'<html/>')
+        self.assertEqual(u'<html/>', utils.response_text(resp))
+
+
+class _RecordingHandler(logging.Handler):
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class HTTPLogTestCase(testtools.TestCase):
+
+    def setUp(self):
+        super(HTTPLogTestCase, self).setUp()
+        self.logger = logging.getLogger('neutronclient.test_http_log')
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.handler = _RecordingHandler()
+        self.logger.addHandler(self.handler)
+        self.addCleanup(self.logger.removeHandler, self.handler)
+
+    def _log_req(self, body='{"port": {}}'):
+        utils.http_log_req(self.logger, ('http://neutron/v2.0/ports', 'POST'),
+                           {'headers': {'X-Auth-Token': 'token'},
+                            'body': body})
+
+    def test_log_req(self):
+        self._log_req()
+        record = self.handler.records[0]
+        self.assertEqual(logging.DEBUG, record.levelno)
+        self.assertEqual(
+            'REQ: curl -i http://neutron/v2.0/ports -X POST '
+            '-H "X-Auth-Token: {SHA1}%s" -d \'{"port": {}}\'' %
+            hashlib.sha1(b'token').hexdigest(),
+            record.getMessage())
+
+    def test_log_req_disabled(self):
+        self.logger.setLevel(logging.INFO)
+        with mock.patch.object(utils, '_LoggedRequest') as logged:
+            self._log_req()
+        self.assertFalse(logged.called)
+        self.assertEqual([], self.handler.records)
+
+    def test_body_limit(self):
+        self.useFixture(fixtures.MockPatchObject(
+            utils, 'HTTP_LOG_BODY_LIMIT', 5))
+        resp = requests.Response()
+        resp.status_code = 200
+        utils.http_log_resp(self.logger, resp, u'0123456789')
+        self.assertIn('01234... (5 more characters)',
+                      self.handler.records[0].getMessage())
+
+    def test_body_sampling(self):
+        self.useFixture(fixtures.MockPatchObject(
+            utils, 'HTTP_LOG_BODY_SAMPLE_RATE', 0))
+        self._log_req()
+        self.assertNotIn('-d', self.handler.records[0].getMessage())
+
+    def test_env_number(self):
+        self.useFixture(fixtures.EnvironmentVariable(
+            'NEUTRONCLIENT_DEBUG_BODY_LIMIT', '10'))
+        self.assertEqual(10, utils._env_number(
+            'NEUTRONCLIENT_DEBUG_BODY_LIMIT', int, None))
+        self.useFixture(fixtures.EnvironmentVariable(
+            'NEUTRONCLIENT_DEBUG_BODY_LIMIT', '10k'))
+        self.assertIsNone(utils._env_number(
+            'NEUTRONCLIENT_DEBUG_BODY_LIMIT', int, None))
+
+    def test_log_level_override(self):
+        self.logger.setLevel(logging.INFO)
+        with utils.http_log_level(logging.INFO):
+            self._log_req()
+        self._log_req()
+        self.assertEqual([logging.INFO],
+                         [record.levelno for record in self.handler.records])
+
+    def test_async_handler(self):
+        target = _RecordingHandler()
+        handler = utils.AsyncLogHandler(target)
+        self.addCleanup(handler.close)
+        self.logger.removeHandler(self.handler)
+        self.logger.addHandler(handler)
+        self.addCleanup(self.logger.removeHandler, handler)
+        self._log_req()
+        handler.flush()
+        self.assertEqual(1, len(target.records))
+        self.assertIn('curl -i', target.records[0].getMessage())
+
+    def test_async_handler_full(self):
+        target = _RecordingHandler()
+        handler = utils.AsyncLogHandler(target, capacity=1)
+        self.addCleanup(handler.close)
+        blocked = threading.Event()
+        with mock.patch.object(target, 'handle',
+                               side_effect=lambda record: blocked.wait()):
+            for _i in range(3):
+                handler.emit(logging.LogRecord(
+                    'test', logging.DEBUG, __file__, 0, 'msg', (), None))
+            blocked.set()
+            handler.flush()
+        self.assertGreaterEqual(handler.dropped, 1)
+
 
 class ImportClassTestCase(testtools.TestCase):
     def test_get_client_class_invalid_version(self):
@@ -0,0 +1,98 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+from requests_mock.contrib import fixture as mock_fixture
+import testtools
+
+from neutronclient.v2_0 import client
+
+
+ENDPOINT_URL = 'http://neutron.test:9696'
+PORTS_URL = ENDPOINT_URL + '/v2.0/ports'
+
+
+class WatchTest(testtools.TestCase):
+
+    def setUp(self):
+        super(WatchTest, self).setUp()
+        self.requests = self.useFixture(mock_fixture.Fixture())
+        self.requests.get(PORTS_URL, json=self._list_ports)
+        self.client = client.Client(token='token', endpoint_url=ENDPOINT_URL)
+        patcher = mock.patch('time.sleep')
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.ports = {}
+        self.fetched = []
+
+    def _port(self, _id, revision_number=1, device_owner='compute:nova'):
+        self.ports[_id] = {'id': _id, 'name': 'port-' + _id,
+                           'revision_number': revision_number,
+                           'updated_at': '2018-01-01T00:00:0%d' %
+                           revision_number,
+                           'device_owner': device_owner}
+
+    def _list_ports(self, request, context):
+        ports = [port for port in self.ports.values()
+                 if port['device_owner'] in request.qs.get(
+                     'device_owner', [port['device_owner']])]
+        if 'id' in request.qs:
+            ports = [port for port in ports if port['id'] in request.qs['id']]
+            self.fetched.append(sorted(request.qs['id']))
+        fields = request.qs.get('fields')
+        if fields:
+            ports = [dict((f, port[f]) for f in fields) for port in ports]
+        return {'ports': sorted(ports, key=lambda port: port['id'])}
+
+    def _events(self, watcher, count):
+        return [(event, resource['id'], resource['revision_number'])
+                for event, resource in [next(watcher) for _i in range(count)]]
+
+    def test_watch(self):
+        self._port('a')
+        self._port('b')
+        watcher = self.client.watch_ports(interval=2)
+        self.assertEqual(('added', self.ports['a']), next(watcher))
+        self.assertEqual([('added', 'b', 1)], self._events(watcher, 1))
+
+        self._port('b', revision_number=2)
+        self._port('c')
+        del self.ports['a']
+        self.assertEqual([('deleted', 'a', 1), ('modified', 'b', 2),
+                          ('added', 'c', 1)],
+                         self._events(watcher, 3))
+        self.sleep.assert_called_once_with(2)
+        # Only the changed resources were fetched, in a single request.
+        self.assertEqual([['a', 'b'], ['b', 'c']], self.fetched)
+        self.assertEqual(
+            ['id', 'revision_number', 'updated_at'],
+            self.requests.request_history[2].qs['fields'])
+
+    def test_watch_unchanged(self):
+        self._port('a')
+        watcher = self.client.watch_ports()
+        self._events(watcher, 1)
+        self._port('b')
+        self.assertEqual([('added', 'b', 1)], self._events(watcher, 1))
+        self.assertEqual(1, self.sleep.call_count)
+        self.assertEqual([['a'], ['b']], self.fetched)
+
+    def test_watch_filters_and_fields(self):
+        self._port('a')
+        self._port('b', device_owner='network:dhcp')
+        watcher = self.client.watch_ports(device_owner='network:dhcp',
+                                          fields=['id', 'revision_number'])
+        self.assertEqual([('added', 'b', 1)], self._events(watcher, 1))
+        self.assertEqual(['network:dhcp'],
+                         self.requests.last_request.qs['device_owner'])
+        self.assertEqual(['id', 'revision_number'],
+                         self.requests.last_request.qs['fields'])
@@ -0,0 +1,716 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+"""asyncio flavour of the Neutron v2.0 client.
+
+This module requires Python 3.5 or later and the optional ``aiohttp``
+package, which the ``async`` extra installs::
+
+    pip install python-neutronclient[async]
+"""
+
+import asyncio
+import collections
+import copy
+import functools
+import logging
+import re
+import ssl
+import time
+
+from oslo_utils import importutils
+import requests
+from requests import structures
+
+from neutronclient._i18n import _
+from neutronclient import client
+from neutronclient.common import exceptions
+from neutronclient.common import retry
+from neutronclient.common import utils
+from neutronclient.v2_0 import client as v2_client
+
+aiohttp = importutils.try_import('aiohttp')
+osprofiler_web = importutils.try_import("osprofiler.web")
+
+_logger = logging.getLogger(__name__)
+
+
+class AsyncHTTPClient(object):
+    """Non-blocking transport for AsyncClient.
+
+    Authentication and endpoint discovery are delegated to a regular
+    ``HTTPClient`` or ``SessionClient`` (and so work with keystoneauth
+    sessions). As those calls may block, they are run in the default
+    executor and their result is cached until the server answers 401.
+    API requests themselves are sent with aiohttp.
+
+    :param auth_client: the synchronous HTTP client used for auth.
+    """
+
+    def __init__(self, auth_client, loop=None):
+        if aiohttp is None:
+            raise exceptions.NeutronClientException(
+                message=_('AsyncClient requires the aiohttp package.'))
+        self.auth_client = auth_client
+        self.loop = loop
+        self.auth_token = None
+        self.endpoint_url = None
+        self._session = None
+        # Created by the first authentication, within the event loop the
+        # client is used from.
+        self._auth_lock = None
+
+    def _get_loop(self):
+        return self.loop or asyncio.get_event_loop()
+
+    def _get_ssl(self):
+        if isinstance(self.auth_client, client.SessionClient):
+            verify = getattr(self.auth_client.session, 'verify', True)
+        else:
+            verify = self.auth_client.verify_cert
+        if verify is False:
+            return False
+        if isinstance(verify, str):
+            return ssl.create_default_context(cafile=verify)
+        return None
+
+    def _get_timeout(self):
+        if isinstance(self.auth_client, client.SessionClient):
+            timeout = getattr(self.auth_client.session, 'timeout', None)
+        else:
+            timeout = self.auth_client.timeout
+        return aiohttp.ClientTimeout(total=timeout)
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=self._get_timeout())
+        return self._session
+
+    def _fetch_auth(self, reauthenticate):
+        # NOTE: runs in an executor thread.
+        auth_client = self.auth_client
+        if isinstance(auth_client, client.SessionClient):
+            if reauthenticate:
+                auth_client.invalidate()
+            return auth_client.get_token(), auth_client.get_endpoint()
+        if reauthenticate:
+            auth_client.authenticate()
+        else:
+            auth_client.authenticate_and_fetch_endpoint_url()
+        return auth_client.auth_token, auth_client.endpoint_url
+
+    async def authenticate(self, reauthenticate=False):
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        async with self._auth_lock:
+            if self.auth_token and not reauthenticate:
+                return
+            self.auth_token, self.endpoint_url = (
+                await self._get_loop().run_in_executor(
+                    None, self._fetch_auth, reauthenticate))
+
+    def _check_uri_length(self, url):
+        uri_len = len(self.endpoint_url) + len(url)
+        if uri_len > client.MAX_URI_LEN:
+            raise exceptions.RequestURITooLong(
+                excess=uri_len - client.MAX_URI_LEN)
+
+    def _build_headers(self, body, headers):
+        headers = dict(headers or {})
+        headers.setdefault('Accept', 'application/json')
+        if body:
+            headers.setdefault('Content-Type', 'application/json')
+        global_request_id = getattr(self.auth_client, 'global_request_id',
+                                    None)
+        if global_request_id:
+            headers.setdefault(client.REQ_ID_HEADER, global_request_id)
+        headers['User-Agent'] = client.USER_AGENT
+        headers['X-Auth-Token'] = self.auth_token
+        if osprofiler_web:
+            headers.update(osprofiler_web.get_trace_id_headers())
+        return headers
+
+    async def request(self, url, method, body=None, headers=None):
+        """Send a single request and return ``(response, text)``.
+
+        The aiohttp response is converted into a ``requests.Response`` so
+        that the request-id and error handling of ClientBase apply as is.
+        """
+        utils.http_log_req(_logger, (url, method),
+                           {'headers': headers, 'body': body})
+        try:
+            async with self._get_session().request(
+                    method, url, data=body, headers=headers,
+                    ssl=self._get_ssl()) as aio_resp:
+                content = await aio_resp.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            _logger.debug("throwing ConnectionFailed : %s", e)
+            raise exceptions.ConnectionFailed(reason=e)
+
+        resp = requests.Response()
+        resp.status_code = aio_resp.status
+        resp.reason = aio_resp.reason
+        resp.headers = structures.CaseInsensitiveDict(aio_resp.headers)
+        resp.url = str(aio_resp.url)
+        resp.encoding = aio_resp.charset or 'utf-8'
+        resp.request = requests.Request(method, url).prepare()
+        resp._content = content
+        text = resp.text
+        utils.http_log_resp(_logger, resp, text)
+        return resp, text
+
+    async def do_request(self, url, method, body=None, headers=None):
+        await self.authenticate()
+        self._check_uri_length(url)
+        resp, text = await self.request(
+            self.endpoint_url + url, method, body=body,
+            headers=self._build_headers(body, headers))
+        if resp.status_code == 401:
+            # The token may have expired, authenticate again and retry once.
+            await self.authenticate(reauthenticate=True)
+            resp, text = await self.request(
+                self.endpoint_url + url, method, body=body,
+                headers=self._build_headers(body, headers))
+        return resp, text
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class _AsyncLimiter(object):
+    """Waits for the turn of a request in a ``ratelimit.Limiter``.
+
+    The wait does not block the event loop nor take an executor thread:
+    the concurrency is capped by a semaphore and the rate is waited for
+    with ``asyncio.sleep``. The concurrency is capped among the requests
+    of the client, the token bucket, the ``in_flight`` count and the
+    ``wait`` histogram of the limiter are shared with its other users.
+    """
+
+    def __init__(self, limiter):
+        self.limiter = limiter
+        self._semaphore = None
+        if limiter.concurrency is not None:
+            self._semaphore = asyncio.Semaphore(limiter.concurrency)
+        # Waits for the rate in the order of arrival.
+        self._rate_lock = asyncio.Lock()
+
+    async def _wait_rate(self):
+        bucket = self.limiter.bucket
+        async with self._rate_lock:
+            while not bucket.consume():
+                await asyncio.sleep(bucket.wait_time())
+
+    async def acquire(self):
+        limiter = self.limiter
+        start = limiter._timer()
+        ticket = object()
+        with limiter._cond:
+            limiter._queue.append(ticket)
+        try:
+            if self._semaphore is not None:
+                await self._semaphore.acquire()
+            try:
+                if limiter.bucket is not None:
+                    await self._wait_rate()
+            except BaseException:
+                if self._semaphore is not None:
+                    self._semaphore.release()
+                raise
+            with limiter._cond:
+                limiter.in_flight += 1
+        finally:
+            with limiter._cond:
+                limiter._queue.remove(ticket)
+                limiter._cond.notify_all()
+        limiter.wait.observe(limiter._timer() - start)
+
+    def release(self):
+        self.limiter.release()
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+
+class _AsyncGeneratorWithMeta(v2_client._RequestIdMixin):
+    """Asynchronous iterator over the pages of a listing.
+
+    With ``single_items`` the resources of each page are returned one by
+    one instead of the page dicts.
+    """
+
+    def __init__(self, client, collection, path, single_items=False,
+                 **params):
+        self.client = client
+        self.collection = collection
+        self.path = path
+        self.single_items = single_items
+        self.params = params
+        self.page_reverse = params.get('page_reverse', False)
+        self.pending = collections.deque()
+        self._request_ids_setup()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self.pending:
+            if self.params is None:
+                raise StopAsyncIteration
+            res = await self.client.get(self.path, params=self.params)
+            self._append_request_ids(res.request_ids)
+            self.params = self.client._next_page_params(
+                res, self.collection, self.page_reverse)
+            if self.single_items:
+                self.pending.extend(res[self.collection])
+            else:
+                self.pending.append(res)
+        return self.pending.popleft()
+
+
+class _AsyncWatch(object):
+    """Asynchronous iterator over the changes of a collection.
+
+    See ``Client.watch``, the collection is polled every ``interval``
+    seconds with ``asyncio.sleep`` in between.
+    """
+
+    def __init__(self, client, collection, interval, fields, params):
+        self.client = client
+        self.collection = collection
+        self.interval = interval
+        self.fields = fields
+        self.params = params
+        self.snapshot = {}
+        self.pending = collections.deque()
+        self.polled = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self.pending:
+            if self.polled:
+                await asyncio.sleep(self.interval)
+            self.polled = True
+            await self._poll()
+        return self.pending.popleft()
+
+    async def _poll(self):
+        obj_lister = getattr(self.client, 'list_%s' % self.collection)
+        listing = await obj_lister(fields=list(v2_client.WATCH_FIELDS),
+                                   **self.params)
+        versions, changed = self.client._watch_diff(
+            self.snapshot, listing[self.collection])
+        for _id in [_id for _id in self.snapshot if _id not in versions]:
+            self.pending.append(('deleted', self.snapshot.pop(_id)[1]))
+        fetched = {}
+        if changed:
+            fetched = await self.client.list_by_ids(
+                self.collection, changed, fields=self.fields, **self.params)
+        self.pending.extend(self.client._watch_update(
+            self.snapshot, versions, changed, fetched))
+
+
+class AsyncClient(v2_client.Client):
+    """asyncio client for the OpenStack Neutron v2.0 API.
+
+    It accepts the same arguments as :class:`neutronclient.v2_0.client.
+    Client` and offers the same methods, including the ones added by
+    client extensions, but every call returns a coroutine. Listings with
+    ``retrieve_all=False`` and the ``watch`` methods return asynchronous
+    iterators.
+
+    Example::
+
+        from neutronclient.v2_0 import async_client
+        neutron = async_client.AsyncClient(session=sess)
+
+        nets = await neutron.list_networks()
+        async for page in neutron.list_ports(retrieve_all=False):
+            ...
+        await neutron.close()
+    """
+
+    def __init__(self, **kwargs):
+        loop = kwargs.pop('loop', None)
+        super(AsyncClient, self).__init__(**kwargs)
+        self.async_httpclient = AsyncHTTPClient(self.httpclient, loop=loop)
+        self._async_limiters = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the connections held by the client."""
+        await self.async_httpclient.close()
+
+    def do_request(self, method, action, body=None, headers=None,
+                   params=None):
+        return self._do_request(method, action, body=body, headers=headers,
+                                params=params)
+
+    async def _do_request(self, method, action, body=None, headers=None,
+                          params=None, attempt=0):
+        path = action
+        # Add format and project_id
+        action = self.action_prefix + action
+        if isinstance(params, dict) and params:
+            params = utils.safe_encode_dict(params)
+            action += '?' + v2_client.urlparse.urlencode(params, doseq=1)
+
+        if body:
+            body = self.serialize(body)
+
+        if self.governor is not None:
+            # Authenticate first, a request holding its turn must not wait
+            # for the others.
+            await self.async_httpclient.authenticate()
+            acquired = await self._acquire_limits(method, path)
+            try:
+                resp, replybody = await self._send_request(
+                    method, action, path, body, headers, attempt)
+            finally:
+                for limiter in reversed(acquired):
+                    limiter.release()
+        else:
+            resp, replybody = await self._send_request(
+                method, action, path, body, headers, attempt)
+
+        status_code = resp.status_code
+        if status_code in (requests.codes.ok,
+                           requests.codes.created,
+                           requests.codes.accepted,
+                           requests.codes.no_content):
+            data = self.deserialize(replybody, status_code)
+            return self._convert_into_with_meta(data, resp)
+        else:
+            if not replybody:
+                replybody = resp.reason
+            self._handle_fault_response(status_code, replybody, resp)
+
+    async def _send_request(self, method, action, path, body, headers,
+                            attempt):
+        """Send a request, recording its metrics if enabled."""
+        if self.metrics is None:
+            return await self.async_httpclient.do_request(
+                action, method, body=body, headers=headers)
+        resp = None
+        start = time.time()
+        try:
+            resp, replybody = await self.async_httpclient.do_request(
+                action, method, body=body, headers=headers)
+            return resp, replybody
+        finally:
+            self._record_request(method, path, start, resp, body, attempt)
+
+    def _async_limiter(self, limiter):
+        # Created on first use, in the running event loop.
+        async_limiter = self._async_limiters.get(limiter)
+        if async_limiter is None:
+            async_limiter = self._async_limiters[limiter] = (
+                _AsyncLimiter(limiter))
+        return async_limiter
+
+    async def _acquire_limits(self, method, path):
+        """Wait for the turn of a request in the limits of the governor.
+
+        The limits are acquired in the same order as ``Governor.request``
+        does, without blocking the event loop.
+
+        :returns: the limits acquired, to release once the request is
+                  sent.
+        """
+        acquired = []
+        try:
+            for limiter in self.governor._matching(method, path):
+                async_limiter = self._async_limiter(limiter)
+                await async_limiter.acquire()
+                acquired.append(async_limiter)
+        except BaseException:
+            for async_limiter in reversed(acquired):
+                async_limiter.release()
+            raise
+        return acquired
+
+    async def retry_request(self, method, action, body=None,
+                            headers=None, params=None):
+        """Call do_request, retrying the failures allowed by retry_policy.
+
+        Only idempotent requests should retry failed connection attempts.
+        :raises: ConnectionFailed if the maximum # of retries is exceeded
+        """
+        attempt = 0
+        while True:
+            try:
+                return await self._do_request(method, action, body=body,
+                                              headers=headers, params=params,
+                                              attempt=attempt)
+            except Exception as e:
+                delay = self.retry_policy.get_delay(method, e, attempt,
+                                                    self.retries)
+                if delay is None:
+                    if (not isinstance(e, retry.CONNECTION_ERRORS) or
+                            self.raise_errors):
+                        raise
+                    break
+                # Exception has already been logged by do_request()
+                _logger.debug('Retrying request to Neutron service in '
+                              '%.1f seconds', delay)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+        if attempt:
+            msg = (_("Failed to connect to Neutron server after %d attempts")
+                   % (attempt + 1))
+        else:
+            msg = _("Failed to connect Neutron server")
+
+        raise exceptions.ConnectionFailed(reason=msg)
+
+    async def _mutate(self, send, method, action, **kwargs):
+        # Forget the lookups once the request is done rather than when the
+        # coroutine is created, see Client._mutate.
+        self._invalidate_resolution_cache()
+        try:
+            return await send(method, action, **kwargs)
+        finally:
+            self._invalidate_resolution_cache()
+
+    def get(self, action, body=None, headers=None, params=None):
+        # The response cache of the synchronous client is not used.
+        return self.retry_request("GET", action, body=body,
+                                  headers=headers, params=params)
+
+    async def create_bulk(self, collection, path, items,
+                          chunk_size=v2_client.BULK_CHUNK_SIZE):
+        if chunk_size < 1:
+            raise ValueError(_("chunk_size must be a positive integer"))
+        items = list(items)
+        created = []
+        request_ids = []
+        for start in range(0, len(items), chunk_size):
+            res = await self.post(path, body={
+                collection: items[start:start + chunk_size]})
+            request_ids.extend(res.request_ids)
+            created.extend(v2_client._DictWithMeta(item, res.request_ids)
+                           for item in res[collection])
+        return v2_client._DictWithMeta({collection: created}, request_ids)
+
+    def list(self, collection, path, retrieve_all=True, prefetch=None,
+             stream=False, **params):
+        """List a collection.
+
+        Returns a coroutine resolving to the whole collection, or with
+        ``retrieve_all=False`` an asynchronous iterator over the pages.
+        ``stream=True`` returns an asynchronous iterator over the single
+        resources. ``prefetch`` is accepted for compatibility and ignored.
+        """
+        if stream or not retrieve_all:
+            return _AsyncGeneratorWithMeta(self, collection, path,
+                                           single_items=stream, **params)
+        return self._list_all(collection, path, **params)
+
+    async def _list_all(self, collection, path, **params):
+        res = []
+        request_ids = []
+        async for page in _AsyncGeneratorWithMeta(self, collection, path,
+                                                  **params):
+            res.extend(page[collection])
+            request_ids.extend(page.request_ids)
+        return v2_client._DictWithMeta({collection: res}, request_ids)
+
+    async def _list_filter_chunk(self, obj_lister, collection, key, chunk,
+                                 params):
+        params = dict(params)
+        params[key] = chunk
+        try:
+            return (await obj_lister(**params))[collection]
+        except exceptions.RequestURITooLong:
+            if len(chunk) == 1:
+                raise
+            half = len(chunk) // 2
+            return ((await self._list_filter_chunk(
+                obj_lister, collection, key, chunk[:half], params)) +
+                (await self._list_filter_chunk(
+                    obj_lister, collection, key, chunk[half:], params)))
+
+    async def list_by_ids(self, collection, ids, fields=None,
+                          concurrency=None, **params):
+        obj_lister = getattr(self, 'list_%s' % collection)
+        chunks = self._prepare_list_by_ids(ids, fields, params)
+        if concurrency is None:
+            concurrency = v2_client.LIST_BY_IDS_CONCURRENCY
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def _fetch(chunk):
+            async with semaphore:
+                return await self._list_filter_chunk(
+                    obj_lister, collection, 'id', chunk, params)
+
+        results = await asyncio.gather(*[_fetch(chunk) for chunk in chunks])
+        return dict((item['id'], item) for result in results
+                    for item in result)
+
+    def watch(self, collection, interval=None, fields=None, **params):
+        """Poll a collection, see Client.watch.
+
+        Returns an endless asynchronous iterator over the
+        ``(event, resource)`` tuples.
+        """
+        if interval is None:
+            interval = v2_client.WATCH_INTERVAL
+        return _AsyncWatch(self, collection, interval, fields, params)
+
+    async def _count_by_tenant(self, resource):
+        obj_lister = getattr(self, 'list_%ss' % resource)
+        counts = collections.Counter()
+        async for page in obj_lister(retrieve_all=False,
+                                     fields=['tenant_id']):
+            self._count_owners(counts, page['%ss' % resource])
+        return counts
+
+    async def quota_usage_report(self, resources=None, concurrency=None):
+        resources = self._quota_usage_resources(resources)
+        tasks = [self.list_quotas] + [
+            functools.partial(self._count_by_tenant, resource)
+            for resource in resources]
+        if concurrency is None:
+            concurrency = len(tasks)
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def _run(task):
+            async with semaphore:
+                return await task()
+
+        results = await asyncio.gather(*[_run(task) for task in tasks])
+        quotas, counts, without_quotas = self._quota_usage_inputs(
+            resources, results)
+        default = None
+        if without_quotas:
+            default = (await self.show_quota_default(
+                without_quotas[0]))['quota']
+        return self._quota_usage_rows(resources, quotas, counts, default)
+
+    async def find_resources(self, resource, names_or_ids, project_id=None,
+                             cmd_resource=None, parent_id=None, fields=None):
+        found = v2_client._FoundResources(resource, list(names_or_ids))
+        requested = list(collections.OrderedDict.fromkeys(found.requested))
+        if not requested:
+            return found
+        obj_lister = self._get_lister(resource, cmd_resource, parent_id)
+        collection = self.get_resource_plural(resource)
+        params = self._find_resources_params(fields)
+
+        by_id = {}
+        ids = [v for v in requested if re.match(v2_client.UUID_PATTERN, v)]
+        for chunk in self._chunk_filter_values('id', ids):
+            for info in await self._list_filter_chunk(
+                    obj_lister, collection, 'id', chunk, params):
+                by_id[info['id']] = info
+
+        by_name = collections.defaultdict(list)
+        names = [v for v in requested if v not in by_id]
+        if project_id:
+            params['tenant_id'] = project_id
+        for chunk in self._chunk_filter_values('name', names):
+            for info in await self._list_filter_chunk(
+                    obj_lister, collection, 'name', chunk, params):
+                by_name[info['name']].append(info)
+        return self._fill_found_resources(found, requested, by_id, by_name)
+
+    async def find_resource_by_id(self, resource, resource_id,
+                                  cmd_resource=None, parent_id=None,
+                                  fields=None):
+        obj_lister = self._get_lister(resource, cmd_resource, parent_id)
+        collection = self.get_resource_plural(resource)
+        # perform search by id only if we are passing a valid UUID
+        if re.match(v2_client.UUID_PATTERN, resource_id):
+            params = {'id': resource_id}
+            if fields:
+                params['fields'] = fields
+            data = await obj_lister(**params)
+            if data and data[collection]:
+                return data[collection][0]
+        not_found_message = (_("Unable to find %(resource)s with id "
+                               "'%(id)s'") %
+                             {'resource': resource, 'id': resource_id})
+        # 404 is raised by exceptions.NotFound to simulate serverside behavior
+        raise exceptions.NotFound(message=not_found_message)
+
+    async def _find_resource_by_name(self, resource, name, project_id=None,
+                                     cmd_resource=None, parent_id=None,
+                                     fields=None):
+        obj_lister = self._get_lister(resource, cmd_resource, parent_id)
+        params = {'name': name}
+        if fields:
+            params['fields'] = fields
+        if project_id:
+            params['tenant_id'] = project_id
+        data = await obj_lister(**params)
+        info = data[self.get_resource_plural(resource)]
+        if len(info) > 1:
+            raise exceptions.NeutronClientNoUniqueMatch(resource=resource,
+                                                        name=name)
+        elif len(info) == 0:
+            not_found_message = (_("Unable to find %(resource)s with name "
+                                   "'%(name)s'") %
+                                 {'resource': resource, 'name': name})
+            # 404 is raised by exceptions.NotFound
+            # to simulate serverside behavior
+            raise exceptions.NotFound(message=not_found_message)
+        return info[0]
+
+    async def find_resource(self, resource, name_or_id, project_id=None,
+                            cmd_resource=None, parent_id=None, fields=None):
+        if self.resolution_cache is None:
+            return await self._find_resource(
+                resource, name_or_id, project_id, cmd_resource, parent_id,
+                fields)
+        if isinstance(fields, (list, tuple)):
+            fields = tuple(fields)
+        key = (resource, name_or_id, project_id, parent_id, cmd_resource,
+               fields)
+        info = self.resolution_cache.get(key)
+        if info is None:
+            info = await self._find_resource(
+                resource, name_or_id, project_id, cmd_resource, parent_id,
+                fields)
+            self.resolution_cache.set(key, info)
+        return copy.deepcopy(info)
+
+    async def _find_resource(self, resource, name_or_id, project_id=None,
+                             cmd_resource=None, parent_id=None, fields=None):
+        try:
+            return await self.find_resource_by_id(
+                resource, name_or_id, cmd_resource, parent_id, fields)
+        except exceptions.NotFound:
+            try:
+                return await self._find_resource_by_name(
+                    resource, name_or_id, project_id,
+                    cmd_resource, parent_id, fields)
+            except exceptions.NotFound:
+                not_found_message = (_("Unable to find %(resource)s with name "
+                                       "or id '%(name_or_id)s'") %
+                                     {'resource': resource,
+                                      'name_or_id': name_or_id})
+                raise exceptions.NotFound(
+                    message=not_found_message)
@@ -16,28 +16,65 @@
 #    under the License.
 #
 
+import collections
+from concurrent import futures
+import copy
+import functools
 import inspect
 import itertools
 import logging
 import re
+import sys
+import threading
 import time
 
 import debtcollector.renames
-from keystoneauth1 import exceptions as ksa_exc
+from oslo_utils import encodeutils
 import requests
+import six
+from six.moves import queue
 import six.moves.urllib.parse as urlparse
 from six import string_types
 
 from neutronclient._i18n import _
 from neutronclient import client
+from neutronclient.common import cache
 from neutronclient.common import exceptions
 from neutronclient.common import extension as client_extension
+from neutronclient.common import metrics
+from neutronclient.common import retry
 from neutronclient.common import serializer
 from neutronclient.common import utils
 
 
 _logger = logging.getLogger(__name__)
 
+# Size of the chunks read from the response body when streaming a listing.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Default number of resources sent in a single bulk create request.
+BULK_CHUNK_SIZE = 500
+
+# Part of MAX_URI_LEN kept for the endpoint, the resource path and other
+# query parameters when a filter on many values is split over requests.
+FILTER_URI_RESERVED = 1024
+
+# Seconds the prefetching thread waits on a full queue before checking
+# whether the caller stopped consuming the pages.
+PREFETCH_PUT_TIMEOUT = 0.1
+
+# Default number of chunks list_by_ids requests in parallel.
+LIST_BY_IDS_CONCURRENCY = 4
+
+# Default number of seconds between two listings of a watched collection.
+WATCH_INTERVAL = 5
+# Fields listed by watch to detect the changes of a collection.
+WATCH_FIELDS = ('id', 'revision_number', 'updated_at')
+
+# Resources counted by quota_usage_report by default.
+QUOTA_USAGE_RESOURCES = ('network', 'port', 'router', 'floatingip',
+                         'security_group')
+
 HEX_ELEM = '[0-9A-Fa-f]'
 UUID_PATTERN = '-'.join([HEX_ELEM + '{8}', HEX_ELEM + '{4}',
                          HEX_ELEM + '{4}', HEX_ELEM + '{4}',
@@ -93,6 +130,15 @@ def exception_handler_v20(status_code, error_content):
                      request_ids=request_ids)
 
 
+def _revision_number(body):
+    """Return the revision number of a single resource response body."""
+    if isinstance(body, dict) and len(body) == 1:
+        resource = next(iter(body.values()))
+        if isinstance(resource, dict):
+            return resource.get('revision_number')
+    return None
+
+
 class _RequestIdMixin(object):
     """Wrapper class to expose x-openstack-request-id to the caller."""
     def _request_ids_setup(self):
@@ -186,6 +232,55 @@ class _GeneratorWithMeta(_RequestIdMixin):
         return obj
 
 
+class _StreamWithMeta(_GeneratorWithMeta):
+    """Iterator over single resources of a streamed, paginated listing.
+
+    ``paginate_func`` yields ``(response, items)`` for every page; the
+    request id of each page is recorded as soon as the page is requested.
+    """
+
+    def _paginate(self):
+        for resp, items in self.paginate_func(
+                self.collection, self.path, **self.params):
+            self._append_request_ids(resp)
+            for item in items:
+                yield item, None
+
+
+class _FoundResources(collections.OrderedDict):
+    """Result of ClientBase.find_resources.
+
+    Maps every resolved name or ID, in the order they were requested, to
+    its resource. Inputs matching several resources are listed in
+    ``ambiguous`` and inputs matching none in ``missing``.
+    """
+
+    def __init__(self, resource, requested):
+        super(_FoundResources, self).__init__()
+        self.resource = resource
+        self.requested = requested
+        self.missing = []
+        self.ambiguous = []
+
+    def check(self):
+        """Raise the error find_resource gives for the first failed input."""
+        for name_or_id in self.requested:
+            if name_or_id in self.ambiguous:
+                raise exceptions.NeutronClientNoUniqueMatch(
+                    resource=self.resource, name=name_or_id)
+            if name_or_id in self.missing:
+                not_found_message = (_("Unable to find %(resource)s with name "
+                                       "or id '%(name_or_id)s'") %
+                                     {'resource': self.resource,
+                                      'name_or_id': name_or_id})
+                raise exceptions.NotFound(message=not_found_message)
+
+    def ids(self):
+        """Return the IDs in the requested order, see check()."""
+        self.check()
+        return [self[name_or_id]['id'] for name_or_id in self.requested]
+
+
 class ClientBase(object):
     """Client for the OpenStack Neutron v2.0 API.
 
@@ -220,11 +315,55 @@ class ClientBase(object):
     :param integer retries: How many times idempotent (GET, PUT, DELETE)
                             requests to Neutron server should be retried if
                             they fail (default: 0).
+    :param retry_policy: ``neutronclient.common.retry.RetryPolicy`` deciding
+                         which failures are retried and how long to wait
+                         in between. Its ``stats()`` count the retries.
+                         (default: a new ``RetryPolicy()``)
+    :param governor: ``neutronclient.common.ratelimit.Governor`` limiting
+                     the rate and concurrency of the requests of the
+                     client, e.g. when it is shared by many threads.
+                     Its ``stats()`` report the time requests waited.
+                     (optional)
+    :param metrics: ``neutronclient.common.metrics.RequestMetrics`` recording
+                    the method, path, status, latency and sizes of every
+                    request sent. (optional)
     :param bool raise_errors: If True then exceptions caused by connection
                               failure are propagated to the caller.
                               (default: True)
     :param session: Keystone client auth session to use. (optional)
     :param auth: Keystone auth plugin to use. (optional)
+    :param integer pool_connections: Number of per-host connection pools
+                                     kept by the legacy HTTP client.
+                                     Ignored when a session is given.
+                                     (optional)
+    :param integer pool_maxsize: Maximum number of connections kept open to
+                                 a single host by the legacy HTTP client.
+                                 Ignored when a session is given. (optional)
+    :param bool pool_block: Block instead of opening extra connections when
+                            the pool to a host is exhausted. (default: False)
+    :param bool keep_alive: Reuse connections between requests. If False,
+                            every request asks the server to close the
+                            connection. (default: True)
+    :param integer page_prefetch: How many pages of a paginated listing
+                                  may be fetched ahead of the caller in a
+                                  background thread. 0 disables prefetching.
+                                  Can be overridden per call with the
+                                  ``prefetch`` argument of ``list``.
+                                  (default: 0)
+    :param integer resolution_cache_size: Number of name or ID lookups done
+                                          by ``find_resource`` to remember.
+                                          Any create, update or delete sent
+                                          through the client clears them.
+                                          0 disables the cache. (default: 0)
+    :param resolution_cache_ttl: Seconds a remembered lookup stays valid.
+                                 (default: 60)
+    :param integer response_cache_size: Bytes of single resource response
+                                        bodies, e.g. of ``show_network``,
+                                        to remember. A remembered body is
+                                        only returned once the server
+                                        confirmed it is current, see
+                                        ``get``. 0 disables the cache.
+                                        (default: 0)
 
     Example::
 
@@ -248,7 +387,23 @@ class ClientBase(object):
         """Initialize a new client for the Neutron v2.0 API."""
         super(ClientBase, self).__init__()
         self.retries = kwargs.pop('retries', 0)
+        self.retry_policy = (kwargs.pop('retry_policy', None) or
+                             retry.RetryPolicy())
+        self.governor = kwargs.pop('governor', None)
+        self.metrics = kwargs.pop('metrics', None)
+        self._retry_state = threading.local()
         self.raise_errors = kwargs.pop('raise_errors', True)
+        self.page_prefetch = kwargs.pop('page_prefetch', 0)
+        cache_size = kwargs.pop('resolution_cache_size', 0)
+        cache_ttl = kwargs.pop('resolution_cache_ttl', 60)
+        self.resolution_cache = None
+        if cache_size:
+            self.resolution_cache = cache.LRUCache(cache_size, ttl=cache_ttl)
+        response_cache_size = kwargs.pop('response_cache_size', 0)
+        self.response_cache = None
+        if response_cache_size:
+            self.response_cache = cache.LRUCache(
+                None, maxbytes=response_cache_size)
         self.httpclient = client.construct_http_client(**kwargs)
         self.version = '2.0'
         self.action_prefix = "/v%s" % (self.version)
@@ -266,9 +421,22 @@ class ClientBase(object):
             des_error_body = {'message': response_body}
         error_body = self._convert_into_with_meta(des_error_body, resp)
         # Raise the appropriate exception
-        exception_handler_v20(status_code, error_body)
-
-    def do_request(self, method, action, body=None, headers=None, params=None):
+        try:
+            exception_handler_v20(status_code, error_body)
+        except exceptions.NeutronClientException as e:
+            e.retry_after = retry.parse_retry_after(
+                resp.headers.get('Retry-After'))
+            raise
+
+    def do_request(self, method, action, body=None, headers=None, params=None,
+                   stream=False):
+        """Send a request and deserialize the response.
+
+        With ``stream`` set the response body is not read; the successful
+        ``requests.Response`` is returned so that the caller can consume it
+        incrementally.
+        """
+        path = action
         # Add format and project_id
         action = self.action_prefix + action
         if isinstance(params, dict) and params:
@@ -278,21 +446,70 @@ class ClientBase(object):
         if body:
             body = self.serialize(body)
 
-        resp, replybody = self.httpclient.do_request(action, method, body=body,
-                                                     headers=headers)
+        request_kwargs = {'body': body, 'headers': headers}
+        if stream:
+            request_kwargs['stream'] = True
+        if self.governor is not None:
+            with self.governor.request(method, path):
+                resp, replybody = self._http_request(method, action, path,
+                                                     **request_kwargs)
+        else:
+            resp, replybody = self._http_request(method, action, path,
+                                                 **request_kwargs)
 
         status_code = resp.status_code
         if status_code in (requests.codes.ok,
                            requests.codes.created,
                            requests.codes.accepted,
-                           requests.codes.no_content):
+                           requests.codes.no_content,
+                           requests.codes.not_modified):
+            if stream:
+                return resp
             data = self.deserialize(replybody, status_code)
             return self._convert_into_with_meta(data, resp)
         else:
+            if stream:
+                replybody = utils.response_text(resp)
             if not replybody:
                 replybody = resp.reason
             self._handle_fault_response(status_code, replybody, resp)
 
+    def _http_request(self, method, action, path, **kwargs):
+        """Send a request, recording its metrics if enabled."""
+        if self.metrics is None:
+            return self.httpclient.do_request(action, method, **kwargs)
+        resp = None
+        start = time.time()
+        try:
+            resp, replybody = self.httpclient.do_request(action, method,
+                                                         **kwargs)
+            return resp, replybody
+        finally:
+            self._record_request(method, path, start, resp,
+                                 kwargs.get('body'),
+                                 getattr(self._retry_state, 'attempt', 0),
+                                 stream=kwargs.get('stream', False))
+
+    def _record_request(self, method, path, start, resp, body, attempt,
+                        stream=False):
+        """Record the metrics of a request sent at ``start``."""
+        response_bytes = 0
+        if resp is not None:
+            if stream:
+                response_bytes = int(resp.headers.get('Content-Length') or 0)
+            else:
+                response_bytes = len(resp.content or b'')
+        self.metrics.record(metrics.RequestRecord(
+            method=method,
+            path=metrics.path_template(path),
+            status=resp.status_code if resp is not None else None,
+            latency=time.time() - start,
+            request_bytes=len(body or ''),
+            response_bytes=response_bytes,
+            attempt=attempt,
+            request_id=(resp.headers.get('x-openstack-request-id')
+                        if resp is not None else None)))
+
     def get_auth_info(self):
         return self.httpclient.get_auth_info()
 
@@ -318,81 +535,276 @@ class ClientBase(object):
             data)['body']
 
     def retry_request(self, method, action, body=None,
-                      headers=None, params=None):
-        """Call do_request with the default retry configuration.
+                      headers=None, params=None, stream=False):
+        """Call do_request, retrying the failures allowed by retry_policy.
 
         Only idempotent requests should retry failed connection attempts.
         :raises: ConnectionFailed if the maximum # of retries is exceeded
         """
-        max_attempts = self.retries + 1
-        for i in range(max_attempts):
-            try:
-                return self.do_request(method, action, body=body,
-                                       headers=headers, params=params)
-            except (exceptions.ConnectionFailed, ksa_exc.ConnectionError):
-                # Exception has already been logged by do_request()
-                if i < self.retries:
-                    _logger.debug('Retrying connection to Neutron service')
-                    time.sleep(self.retry_interval)
-                elif self.raise_errors:
-                    raise
-
-        if self.retries:
+        attempt = 0
+        try:
+            while True:
+                # Tell the metrics recorded by do_request the attempt.
+                self._retry_state.attempt = attempt
+                try:
+                    return self.do_request(method, action, body=body,
+                                           headers=headers, params=params,
+                                           stream=stream)
+                except Exception as e:
+                    delay = self.retry_policy.get_delay(method, e, attempt,
+                                                        self.retries)
+                    if delay is None:
+                        if (not isinstance(e, retry.CONNECTION_ERRORS) or
+                                self.raise_errors):
+                            raise
+                        break
+                    # Exception has already been logged by do_request()
+                    _logger.debug('Retrying request to Neutron service in '
+                                  '%.1f seconds', delay)
+                    time.sleep(delay)
+                    attempt += 1
+        finally:
+            self._retry_state.attempt = 0
+
+        if attempt:
             msg = (_("Failed to connect to Neutron server after %d attempts")
-                   % max_attempts)
+                   % (attempt + 1))
         else:
             msg = _("Failed to connect Neutron server")
 
         raise exceptions.ConnectionFailed(reason=msg)
 
+    def _invalidate_resolution_cache(self):
+        # A mutation may rename, delete or create resources matching a
+        # remembered lookup, forget all of them.
+        if self.resolution_cache is not None:
+            self.resolution_cache.invalidate()
+
+    def _mutate(self, send, method, action, **kwargs):
+        """Send a request changing resources with ``send``.
+
+        The remembered lookups are forgotten both before and after the
+        request, as lookups done while it is in flight may see the old
+        state of the resources.
+        """
+        self._invalidate_resolution_cache()
+        try:
+            return send(method, action, **kwargs)
+        finally:
+            self._invalidate_resolution_cache()
+
     def delete(self, action, body=None, headers=None, params=None):
-        return self.retry_request("DELETE", action, body=body,
-                                  headers=headers, params=params)
+        return self._mutate(self.retry_request, "DELETE", action, body=body,
+                            headers=headers, params=params)
 
     def get(self, action, body=None, headers=None, params=None):
+        if self.response_cache is not None and not body and not headers:
+            return self._cached_get(action, params)
         return self.retry_request("GET", action, body=body,
                                   headers=headers, params=params)
 
+    def _cached_get(self, action, params):
+        """GET a resource, reusing the body remembered for its URL.
+
+        Bodies are remembered with the ``ETag`` header of the response and
+        the ``revision_number`` of the resource. A remembered body is sent
+        back to the server as ``If-None-Match``, which answers 304 Not
+        Modified when it is current. Without an ETag, only the revision
+        number of the resource is requested to decide whether the body is
+        current. Bodies without either, e.g. listings, are not remembered.
+        """
+        params = params or {}
+        key = (action, urlparse.urlencode(
+            sorted(utils.safe_encode_dict(params).items()), doseq=1))
+        entry = self.response_cache.get(key)
+        headers = None
+        try:
+            if entry is not None:
+                replybody, etag, revision_number = entry
+                if etag:
+                    headers = {'If-None-Match': etag}
+                else:
+                    probe = self.retry_request(
+                        "GET", action,
+                        params=dict(params, fields='revision_number'))
+                    if _revision_number(probe) == revision_number:
+                        return self._convert_into_with_meta(
+                            self.deserialize(replybody, requests.codes.ok),
+                            probe.request_ids)
+            resp = self.retry_request("GET", action, headers=headers,
+                                      params=params, stream=True)
+        except Exception:
+            self.response_cache.invalidate(key)
+            raise
+        if resp.status_code == requests.codes.not_modified:
+            resp.close()
+            replybody = entry[0]
+        else:
+            replybody = utils.response_text(resp)
+        data = self.deserialize(replybody, resp.status_code)
+        etag = resp.headers.get('ETag')
+        revision_number = _revision_number(data)
+        if etag or revision_number is not None:
+            self.response_cache.set(key, (replybody, etag, revision_number),
+                                    size=len(replybody))
+        else:
+            self.response_cache.invalidate(key)
+        return self._convert_into_with_meta(data, resp)
+
     def post(self, action, body=None, headers=None, params=None):
         # Do not retry POST requests to avoid the orphan objects problem.
-        return self.do_request("POST", action, body=body,
-                               headers=headers, params=params)
+        return self._mutate(self.do_request, "POST", action, body=body,
+                            headers=headers, params=params)
 
     def put(self, action, body=None, headers=None, params=None):
-        return self.retry_request("PUT", action, body=body,
-                                  headers=headers, params=params)
-
-    def list(self, collection, path, retrieve_all=True, **params):
+        return self._mutate(self.retry_request, "PUT", action, body=body,
+                            headers=headers, params=params)
+
+    def create_bulk(self, collection, path, items,
+                    chunk_size=BULK_CHUNK_SIZE):
+        """Create many resources with as few requests as possible.
+
+        ``items`` are the attribute dicts of the resources to create. They
+        are sent ``chunk_size`` at a time as ``{collection: [...]}`` bulk
+        requests. The server creates all the resources of a request or
+        none of them, but resources created by earlier requests are kept
+        if a later request fails.
+
+        :returns: ``{collection: [...]}`` with the created resources in
+                  the order of ``items``. Each of them carries the request
+                  ID of the request that created it in ``request_ids``.
+        """
+        if chunk_size < 1:
+            raise ValueError(_("chunk_size must be a positive integer"))
+        items = list(items)
+        created = []
+        request_ids = []
+        for start in range(0, len(items), chunk_size):
+            res = self.post(path, body={collection:
+                                        items[start:start + chunk_size]})
+            request_ids.extend(res.request_ids)
+            created.extend(_DictWithMeta(item, res.request_ids)
+                           for item in res[collection])
+        return _DictWithMeta({collection: created}, request_ids)
+
+    def list(self, collection, path, retrieve_all=True, prefetch=None,
+             stream=False, **params):
+        if stream:
+            # Streaming always walks every page and yields single
+            # resources rather than page dicts.
+            return _StreamWithMeta(self._stream_pagination, collection,
+                                   path, **params)
+        if prefetch is None:
+            prefetch = self.page_prefetch
+        if prefetch:
+            paginate_func = functools.partial(self._prefetch_pagination,
+                                              prefetch)
+        else:
+            paginate_func = self._pagination
         if retrieve_all:
             res = []
             request_ids = []
-            for r in self._pagination(collection, path, **params):
+            for r in paginate_func(collection, path, **params):
                 res.extend(r[collection])
                 request_ids.extend(r.request_ids)
             return _DictWithMeta({collection: res}, request_ids)
         else:
-            return _GeneratorWithMeta(self._pagination, collection,
+            return _GeneratorWithMeta(paginate_func, collection,
                                       path, **params)
 
+    def _next_page_params(self, res, collection, page_reverse):
+        """Return the query parameters of the following page, or None.
+
+        :param res: the (partial) body of the current page, used to look up
+                    the ``<collection>_links`` member.
+        :param page_reverse: whether the listing was requested in reverse
+                             order, i.e. the ``previous`` link is followed.
+        """
+        linkrel = 'previous' if page_reverse else 'next'
+        for link in res.get('%s_links' % collection, []):
+            if link['rel'] == linkrel:
+                query_str = urlparse.urlparse(link['href']).query
+                return urlparse.parse_qs(query_str)
+        return None
+
     def _pagination(self, collection, path, **params):
-        if params.get('page_reverse', False):
-            linkrel = 'previous'
-        else:
-            linkrel = 'next'
-        next = True
-        while next:
+        page_reverse = params.get('page_reverse', False)
+        while params is not None:
             res = self.get(path, params=params)
             yield res
-            next = False
+            params = self._next_page_params(res, collection, page_reverse)
+
+    def _stream_pagination(self, collection, path, **params):
+        """Paginate without loading whole pages into memory.
+
+        Yields ``(response, items)`` per page, where ``items`` lazily
+        decodes the resources of the page from the response body.
+        """
+        page_reverse = params.get('page_reverse', False)
+        while params is not None:
+            resp = self.retry_request('GET', path, params=params, stream=True)
+            deserializer = serializer.JSONCollectionStreamDeserializer(
+                collection)
             try:
-                for link in res['%s_links' % collection]:
-                    if link['rel'] == linkrel:
-                        query_str = urlparse.urlparse(link['href']).query
-                        params = urlparse.parse_qs(query_str)
-                        next = True
-                        break
-            except KeyError:
-                break
+                items = deserializer.iter_items(
+                    resp.iter_content(chunk_size=STREAM_CHUNK_SIZE))
+                yield resp, items
+                # Links may follow the collection, drain what is left.
+                for _item in items:
+                    pass
+            finally:
+                resp.close()
+            params = self._next_page_params(deserializer.extra, collection,
+                                            page_reverse)
+
+    def _prefetch_pagination(self, prefetch, collection, path, **params):
+        """Paginate while fetching up to ``prefetch`` pages ahead.
+
+        Pages are requested by a background thread as soon as the link to
+        the next page has been parsed, and are handed back in order. The
+        caller therefore only waits for the network when it consumes pages
+        faster than the server returns them.
+        """
+        pages = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+        end = object()
+
+        def _put(item):
+            # Never block on a full queue once the caller stopped.
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=PREFETCH_PUT_TIMEOUT)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def _fetch():
+            try:
+                for page in self._pagination(collection, path, **params):
+                    if not _put((page, None)) or stop.is_set():
+                        return
+            except Exception:
+                _put((None, sys.exc_info()))
+            else:
+                _put((end, None))
+
+        fetcher = threading.Thread(target=_fetch)
+        fetcher.daemon = True
+        fetcher.start()
+        try:
+            while True:
+                page, exc_info = pages.get()
+                if exc_info:
+                    six.reraise(*exc_info)
+                if page is end:
+                    return
+                yield page
+        finally:
+            # Unblock the fetcher if the caller stopped iterating early.
+            stop.set()
+            while not pages.empty():
+                pages.get_nowait()
 
     def _convert_into_with_meta(self, item, resp):
         if item:
@@ -409,6 +821,313 @@ class ClientBase(object):
                 return k
         return resource + 's'
 
+    def _get_lister(self, resource, cmd_resource=None, parent_id=None):
+        cmd_resource_plural = self.get_resource_plural(cmd_resource or
+                                                       resource)
+        obj_lister = getattr(self, "list_%s" % cmd_resource_plural)
+        if parent_id:
+            return functools.partial(obj_lister, parent_id)
+        return obj_lister
+
+    def _chunk_filter_values(self, key, values):
+        """Split filter values so each request stays below MAX_URI_LEN."""
+        budget = client.MAX_URI_LEN - FILTER_URI_RESERVED
+        chunk = []
+        size = 0
+        for value in values:
+            length = len(key) + 2 + len(urlparse.quote_plus(
+                encodeutils.safe_encode(value)))
+            if chunk and size + length > budget:
+                yield chunk
+                chunk = []
+                size = 0
+            chunk.append(value)
+            size += length
+        if chunk:
+            yield chunk
+
+    def _list_filter_chunk(self, obj_lister, collection, key, chunk, params):
+        params = dict(params)
+        params[key] = chunk
+        try:
+            return obj_lister(**params)[collection]
+        except exceptions.RequestURITooLong:
+            # The other parameters or the endpoint took more room than
+            # reserved for them, try again with smaller chunks.
+            if len(chunk) == 1:
+                raise
+            half = len(chunk) // 2
+            return (self._list_filter_chunk(obj_lister, collection, key,
+                                            chunk[:half], params) +
+                    self._list_filter_chunk(obj_lister, collection, key,
+                                            chunk[half:], params))
+
+    def _list_filtered(self, obj_lister, collection, key, values, **params):
+        """Yield the resources whose ``key`` is one of ``values``."""
+        for chunk in self._chunk_filter_values(key, values):
+            for item in self._list_filter_chunk(obj_lister, collection, key,
+                                                chunk, params):
+                yield item
+
+    def _prepare_list_by_ids(self, ids, fields, params):
+        ids = list(collections.OrderedDict.fromkeys(i for i in ids if i))
+        if fields:
+            if isinstance(fields, string_types):
+                fields = [fields]
+            params['fields'] = list(fields) + (
+                [] if 'id' in fields else ['id'])
+        return list(self._chunk_filter_values('id', ids))
+
+    def list_by_ids(self, collection, ids, fields=None, concurrency=None,
+                    **params):
+        """Fetch the resources of a collection with the given IDs.
+
+        The IDs are de-duplicated and split up front into as few requests
+        as MAX_URI_LEN allows, which are sent in parallel.
+
+        :param collection: plural name of the resources, e.g. ``subnets``.
+        :param ids: IDs of the resources to fetch. Empty values are ignored.
+        :param fields: fields to retrieve, ``id`` is always added.
+        :param concurrency: number of requests sent at the same time,
+                            defaults to LIST_BY_IDS_CONCURRENCY.
+        :returns: a dict from ID to resource. IDs which do not exist are
+                  not in it.
+        """
+        obj_lister = getattr(self, 'list_%s' % collection)
+        chunks = self._prepare_list_by_ids(ids, fields, params)
+        if concurrency is None:
+            concurrency = LIST_BY_IDS_CONCURRENCY
+        if len(chunks) < 2 or concurrency < 2:
+            results = [self._list_filter_chunk(obj_lister, collection, 'id',
+                                               chunk, params)
+                       for chunk in chunks]
+        else:
+            with futures.ThreadPoolExecutor(
+                    max_workers=min(concurrency, len(chunks))) as executor:
+                results = list(executor.map(
+                    lambda chunk: self._list_filter_chunk(
+                        obj_lister, collection, 'id', chunk, params),
+                    chunks))
+        return dict((item['id'], item)
+                    for item in itertools.chain.from_iterable(results))
+
+    def watch(self, collection, interval=None, fields=None, **params):
+        """Poll a collection and yield the changes of its resources.
+
+        Every ``interval`` seconds, only the WATCH_FIELDS of the resources
+        matching ``params`` are listed and compared to the previous
+        listing. The resources which appeared or whose revision number or
+        update time changed are then fetched with ``list_by_ids``. The
+        first listing reports every existing resource as added.
+
+        :param collection: plural name of the resources, e.g. ``ports``.
+        :param interval: seconds between two listings, defaults to
+                         WATCH_INTERVAL.
+        :param fields: fields of the resources to fetch, all by default.
+        :returns: an endless generator of ``(event, resource)`` tuples,
+                  where event is ``added``, ``modified`` or ``deleted``.
+                  The last known body is given for deleted resources.
+        """
+        obj_lister = getattr(self, 'list_%s' % collection)
+        if interval is None:
+            interval = WATCH_INTERVAL
+        # ID to the version and body of every known resource.
+        snapshot = {}
+        while True:
+            listing = obj_lister(fields=list(WATCH_FIELDS), **params)
+            versions, changed = self._watch_diff(snapshot, listing[collection])
+            for _id in [_id for _id in snapshot if _id not in versions]:
+                yield 'deleted', snapshot.pop(_id)[1]
+            fetched = {}
+            if changed:
+                fetched = self.list_by_ids(collection, changed, fields=fields,
+                                           **params)
+            for event in self._watch_update(snapshot, versions, changed,
+                                            fetched):
+                yield event
+            time.sleep(interval)
+
+    @staticmethod
+    def _watch_diff(snapshot, items):
+        """Return the versions of the listed resources and the changed IDs."""
+        versions = collections.OrderedDict(
+            (item['id'], (item.get('revision_number'),
+                          item.get('updated_at')))
+            for item in items)
+        changed = [_id for _id, version in versions.items()
+                   if _id not in snapshot or snapshot[_id][0] != version]
+        return versions, changed
+
+    @staticmethod
+    def _watch_update(snapshot, versions, changed, fetched):
+        """Update the snapshot with the fetched resources, return events."""
+        events = []
+        for _id in changed:
+            if _id not in fetched:
+                # Deleted since it was listed.
+                if _id in snapshot:
+                    events.append(('deleted', snapshot.pop(_id)[1]))
+                continue
+            event = 'modified' if _id in snapshot else 'added'
+            snapshot[_id] = (versions[_id], fetched[_id])
+            events.append((event, fetched[_id]))
+        return events
+
+    def _count_by_tenant(self, resource):
+        obj_lister = getattr(self, 'list_%ss' % resource)
+        counts = collections.Counter()
+        for page in obj_lister(retrieve_all=False, fields=['tenant_id']):
+            self._count_owners(counts, page['%ss' % resource])
+        return counts
+
+    @staticmethod
+    def _count_owners(counts, items):
+        # Resources of no project, e.g. the gateway ports of the routers,
+        # have an empty tenant_id and count against no quota.
+        counts.update(owner for owner in (
+            item.get('tenant_id') or item.get('project_id')
+            for item in items) if owner)
+
+    def quota_usage_report(self, resources=None, concurrency=None):
+        """Compare the resources used by every project to its quotas.
+
+        The quotas are listed once and the resources of each type are
+        counted from a single listing of their ``tenant_id``, all these
+        listings being sent in parallel. The default quotas are only
+        fetched if a project using resources has no quotas of its own.
+        Resources which belong to no project are not counted.
+
+        :param resources: quota names of the resources to count, defaults
+                          to QUOTA_USAGE_RESOURCES.
+        :param concurrency: number of listings sent at the same time, all
+                            of them by default.
+        :returns: a list of dicts with the ``tenant_id``, ``resource``,
+                  ``used``, ``limit`` and ``utilization`` (used / limit,
+                  None when the limit is not positive), ordered by project
+                  and resource.
+        """
+        resources = self._quota_usage_resources(resources)
+        tasks = [self.list_quotas] + [
+            functools.partial(self._count_by_tenant, resource)
+            for resource in resources]
+        if concurrency is None:
+            concurrency = len(tasks)
+        if concurrency < 2:
+            results = [task() for task in tasks]
+        else:
+            with futures.ThreadPoolExecutor(
+                    max_workers=min(concurrency, len(tasks))) as executor:
+                results = list(executor.map(lambda task: task(), tasks))
+        quotas, counts, without_quotas = self._quota_usage_inputs(
+            resources, results)
+        default = None
+        if without_quotas:
+            default = self.show_quota_default(without_quotas[0])['quota']
+        return self._quota_usage_rows(resources, quotas, counts, default)
+
+    def _quota_usage_resources(self, resources):
+        if resources is None:
+            resources = QUOTA_USAGE_RESOURCES
+        resources = list(resources)
+        for resource in resources:
+            if not hasattr(self, 'list_%ss' % resource):
+                raise ValueError(_("Unable to count the %s resources") %
+                                 resource)
+        return resources
+
+    @staticmethod
+    def _quota_usage_inputs(resources, results):
+        """Index the quotas listed and the resources counted by project.
+
+        :param results: the listing of the quotas followed by the counts
+                        of the resources.
+        :returns: the quotas and counts by project, and the sorted IDs of
+                  the projects using resources without quotas of their own.
+        """
+        quotas = dict((quota.get('tenant_id') or quota.get('project_id'),
+                       quota) for quota in results[0]['quotas'])
+        counts = dict(zip(resources, results[1:]))
+        without_quotas = set()
+        for count in counts.values():
+            without_quotas.update(t for t in count if t not in quotas)
+        return quotas, counts, sorted(without_quotas)
+
+    @staticmethod
+    def _quota_usage_rows(resources, quotas, counts, default):
+        tenant_ids = set(quotas)
+        for count in counts.values():
+            tenant_ids.update(count)
+        report = []
+        for tenant_id in sorted(tenant_ids):
+            limits = quotas.get(tenant_id, default)
+            for resource in resources:
+                used = counts[resource][tenant_id]
+                limit = limits.get(resource)
+                utilization = None
+                if limit is not None and limit > 0:
+                    utilization = float(used) / limit
+                report.append({'tenant_id': tenant_id,
+                               'resource': resource,
+                               'used': used,
+                               'limit': limit,
+                               'utilization': utilization})
+        return report
+
+    def find_resources(self, resource, names_or_ids, project_id=None,
+                       cmd_resource=None, parent_id=None, fields=None):
+        """Resolve several names or IDs at once.
+
+        Unlike calling find_resource for each input, this sends one listing
+        filtered on all the IDs and one filtered on the remaining names,
+        each split as needed to keep the URI short enough.
+
+        :returns: an ordered mapping of the inputs to their resources, see
+                  ``_FoundResources``.
+        """
+        found = _FoundResources(resource, list(names_or_ids))
+        requested = list(collections.OrderedDict.fromkeys(found.requested))
+        if not requested:
+            return found
+        obj_lister = self._get_lister(resource, cmd_resource, parent_id)
+        collection = self.get_resource_plural(resource)
+        params = self._find_resources_params(fields)
+
+        by_id = {}
+        ids = [v for v in requested if re.match(UUID_PATTERN, v)]
+        for info in self._list_filtered(obj_lister, collection, 'id', ids,
+                                        **params):
+            by_id[info['id']] = info
+
+        by_name = collections.defaultdict(list)
+        names = [v for v in requested if v not in by_id]
+        if project_id:
+            params['tenant_id'] = project_id
+        for info in self._list_filtered(obj_lister, collection, 'name',
+                                        names, **params):
+            by_name[info['name']].append(info)
+        return self._fill_found_resources(found, requested, by_id, by_name)
+
+    def _find_resources_params(self, fields):
+        params = {}
+        if fields:
+            if isinstance(fields, string_types):
+                fields = [fields]
+            params['fields'] = list(fields) + [
+                f for f in ('id', 'name') if f not in fields]
+        return params
+
+    def _fill_found_resources(self, found, requested, by_id, by_name):
+        for name_or_id in requested:
+            if name_or_id in by_id:
+                found[name_or_id] = by_id[name_or_id]
+            elif len(by_name[name_or_id]) == 1:
+                found[name_or_id] = by_name[name_or_id][0]
+            elif by_name[name_or_id]:
+                found.ambiguous.append(name_or_id)
+            else:
+                found.missing.append(name_or_id)
+        return found
+
     def find_resource_by_id(self, resource, resource_id, cmd_resource=None,
                             parent_id=None, fields=None):
         if not cmd_resource:
@@ -469,6 +1188,23 @@ class ClientBase(object):
 
     def find_resource(self, resource, name_or_id, project_id=None,
                       cmd_resource=None, parent_id=None, fields=None):
+        if self.resolution_cache is None:
+            return self._find_resource(resource, name_or_id, project_id,
+                                       cmd_resource, parent_id, fields)
+        if isinstance(fields, (list, tuple)):
+            fields = tuple(fields)
+        key = (resource, name_or_id, project_id, parent_id, cmd_resource,
+               fields)
+        info = self.resolution_cache.get(key)
+        if info is None:
+            info = self._find_resource(resource, name_or_id, project_id,
+                                       cmd_resource, parent_id, fields)
+            self.resolution_cache.set(key, info)
+        # Callers may modify what they get, keep the cached entry intact.
+        return copy.deepcopy(info)
+
+    def _find_resource(self, resource, name_or_id, project_id=None,
+                       cmd_resource=None, parent_id=None, fields=None):
         try:
             return self.find_resource_by_id(resource, name_or_id,
                                             cmd_resource, parent_id, fields)
@@ -785,6 +1521,11 @@ class Client(ClientBase):
         return self.list('ports', self.ports_path, retrieve_all,
                          **_params)
 
+    def watch_ports(self, interval=None, fields=None, **_params):
+        """Yields the changes of the ports, see ``watch``."""
+        return self.watch('ports', interval=interval, fields=fields,
+                          **_params)
+
     def show_port(self, port, **_params):
         """Fetches information of a certain port."""
         return self.get(self.port_path % (port), params=_params)
@@ -793,6 +1534,11 @@ class Client(ClientBase):
         """Creates a new port."""
         return self.post(self.ports_path, body=body)
 
+    def create_ports_bulk(self, ports, chunk_size=BULK_CHUNK_SIZE):
+        """Creates many ports with bulk requests, see ``create_bulk``."""
+        return self.create_bulk('ports', self.ports_path, ports,
+                                chunk_size=chunk_size)
+
     def update_port(self, port, body=None, revision_number=None):
         """Updates a port."""
         return self._update_resource(self.port_path % (port), body=body,
@@ -808,6 +1554,11 @@ class Client(ClientBase):
         return self.list('networks', self.networks_path, retrieve_all,
                          **_params)
 
+    def watch_networks(self, interval=None, fields=None, **_params):
+        """Yields the changes of the networks, see ``watch``."""
+        return self.watch('networks', interval=interval, fields=fields,
+                          **_params)
+
     def show_network(self, network, **_params):
         """Fetches information of a certain network."""
         return self.get(self.network_path % (network), params=_params)
@@ -816,6 +1567,11 @@ class Client(ClientBase):
         """Creates a new network."""
         return self.post(self.networks_path, body=body)
 
+    def create_networks_bulk(self, networks, chunk_size=BULK_CHUNK_SIZE):
+        """Creates many networks with bulk requests, see ``create_bulk``."""
+        return self.create_bulk('networks', self.networks_path, networks,
+                                chunk_size=chunk_size)
+
     def update_network(self, network, body=None, revision_number=None):
         """Updates a network."""
         return self._update_resource(self.network_path % (network), body=body,
@@ -830,6 +1586,11 @@ class Client(ClientBase):
         return self.list('subnets', self.subnets_path, retrieve_all,
                          **_params)
 
+    def watch_subnets(self, interval=None, fields=None, **_params):
+        """Yields the changes of the subnets, see ``watch``."""
+        return self.watch('subnets', interval=interval, fields=fields,
+                          **_params)
+
     def show_subnet(self, subnet, **_params):
         """Fetches information of a certain subnet."""
         return self.get(self.subnet_path % (subnet), params=_params)
@@ -838,6 +1599,11 @@ class Client(ClientBase):
         """Creates a new subnet."""
         return self.post(self.subnets_path, body=body)
 
+    def create_subnets_bulk(self, subnets, chunk_size=BULK_CHUNK_SIZE):
+        """Creates many subnets with bulk requests, see ``create_bulk``."""
+        return self.create_bulk('subnets', self.subnets_path, subnets,
+                                chunk_size=chunk_size)
+
     def update_subnet(self, subnet, body=None, revision_number=None):
         """Updates a subnet."""
         return self._update_resource(self.subnet_path % (subnet), body=body,
@@ -876,6 +1642,11 @@ class Client(ClientBase):
         return self.list('routers', self.routers_path, retrieve_all,
                          **_params)
 
+    def watch_routers(self, interval=None, fields=None, **_params):
+        """Yields the changes of the routers, see ``watch``."""
+        return self.watch('routers', interval=interval, fields=fields,
+                          **_params)
+
     def show_router(self, router, **_params):
         """Fetches information of a certain router."""
         return self.get(self.router_path % (router), params=_params)
@@ -941,6 +1712,11 @@ class Client(ClientBase):
         return self.list('floatingips', self.floatingips_path, retrieve_all,
                          **_params)
 
+    def watch_floatingips(self, interval=None, fields=None, **_params):
+        """Yields the changes of the floating IPs, see ``watch``."""
+        return self.watch('floatingips', interval=interval, fields=fields,
+                          **_params)
+
     def show_floatingip(self, floatingip, **_params):
         """Fetches information of a certain floatingip."""
         return self.get(self.floatingip_path % (floatingip), params=_params)
@@ -975,6 +1751,11 @@ class Client(ClientBase):
         return self.list('security_groups', self.security_groups_path,
                          retrieve_all, **_params)
 
+    def watch_security_groups(self, interval=None, fields=None, **_params):
+        """Yields the changes of the security groups, see ``watch``."""
+        return self.watch('security_groups', interval=interval, fields=fields,
+                          **_params)
+
     def show_security_group(self, security_group, **_params):
         """Fetches information of a certain security group."""
         return self.get(self.security_group_path % (security_group),
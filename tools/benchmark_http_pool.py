@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Compare per-request connections with the pooled HTTPClient session.
+
+A stub Neutron endpoint is started on localhost and the same number of GET
+requests is sent through a throwaway ``requests.request`` call per request
+(the old behaviour) and through ``neutronclient.client.HTTPClient`` which
+keeps its connections alive.
+
+Usage: python tools/benchmark_http_pool.py [--requests N]
+"""
+
+from __future__ import print_function
+
+import argparse
+import threading
+import time
+
+import requests
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+
+from neutronclient import client
+
+BODY = b'{"ports": []}'
+
+
+class _StubHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately; without TCP_NODELAY a kept
+    # alive connection would stall on delayed ACKs.
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+class _StubServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+def _run(label, send, count):
+    start = time.time()
+    for _i in range(count):
+        send()
+    elapsed = time.time() - start
+    print('%-24s %8.1f req/s  (%d requests in %.2fs)'
+          % (label, count / elapsed, count, elapsed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--requests', type=int, default=2000,
+                        help='Number of requests per run.')
+    args = parser.parse_args()
+
+    server = _StubServer(('127.0.0.1', 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    url = 'http://127.0.0.1:%d' % server.server_address[1]
+
+    try:
+        _run('requests.request', lambda: requests.request('GET', url + '/'),
+             args.requests)
+        http = client.HTTPClient(token='token', endpoint_url=url)
+        _run('HTTPClient (pooled)', lambda: http.request(url + '/', 'GET'),
+             args.requests)
+        http.close()
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
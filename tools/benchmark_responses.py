@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Measure the decoding of large list responses, before and after parsing.
+
+A ``{"ports": [...]}`` body of the given number of ports is wrapped in a
+``requests.Response`` whose Content-Type has no charset, as sent by the
+Networking service. Each method below turns it into the dict returned by
+the client:
+
+* text: ``resp.text``, where requests guesses the encoding of the body,
+* response_text: ``neutronclient.common.utils.response_text``,
+
+followed in both cases by the deserialization done by ``ClientBase``. The
+median time over all the runs and the peak of the memory allocated by the
+conversion (Python 3 only) are printed.
+
+With ``--non-ascii`` the port names contain UTF-8 encoded characters
+rather than escape sequences, which makes guessing the encoding slower.
+
+Usage: python tools/benchmark_responses.py [--runs N] [--non-ascii]
+       [PORTS ...]
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import time
+
+import requests
+
+from neutronclient.common import utils
+from neutronclient.v2_0 import client
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+
+METHODS = (
+    ('text', lambda resp: resp.text),
+    ('response_text', utils.response_text),
+)
+
+
+def _body(ports, non_ascii):
+    return json.dumps({'ports': [
+        {'id': '%032x' % i,
+         'name': u'p\xf6rt-%d' % i,
+         'network_id': '%032x' % (i // 100),
+         'device_owner': 'compute:nova',
+         'mac_address': 'fa:16:3e:%02x:%02x:%02x' % (
+             i >> 16 & 0xff, i >> 8 & 0xff, i & 0xff),
+         'fixed_ips': [{'subnet_id': '%032x' % (i // 100),
+                        'ip_address': '10.%d.%d.%d' % (
+                            i >> 16 & 0xff, i >> 8 & 0xff, i & 0xff)}],
+         'revision_number': 1}
+        for i in range(ports)]}, ensure_ascii=not non_ascii).encode('utf-8')
+
+
+def _response(body):
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.headers['Content-Type'] = 'application/json'
+    resp._content = body
+    return resp
+
+
+def _convert(neutron, get_text, body):
+    resp = _response(body)
+    return neutron._convert_into_with_meta(
+        neutron.deserialize(get_text(resp), 200), resp)
+
+
+def _median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def _peak(neutron, get_text, body):
+    if tracemalloc is None:
+        return None
+    tracemalloc.start()
+    try:
+        _convert(neutron, get_text, body)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--runs', type=int, default=5,
+                        help='Number of conversions timed per method.')
+    parser.add_argument('ports', type=int, nargs='*',
+                        default=[1000, 10000, 50000],
+                        help='Number of ports in the listings.')
+    parser.add_argument('--non-ascii', action='store_true',
+                        help='Do not escape the non ASCII characters.')
+    args = parser.parse_args()
+
+    neutron = client.Client(token='token', endpoint_url='http://localhost')
+    print('%-8s %-14s %10s %12s' % ('ports', 'method', 'time', 'peak'))
+    for ports in args.ports:
+        body = _body(ports, args.non_ascii)
+        for name, get_text in METHODS:
+            times = []
+            for _i in range(args.runs):
+                start = time.time()
+                _convert(neutron, get_text, body)
+                times.append(time.time() - start)
+            peak = _peak(neutron, get_text, body)
+            print('%-8d %-14s %7.1f ms %9s MB' % (
+                ports, name, _median(times) * 1000,
+                '-' if peak is None else '%.1f' % (peak / 1048576.0)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Measure the startup time of the neutron CLI, phase by phase.
+
+Every run starts a fresh interpreter, as the neutron command does, and
+times the following phases up to the point where the command would send
+its first request:
+
+* import: importing ``neutronclient.shell``,
+* shell: creating the ``NeutronShell`` and its command manager,
+* lookup: finding the command, which imports its module,
+* parser: building the argument parser of the command.
+
+The number of command modules imported is reported as well. The median
+of each phase over all the runs is printed.
+
+Usage: python tools/benchmark_startup.py [--runs N] [COMMAND]
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+
+PHASES = ('import', 'shell', 'lookup', 'parser')
+
+
+def _child(command):
+    timings = {}
+    start = time.time()
+    from neutronclient import shell
+    timings['import'] = time.time() - start
+
+    start = time.time()
+    neutron_shell = shell.NeutronShell(shell.NEUTRON_API_VERSION)
+    timings['shell'] = time.time() - start
+
+    start = time.time()
+    cmd_factory, cmd_name, sub_argv = (
+        neutron_shell.command_manager.find_command([command]))
+    timings['lookup'] = time.time() - start
+
+    start = time.time()
+    cmd_factory(neutron_shell, None).get_parser(cmd_name)
+    timings['parser'] = time.time() - start
+
+    timings['modules'] = len([m for m in sys.modules
+                              if m.startswith('neutronclient.neutron.')])
+    print(json.dumps(timings))
+
+
+def _median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--runs', type=int, default=10,
+                        help='Number of interpreters started.')
+    parser.add_argument('--child', action='store_true',
+                        help=argparse.SUPPRESS)
+    parser.add_argument('command', nargs='?', default='net-list',
+                        help='Command to look up, net-list by default.')
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.command)
+        return
+
+    runs = []
+    for _i in range(args.runs):
+        output = subprocess.check_output(
+            [sys.executable, __file__, '--child', args.command])
+        runs.append(json.loads(output.decode('utf-8').splitlines()[-1]))
+
+    total = 0.0
+    for phase in PHASES:
+        median = _median([run[phase] for run in runs])
+        total += median
+        print('%-8s %8.1f ms' % (phase, median * 1000))
+    print('%-8s %8.1f ms' % ('total', total * 1000))
+    print('%d command modules imported' % runs[-1]['modules'])
+
+
+if __name__ == '__main__':
+    main()